@@ -0,0 +1,114 @@
+"""
+App Theme - shared named fonts and ttk styles for the Tkinter apps
+Author: Team Five
+
+Description:
+Passing a font tuple such as ("Arial", 14, "bold") to a widget makes
+tkinter turn the tuple into a Tcl list and Tk look the description up
+again on every create or configure call. This module creates each font
+once as a named tkinter.font.Font, plus the ttk label styles built on
+them, and hands the same objects to every widget in breakout1.py,
+breakout2.py and any other app that asks for them.
+
+The theme is built on first use and kept on the Tk root window (one per
+Tcl interpreter), so creating widgets or animating them only ever passes
+a font name, and the theme goes away with its root.
+
+Usage:
+    theme = get_theme(root)
+    ttk.Label(root, text="Title", style="Title.TLabel")
+    ttk.Entry(root, font=theme.fonts["entry"])
+"""
+
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+
+
+# Font name -> (family, size, *styles), as the apps used to pass them
+FONT_SPECS = {
+    "title": ("Arial", 18, "bold"),
+    "subtitle": ("Arial", 10, "italic"),
+    "field": ("Arial", 12, "bold"),
+    "entry": ("Arial", 12),
+    "entry_small": ("Arial", 11),
+    "result": ("Arial", 14, "bold"),
+    "alert": ("Arial", 16, "bold"),
+    "note": ("Arial", 9, "italic"),
+    "hint": ("Arial", 9),
+    "history": ("Courier", 10),
+}
+
+# ttk style name -> options; "font" refers to a FONT_SPECS name
+STYLE_SPECS = {
+    "Title.TLabel": {"font": "title", "foreground": "darkblue"},
+    "Warning.TLabel": {"font": "subtitle", "foreground": "red"},
+    "Field.TLabel": {"font": "field"},
+    "Note.TLabel": {"font": "note", "foreground": "darkred"},
+    "Hint.TLabel": {"font": "hint", "foreground": "gray"},
+    "Greeting.TLabel": {"font": "result", "foreground": "blue",
+                        "background": "lightgray"},
+}
+
+# Prefix of the Tk font names, to stay clear of Tk's own named fonts
+FONT_NAME_PREFIX = "app_"
+
+# Attribute of the Tk root that holds its Theme
+_THEME_ATTRIBUTE = "_app_theme"
+
+
+class Theme:
+    """The named fonts and ttk styles of one Tk interpreter."""
+
+    def __init__(self, root):
+        """
+        Creates every named font and configures every style.
+
+        Args:
+            root: The Tk root window
+        """
+        self.fonts = {
+            name: _named_font(root, name, spec) for name, spec in FONT_SPECS.items()
+        }
+        self.style = ttk.Style(root)
+        for style_name, options in STYLE_SPECS.items():
+            options = dict(options)
+            if "font" in options:
+                options["font"] = self.fonts[options["font"]]
+            self.style.configure(style_name, **options)
+
+
+def _named_font(root, name, spec):
+    """Creates (or reuses) the Tk named font for one FONT_SPECS entry."""
+    family, size, *styles = spec
+    options = {
+        "family": family,
+        "size": size,
+        "weight": "bold" if "bold" in styles else "normal",
+        "slant": "italic" if "italic" in styles else "roman",
+    }
+    try:
+        return tkfont.Font(root, name=FONT_NAME_PREFIX + name, **options)
+    except tk.TclError:
+        # Already defined in this interpreter (e.g. by another theme user)
+        return tkfont.Font(root, name=FONT_NAME_PREFIX + name, exists=True, **options)
+
+
+def get_theme(root):
+    """
+    Returns the theme of root's Tcl interpreter, building it on first use.
+
+    Args:
+        root: The Tk root window (or any widget of it)
+
+    Returns:
+        Theme: The shared fonts and styles
+    """
+    while root.master is not None:
+        root = root.master
+    # vars(): widget stand-ins answer every attribute lookup
+    theme = vars(root).get(_THEME_ATTRIBUTE)
+    if theme is None:
+        theme = Theme(root)
+        setattr(root, _THEME_ATTRIBUTE, theme)
+    return theme
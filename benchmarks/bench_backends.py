@@ -0,0 +1,77 @@
+"""
+Benchmark: throughput of the numeric backends
+Author: Team Five
+
+Description:
+Runs parse -> operation -> format for every record of a mixed workload
+(small integers, money-style decimals, big integers, dyadic fractions)
+through each backend in calculator_backends.py and reports records per
+second, so a default backend can be chosen per deployment.
+
+Usage:
+    python benchmarks/bench_backends.py [--records 200000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator_backends import BACKENDS, get_backend  # noqa: E402
+from calculator_core import OPERATIONS  # noqa: E402
+
+
+def make_workload(count, rng):
+    """Builds (operation_func, num1_str, num2_str) records per input kind."""
+    kinds = {
+        "integers": lambda: str(rng.randint(-10_000, 10_000)),
+        "money": lambda: f"{rng.randint(0, 99_999)}.{rng.randint(0, 99):02d}",
+        "big ints": lambda: str(rng.randint(10 ** 18, 10 ** 22)),
+        "dyadic": lambda: str(rng.randint(-512, 512) / 8),
+    }
+    operations = list(OPERATIONS.values())
+    return {
+        kind: [(rng.choice(operations), make(), make()) for _ in range(count)]
+        for kind, make in kinds.items()
+    }
+
+
+def run_backend(backend, records):
+    """Processes all records; returns the elapsed seconds."""
+    parse, format_result = backend.parse, backend.format
+    prepared = {}
+    start = time.perf_counter()
+    for operation_func, num1_str, num2_str in records:
+        calculate = prepared.get(operation_func)
+        if calculate is None:
+            calculate = prepared[operation_func] = backend.prepare(operation_func)
+        _, num1 = parse(num1_str)
+        _, num2 = parse(num2_str)
+        try:
+            format_result(calculate(num1, num2))
+        except ZeroDivisionError:
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    workload = make_workload(args.records, random.Random(2025))
+    names = list(BACKENDS)
+    print(f"{'records/s':<12}" + "".join(f"{name:>12}" for name in names))
+    for kind, records in workload.items():
+        row = f"{kind:<12}"
+        for name in names:
+            seconds = run_backend(get_backend(name), records)
+            row += f"{len(records) / seconds:>12,.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
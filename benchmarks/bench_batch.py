@@ -0,0 +1,87 @@
+"""
+Benchmark: Calculator.calculate_batch vs. the per-pair loop
+Author: Team Five
+
+Description:
+Times the vectorized batch API against calling the scalar Calculator
+methods once per operand pair, for column sizes from 10^3 up to 10^7.
+The batch API is timed twice: fed Python lists (includes conversion)
+and fed ready-made NumPy columns. The speedup column uses the latter.
+
+Usage:
+    python benchmarks/bench_batch.py [--max-exp 7] [--ops add divide]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+
+from breakout2 import Calculator  # noqa: E402
+
+
+def per_pair_loop(operation, operands1, operands2):
+    """The pre-batch way: one Calculator call per pair, zero divisors -> NaN."""
+    func = getattr(Calculator, operation)
+    results = []
+    append = results.append
+    for num1, num2 in zip(operands1, operands2):
+        try:
+            append(func(num1, num2))
+        except ZeroDivisionError:
+            append(float("nan"))
+    return results
+
+
+def best_of(repeat, func, *args):
+    """Returns the fastest wall-clock time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--min-exp", type=int, default=3)
+    parser.add_argument("--max-exp", type=int, default=7)
+    parser.add_argument("--ops", nargs="+", default=["add", "divide"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(2025)
+    print(
+        f"{'op':<9}{'n':>10}{'loop ms':>12}{'list ms':>12}"
+        f"{'ndarray ms':>12}{'speedup':>10}"
+    )
+    for exponent in range(args.min_exp, args.max_exp + 1):
+        n = 10 ** exponent
+        operands1 = rng.uniform(-1e6, 1e6, n)
+        operands2 = rng.integers(-5, 5, n).astype(np.float64)
+        # The loop is fed Python floats, as it would be in production
+        list1, list2 = operands1.tolist(), operands2.tolist()
+        loop_repeat = 1 if n >= 10 ** 6 else args.repeat
+
+        for operation in args.ops:
+            loop_s = best_of(loop_repeat, per_pair_loop, operation, list1, list2)
+            list_s = best_of(
+                args.repeat, Calculator.calculate_batch, operation, list1, list2
+            )
+            array_s = best_of(
+                args.repeat, Calculator.calculate_batch, operation,
+                operands1, operands2
+            )
+            print(
+                f"{operation:<9}{n:>10}{loop_s * 1e3:>12.2f}{list_s * 1e3:>12.2f}"
+                f"{array_s * 1e3:>12.2f}{loop_s / array_s:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark: Tcl calls and time per frame of the division by zero effect
+Author: Team Five
+
+Description:
+Replays every frame of the division by zero effect against a real Tcl
+interpreter and reports Tcl calls and microseconds per frame for three
+ways of applying a frame:
+
+    per call + exists - winfo_exists() on both widgets, then one
+                        configure()/geometry() call per change, as the old
+                        root.after() chains did
+    per call          - one configure()/geometry() call per widget
+    batched           - one Tcl call per frame (TclBatch)
+
+No display is needed: the interpreter is tkinter.Tcl() with stub commands
+standing in for the widgets, so the numbers cover tkinter's Python side and
+the Python-to-Tcl round trips, not Tk redrawing. The stubs first record
+what they receive, to check that every strategy sends the same changes.
+
+Usage:
+    python benchmarks/bench_effects.py [--repeat 200]
+"""
+
+import argparse
+import sys
+import time
+import tkinter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from breakout2 import SpecialEffects  # noqa: E402
+from calculator_tclbatch import TclBatch  # noqa: E402
+
+STUB_COMMANDS = """
+proc record {args} {if {$::recording} {lappend ::log $args}}
+set recording 0
+proc font {args} {return [lindex $args 1]}
+namespace eval ttk {proc style {args} {}}
+proc winfo {args} {return 1}
+proc wm {args} {record wm {*}$args}
+proc . {args} {record . {*}$args}
+proc .result {args} {record .result {*}$args}
+"""
+
+
+class CountingInterpreter:
+    """Wraps the Tcl interpreter and counts calls from Python."""
+
+    def __init__(self, interpreter):
+        self._interpreter = interpreter
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._interpreter.call(*args)
+
+    def eval(self, script):
+        self.calls += 1
+        return self._interpreter.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self._interpreter, name)
+
+
+class StubRoot(tkinter.Misc, tkinter.Wm):
+    """A root window whose Tcl command is a stub."""
+
+    def __init__(self, interpreter):
+        self.tk = interpreter
+        self._w = "."
+
+
+class StubLabel(tkinter.Misc):
+    """The result label, backed by a stub command."""
+
+    def __init__(self, interpreter):
+        self.tk = interpreter
+        self._w = ".result"
+
+
+def effect_frames(root, label):
+    """Returns the effect's frames: lists of (widget, merged options)."""
+    restore = {"background": "lightyellow", "foreground": "darkgreen",
+               "text": "Please enter valid numbers (divisor cannot be zero)"}
+    keyframes = SpecialEffects.division_by_zero_keyframes(
+        root, label, "#f0f0f0", "650x720+100+100", restore
+    )
+    frames = {}
+    for keyframe in keyframes:
+        widgets = frames.setdefault(keyframe.at, {})
+        widgets.setdefault(str(keyframe.widget), (keyframe.widget, {}))[1].update(
+            keyframe.options
+        )
+    return [list(widgets.values()) for _, widgets in sorted(frames.items())]
+
+
+def apply_per_call(frames, root, label, check_exists):
+    for frame in frames:
+        if check_exists and not (root.winfo_exists() and label.winfo_exists()):
+            return
+        for widget, options in frame:
+            options = dict(options)
+            if "geometry" in options:
+                widget.geometry(options.pop("geometry"))
+            if options:
+                widget.configure(**options)
+
+
+def apply_batched(frames, batch):
+    for frame in frames:
+        for widget, options in frame:
+            batch.apply(widget, options)
+        batch.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    interpreter = tkinter.Tcl().tk
+    interpreter.eval(STUB_COMMANDS)
+    counting = CountingInterpreter(interpreter)
+    root, label = StubRoot(counting), StubLabel(counting)
+    frames = effect_frames(root, label)
+    # One batch per window, as the Timeline keeps it; defines its Tcl proc once
+    batch = TclBatch(root)
+
+    strategies = {
+        "per call + exists": lambda: apply_per_call(frames, root, label, True),
+        "per call": lambda: apply_per_call(frames, root, label, False),
+        "batched": lambda: apply_batched(frames, batch),
+    }
+
+    # Every strategy must deliver the same widget changes
+    logs = {}
+    for name, run in strategies.items():
+        interpreter.eval("set recording 1; set log {}")
+        run()
+        logs[name] = interpreter.eval("set log")
+        interpreter.eval("set recording 0")
+    assert len(set(logs.values())) == 1, "strategies sent different changes"
+
+    print(f"{len(frames)} frames per effect\n")
+    print(f"{'strategy':<20}{'Tcl calls/frame':>16}{'us/frame':>10}")
+    for name, run in strategies.items():
+        counting.calls = 0
+        run()
+        calls = counting.calls
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<20}{calls / len(frames):>16.2f}"
+              f"{best / len(frames) * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: compiled expressions vs. parsing on every evaluation
+Author: Team Five
+
+Description:
+Evaluates "(a + b) * c / d" over many variable bindings three ways:
+re-parsing and compiling the text every time (cache bypassed), looking the
+compiled form up in the cache every time, and evaluating one compiled
+expression over all bindings with evaluate_many.
+
+Usage:
+    python benchmarks/bench_expression.py [--rows 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator_expression import compile_expression  # noqa: E402
+
+SOURCE = "(a + b) * c / d"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(2025)
+    rows = [(rng.random(), rng.random(), rng.random(), rng.uniform(1, 2))
+            for _ in range(args.rows)]
+    uncached = compile_expression.__wrapped__
+
+    timings = {}
+    start = time.perf_counter()
+    for row in rows:
+        uncached(SOURCE)(*row)
+    timings["parse every time"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row in rows:
+        compile_expression(SOURCE)(*row)
+    timings["cache lookup"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    list(compile_expression(SOURCE).evaluate_many(rows))
+    timings["evaluate_many"] = time.perf_counter() - start
+
+    baseline = timings["parse every time"]
+    for label, seconds in timings.items():
+        print(f"{label:<18}{seconds / args.rows * 1e6:>8.2f} us/row"
+              f"{baseline / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: bulk result formatting vs. per-value format_result
+Author: Team Five
+
+Description:
+Formats arrays of results with format_result one value at a time, with
+ResultFormatter.format_many (a list of strings) and with
+ResultFormatter.format_text (one newline-separated string, as written to
+a file), and checks that all three produce the same text.
+
+Usage:
+    python benchmarks/bench_formatting.py [--size 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator_core import format_result  # noqa: E402
+from calculator_formatting import RESULT_FORMATTER  # noqa: E402
+
+
+def make_results(size, rng):
+    """Builds result arrays of a few typical shapes."""
+    return {
+        "fractions": rng.uniform(-1e6, 1e6, size),
+        "whole": np.round(rng.uniform(-1e6, 1e6, size)),
+        "money": np.round(rng.uniform(0, 1e5, size), 2),
+        "wide range": rng.standard_normal(size) * 10.0 ** rng.integers(-8, 14, size),
+    }
+
+
+def per_value_loop(results):
+    """The current path: format_result per value."""
+    return [format_result(result) for result in results.tolist()]
+
+
+def best_of(repeat, func, *args):
+    """Returns the fastest wall-clock time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(2025)
+    print(f"{'results':<12}{'loop ns':>10}{'many ns':>10}{'text ns':>10}{'speedup':>10}")
+    for label, results in make_results(args.size, rng).items():
+        expected = per_value_loop(results)
+        assert RESULT_FORMATTER.format_many(results) == expected
+        assert RESULT_FORMATTER.format_text(results) == "\n".join(expected) + "\n"
+
+        loop_s = best_of(args.repeat, per_value_loop, results)
+        many_s = best_of(args.repeat, RESULT_FORMATTER.format_many, results)
+        text_s = best_of(args.repeat, RESULT_FORMATTER.format_text, results)
+        print(
+            f"{label:<12}{loop_s / args.size * 1e9:>10.0f}"
+            f"{many_s / args.size * 1e9:>10.0f}{text_s / args.size * 1e9:>10.0f}"
+            f"{loop_s / text_s:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
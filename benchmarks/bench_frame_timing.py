@@ -0,0 +1,106 @@
+"""
+Benchmark: how punctually the division by zero effect's frames run
+Author: Team Five
+
+Description:
+Plays the division by zero effect on a Timeline driven by a real Tcl event
+loop, with a FrameTimer installed, and prints the timer's report: lateness
+histogram, worst lateness and dropped frames of every after() callback.
+
+Load can be added to see how the 300 ms pulse, 50 ms shake and 200 ms fade
+steps hold up on a busy machine:
+
+    --busy-ms N   another after() callback hogs the event loop for N ms
+                  every --busy-every ms (slow UI work)
+    --threads N   N Python threads spin in the background (GIL contention,
+                  like busy worker threads)
+
+No display is needed: the interpreter is tkinter.Tcl() with the stub
+widget commands of bench_effects.py, so Tk redrawing is not included.
+
+Usage:
+    python benchmarks/bench_frame_timing.py [--busy-ms 40] [--threads 2]
+        [--json timing.json]
+"""
+
+import argparse
+import sys
+import threading
+import time
+import tkinter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_effects import STUB_COMMANDS, StubLabel, StubRoot  # noqa: E402
+from breakout2 import SpecialEffects  # noqa: E402
+from calculator_frametiming import FrameTimer  # noqa: E402
+from calculator_timeline import Effect, Timeline  # noqa: E402
+
+
+class EventLoopRoot(StubRoot):
+    """A stub root whose after() runs on the interpreter's event loop."""
+
+    master = None
+
+
+def spin(stop):
+    """Burns CPU until stop is set."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--busy-ms", type=float, default=0.0)
+    parser.add_argument("--busy-every", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH",
+                        help="Also write the report as JSON to PATH")
+    args = parser.parse_args()
+
+    interpreter = tkinter.Tcl().tk
+    interpreter.eval(STUB_COMMANDS)
+    root, label = EventLoopRoot(interpreter), StubLabel(interpreter)
+    timer = FrameTimer(root).install()
+    timeline = Timeline(root)
+
+    restore = {"background": "lightyellow", "foreground": "darkgreen",
+               "text": "Please enter valid numbers (divisor cannot be zero)"}
+    effect = Effect("division_by_zero", SpecialEffects.division_by_zero_keyframes(
+        root, label, "#f0f0f0", "650x720+100+100", restore
+    ))
+
+    def busy():
+        deadline = time.perf_counter() + args.busy_ms / 1000.0
+        while time.perf_counter() < deadline:
+            pass
+        if timeline.is_playing("division_by_zero"):
+            root.after(args.busy_every, busy)
+
+    stop = threading.Event()
+    threads = [threading.Thread(target=spin, args=(stop,), daemon=True)
+               for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+
+    timeline.play(effect)
+    if args.busy_ms:
+        root.after(args.busy_every, busy)
+    start = time.perf_counter()
+    while timeline.is_playing("division_by_zero") or root.tk.call("after", "info"):
+        interpreter.dooneevent()
+    elapsed = time.perf_counter() - start
+    stop.set()
+
+    print(f"Effect of {effect.duration} ms played in {elapsed * 1000:.0f} ms "
+          f"(busy {args.busy_ms} ms every {args.busy_every} ms, "
+          f"{args.threads} spinning thread(s))\n")
+    print(timer.format_report())
+    if args.json:
+        timer.write_report(args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: calculation history storage and the virtualized history panel
+Author: Team Five
+
+Description:
+Fills a CalculationHistory with a million entries and reports:
+
+    append       microseconds per append
+    memory       bytes per entry, against a list of (str, float, float,
+                 float) tuples holding the same data (tracemalloc)
+    scroll       microseconds per jump to a random position in the panel
+    append+show  microseconds per append while the panel follows the
+                 newest entry (one idle redraw per append)
+
+The panel runs against the headless Tk stand-in, so the scroll and redraw
+numbers cover the Python side (formatting the visible rows, deciding which
+labels change); with a real Tk each changed label is one configure() call.
+
+Usage:
+    python benchmarks/bench_history.py [--entries 1000000]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import headless_tk  # noqa: E402
+
+OPERATIONS = ("Addition", "Subtraction", "Multiplication", "Division", "(a + b) * 2")
+
+
+def random_entries(rng, count):
+    """Yields (op_name, num1, num2, result) tuples."""
+    for _ in range(count):
+        num1, num2 = rng.uniform(-1e6, 1e6), rng.uniform(1, 1e3)
+        yield rng.choice(OPERATIONS), num1, num2, num1 / num2
+
+
+def measure_memory(build):
+    """Returns the bytes allocated (and kept) by build()."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--scrolls", type=int, default=10_000)
+    args = parser.parse_args()
+
+    headless_tk.install()
+    from calculator_history import CalculationHistory, HistoryPanel
+
+    rng = random.Random(2025)
+    entries = list(random_entries(rng, args.entries))
+
+    history = CalculationHistory()
+    start = time.perf_counter()
+    for entry in entries:
+        history.append(*entry)
+    append_us = (time.perf_counter() - start) / args.entries * 1e6
+
+    def build_history():
+        built = CalculationHistory()
+        for entry in entries:
+            built.append(*entry)
+        return built
+
+    def build_tuples():
+        # Fresh floats, as a list built from calculations would hold
+        return [(op, num1 + 0.0, num2 + 0.0, result + 0.0)
+                for op, num1, num2, result in entries]
+
+    history_bytes = measure_memory(build_history) / args.entries
+    tuple_bytes = measure_memory(build_tuples) / args.entries
+
+    root = headless_tk.FakeTk()
+    panel = HistoryPanel(root, history)
+    positions = [rng.randrange(len(history)) for _ in range(args.scrolls)]
+    start = time.perf_counter()
+    for position in positions:
+        panel.scroll_to(position)
+    scroll_us = (time.perf_counter() - start) / args.scrolls * 1e6
+
+    panel.scroll_to(len(history))
+    start = time.perf_counter()
+    for entry in entries[:args.scrolls]:
+        history.append(*entry)
+        panel.notify_appended()
+        root.run_pending()
+    follow_us = (time.perf_counter() - start) / args.scrolls * 1e6
+
+    print(f"{len(history):,} entries, {panel.rows} visible rows\n")
+    print(f"append        {append_us:8.3f} us/entry")
+    print(f"memory        {history_bytes:8.1f} bytes/entry "
+          f"(list of tuples: {tuple_bytes:.1f})")
+    print(f"scroll        {scroll_us:8.3f} us/jump")
+    print(f"append+show   {follow_us:8.3f} us/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: sustained inserts and indexed queries of the SQLite history
+Author: Team Five
+
+Description:
+Fills a history database with --rows entries through SQLiteHistory (the
+Tk-side append, the queue and the writer thread's batched transactions),
+then reopens it and reports:
+
+    append       microseconds per SQLiteHistory.append() on the caller's
+                 thread (what a button click pays)
+    insert       sustained rows per second, from the first append until the
+                 writer has committed the last row
+    open         milliseconds to reopen the database
+    page         microseconds per history panel page (12 formatted rows)
+                 of earlier sessions at random positions
+    op + time    one operation in a 60 s window (about 1,200 rows)
+    time         every operation in a 60 s window (about 6,000 rows)
+    operand      either operand in a narrow range (about 100 rows)
+    summary      per-operation report of a one-hour window
+    filter       ids of the newest FILTER_LIMIT Division entries for the
+                 filtered panel
+
+Entries are timestamped 10 ms apart. The database is in the OS page cache
+for the queries.
+
+Usage:
+    python benchmarks/bench_historydb.py [--rows 10000000] [--dir /tmp]
+"""
+
+import argparse
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator_history import HISTORY_ROWS  # noqa: E402
+from calculator_historydb import SQLiteHistory  # noqa: E402
+
+OPERATIONS = ("Addition", "Subtraction", "Multiplication", "Division", "(a + b) * 2")
+
+# Appends between waits for the writer, which bounds the queue
+CHUNK = 100_000
+
+# Seconds between entries
+TICK = 0.01
+
+
+def median_ms(repeat, func, *args):
+    """Median milliseconds per call of func(*args)."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--dir", default=None,
+                        help="Directory for the database (default: a temp dir)")
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp(dir=args.dir))
+    path = directory / "history.db"
+    rng = random.Random(2025)
+    ticks = iter(range(args.rows))
+    clock = lambda: next(ticks) * TICK  # noqa: E731
+    try:
+        history = SQLiteHistory(path, clock=clock)
+        append_seconds = 0.0
+        start = time.perf_counter()
+        for first in range(0, args.rows, CHUNK):
+            chunk_start = time.perf_counter()
+            for index in range(first, min(first + CHUNK, args.rows)):
+                num1, num2 = rng.uniform(-1e6, 1e6), rng.uniform(1, 1e3)
+                history.append(OPERATIONS[index % 5], num1, num2, num1 / num2)
+            append_seconds += time.perf_counter() - chunk_start
+            history.wait()
+        insert_seconds = time.perf_counter() - start
+        history.close()
+
+        def reopen():
+            SQLiteHistory(path).close()
+
+        open_ms = median_ms(5, reopen)
+        history = SQLiteHistory(path)
+        positions = [rng.randrange(args.rows - HISTORY_ROWS) for _ in range(1000)]
+
+        def page_all():
+            for first in positions:
+                for index in range(first, first + HISTORY_ROWS):
+                    history.format_row(index)
+
+        page_us = median_ms(3, page_all) / len(positions) * 1000
+        end = args.rows * TICK
+        windows = [rng.uniform(0, end - 3600) for _ in range(20)]
+        operands = [rng.uniform(-1e6, 1e6 - 20) for _ in range(20)]
+        queries = {
+            "op + time": lambda: [history.query(op="Division", since=t, until=t + 60)
+                                  for t in windows],
+            "time": lambda: [history.query(since=t, until=t + 60) for t in windows],
+            "operand": lambda: [history.query(operand_min=low, operand_max=low + 20)
+                                for low in operands],
+            "summary": lambda: [history.summary(since=t, until=t + 3600)
+                                for t in windows],
+        }
+        results = {name: median_ms(3, query) / 20 for name, query in queries.items()}
+        sizes = {
+            "op + time": len(history.query(op="Division", since=windows[0],
+                                           until=windows[0] + 60)),
+            "time": len(history.query(since=windows[0], until=windows[0] + 60)),
+            "operand": len(history.query(operand_min=operands[0],
+                                         operand_max=operands[0] + 20)),
+            "summary": len(history.summary(since=windows[0], until=windows[0] + 3600)),
+        }
+        filter_ms = median_ms(3, history.filtered, "Division")
+        sizes["filter"] = len(history.filtered("Division"))
+        history.close()
+        size_mb = sum(file.stat().st_size for file in directory.iterdir()) / 1e6
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"{args.rows:,} rows, {size_mb:.0f} MB database\n")
+    print(f"append       {append_seconds / args.rows * 1e6:10.3f} us/entry")
+    print(f"insert       {args.rows / insert_seconds:10,.0f} rows/s sustained")
+    print(f"open         {open_ms:10.3f} ms")
+    print(f"page         {page_us:10.3f} us per {HISTORY_ROWS}-row page")
+    for name, ms in results.items():
+        print(f"{name:<13}{ms:10.3f} ms ({sizes[name]:,} rows)")
+    print(f"{'filter':<13}{filter_ms:10.3f} ms ({sizes['filter']:,} ids)")
+
+
+if __name__ == "__main__":
+    main()
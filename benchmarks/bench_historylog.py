@@ -0,0 +1,143 @@
+"""
+Benchmark: writing, reopening and paging a large persistent history log
+Author: Team Five
+
+Description:
+Writes a history log of --records entries through PersistentHistory (in
+flushes of HISTORY_FLUSH_MS worth of appends), then reports:
+
+    write        microseconds per appended entry, until the writer thread
+                 has written (and once fsync'd) them all
+    flush        median microseconds the Tk thread spends in flush() after
+                 FLUSH_EVERY appends (handing them to the writer thread)
+    sync         median milliseconds of sync() after such a flush: the
+                 writer thread writing the entries and fsyncing the files
+    open         milliseconds to reopen the log (map it, read the names and
+                 the sparse index), against parsing every record into
+                 arrays up front
+    page         microseconds per history panel page (12 formatted rows)
+                 at random positions
+    find_time    microseconds per timestamp lookup
+
+The reopen timing runs with the file in the OS page cache; on a cold disk
+the mapped open stays the same while the full parse has to read the whole
+file.
+
+Usage:
+    python benchmarks/bench_historylog.py [--records 10000000] [--dir /tmp]
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator_history import HISTORY_ROWS  # noqa: E402
+from calculator_historylog import HEADER, RECORD, PersistentHistory  # noqa: E402
+
+OPERATIONS = ("Addition", "Subtraction", "Multiplication", "Division", "(a + b) * 2")
+
+# Appends per flush, as at a (very) fast typist's rate
+FLUSH_EVERY = 500
+
+
+def parse_everything(path):
+    """The eager alternative: reads every record into arrays."""
+    columns = [array('d'), array('I'), array('d'), array('d'), array('d')]
+    data = Path(path).read_bytes()[HEADER.size:]
+    for record in RECORD.iter_unpack(data):
+        for column, value in zip(columns, record):
+            column.append(value)
+    return columns
+
+
+def best_of(repeat, func, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--records", type=int, default=2_000_000)
+    parser.add_argument("--dir", default=None,
+                        help="Directory for the log (default: a temp dir)")
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp(dir=args.dir))
+    path = directory / "history.log"
+    rng = random.Random(2025)
+    clock = iter(range(args.records + 20 * FLUSH_EVERY + 1)).__next__
+    try:
+        history = PersistentHistory(path, fsync_interval=None, clock=clock)
+        start = time.perf_counter()
+        for index in range(args.records):
+            num1, num2 = rng.uniform(-1e6, 1e6), rng.uniform(1, 1e3)
+            history.append(OPERATIONS[index % 5], num1, num2, num1 / num2)
+            if index % FLUSH_EVERY == 0:
+                history.flush()
+        history.sync()
+        write_us = (time.perf_counter() - start) / args.records * 1e6
+        # 20 flushes of FLUSH_EVERY entries, each waited for with sync()
+        flush_seconds, sync_seconds = [], []
+        for _ in range(20):
+            for _ in range(FLUSH_EVERY):
+                history.append("Addition", 1.0, 2.0, 3.0)
+            start = time.perf_counter()
+            history.flush()
+            flush_seconds.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            history.sync()
+            sync_seconds.append(time.perf_counter() - start)
+        flush_us = sorted(flush_seconds)[len(flush_seconds) // 2] * 1e6
+        sync_ms = sorted(sync_seconds)[len(sync_seconds) // 2] * 1000
+        history.close()
+
+        def reopen():
+            PersistentHistory(path).close()
+
+        open_ms = best_of(5, reopen) * 1000
+        parse_ms = best_of(1, parse_everything, path) * 1000
+
+        history = PersistentHistory(path)
+        positions = [rng.randrange(args.records - HISTORY_ROWS) for _ in range(10_000)]
+
+        def page_all():
+            for first in positions:
+                for index in range(first, first + HISTORY_ROWS):
+                    history.format_row(index)
+
+        page_us = best_of(3, page_all) / len(positions) * 1e6
+        times = [rng.uniform(0, args.records) for _ in range(10_000)]
+
+        def find_all():
+            for timestamp in times:
+                history.find_time(timestamp)
+
+        find_us = best_of(3, find_all) / len(times) * 1e6
+        history.close()
+        size_mb = path.stat().st_size / 1e6
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"{args.records + 20 * FLUSH_EVERY:,} records, {size_mb:.0f} MB log\n")
+    print(f"write        {write_us:10.3f} us/entry")
+    print(f"flush        {flush_us:10.3f} us per {FLUSH_EVERY} entries")
+    print(f"sync         {sync_ms:10.3f} ms")
+    print(f"open         {open_ms:10.3f} ms mapped "
+          f"(parse everything: {parse_ms:.0f} ms)")
+    print(f"page         {page_us:10.3f} us per {HISTORY_ROWS}-row page")
+    print(f"find_time    {find_us:10.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark: live mode's debounce delay against work and latency
+Author: Team Five
+
+Description:
+Replays the same typing session into a live-mode CalculatorApp once per
+debounce delay and reports, per delay:
+
+    recomputes    calculations started, per pair of numbers typed
+    paints        result label updates per pair; every paint beyond the
+                  last is the result of a half-typed number
+    settle ms     mean time from a pair's last keystroke until the label
+                  shows its result (0 if it already did)
+    Tk us/key     real time spent in the traces and after() callbacks,
+                  recomputes included, per keystroke
+    skipped       recomputes skipped because the parsed numbers had not
+                  changed
+
+The session is --pairs pairs of 1-7 digit numbers (some with decimals, some
+with a typo and a backspace), typed with 60-220 ms between keys, 250-500 ms
+to move to the second number and a 1.5 s pause before the next pair.
+
+Time is virtual: the headless Tk stand-in runs after() callbacks in time
+order without waiting, so the session takes milliseconds and every delay
+sees exactly the same keystrokes.
+
+Usage:
+    python benchmarks/bench_live.py [--pairs 500] [--delays 0,50,100,150,250,400]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import headless_tk  # noqa: E402
+
+
+def typing_session(pairs, seed=2025):
+    """
+    Returns the keystrokes of a session.
+
+    Returns:
+        list: One list per pair of numbers of (gap_ms, field, text) - the
+            text of field ("num1" or "num2") after the keystroke, gap_ms
+            after the previous one
+    """
+    rng = random.Random(seed)
+    session = []
+    for _ in range(pairs):
+        keys = []
+        for field, first_gap in (("num1", 1500), ("num2", rng.uniform(250, 500))):
+            number = str(rng.randint(1, 10 ** rng.randint(1, 7)))
+            if rng.random() < 0.3:
+                number += "." + str(rng.randint(1, 99))
+            text, gap = "", first_gap
+            for char in number:
+                if rng.random() < 0.1:
+                    # A typo, then a backspace
+                    keys.append((gap, field, text + rng.choice(string.digits)))
+                    gap = rng.uniform(60, 220)
+                text += char
+                keys.append((gap, field, text))
+                gap = rng.uniform(60, 220)
+        session.append(keys)
+    return session
+
+
+def replay(breakout2, session, delay_ms):
+    """
+    Types a session into a new live app.
+
+    Returns:
+        tuple: (LiveCounts, settle times (ms), paints per pair, seconds spent
+            in Tk callbacks)
+    """
+    app = breakout2.CalculatorApp(live=True, live_debounce_ms=delay_ms)
+    app.live_operation = ("Division", breakout2.Calculator.divide)
+    root = app.root
+    variables = {"num1": app.num1_var, "num2": app.num2_var}
+    changed_at = [0.0]
+
+    def show_live_text(text, show=app.show_live_text):
+        painted = app.live_counts.painted
+        show(text)
+        if app.live_counts.painted != painted:
+            changed_at[0] = root.now
+
+    app.show_live_text = show_live_text
+    settle_ms, paints, tk_seconds = [], [], 0.0
+    for keys in session:
+        painted = app.live_counts.painted
+        start = time.perf_counter()
+        for gap, field, text in keys:
+            root.advance(gap)
+            variables[field].set(text)
+        last_key_at = root.now
+        # Nothing is pending a second after the last key at any delay here
+        root.advance(1000)
+        tk_seconds += time.perf_counter() - start
+        # A label already showing the final result settled at 0 ms
+        settle_ms.append(max(changed_at[0] - last_key_at, 0.0))
+        paints.append(app.live_counts.painted - painted)
+    return app.live_counts, settle_ms, paints, tk_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--pairs", type=int, default=500)
+    parser.add_argument("--delays", default="0,50,100,150,250,400",
+                        help="Comma-separated debounce delays (ms)")
+    args = parser.parse_args()
+
+    headless_tk.install()
+    import breakout2
+
+    session = typing_session(args.pairs)
+    keystrokes = sum(len(keys) for keys in session)
+    print(f"{args.pairs} pairs, {keystrokes} keystrokes\n")
+    print(f"{'delay ms':>9}{'recomputes':>12}{'paints':>9}{'settle ms':>11}"
+          f"{'Tk us/key':>11}{'skipped':>9}")
+    for delay_ms in (int(delay) for delay in args.delays.split(",")):
+        counts, settle_ms, paints, tk_seconds = replay(breakout2, session, delay_ms)
+        print(f"{delay_ms:>9}"
+              f"{counts.recomputed / args.pairs:>12.2f}"
+              f"{sum(paints) / len(paints):>9.2f}"
+              f"{sum(settle_ms) / len(settle_ms):>11.2f}"
+              f"{tk_seconds / keystrokes * 1e6:>11.2f}"
+              f"{counts.unchanged:>9}")
+
+
+if __name__ == "__main__":
+    main()
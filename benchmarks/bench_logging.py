@@ -0,0 +1,99 @@
+"""
+Benchmark: what a log line costs the Tk thread
+Author: Team Five
+
+Description:
+Times, on the calling thread, one calculation's log line written as
+
+    print        print() of the old message, straight to the stream
+    logger       log.info() with fields, queued for the writer thread
+    off          the same call site with logging off (enabled() check)
+
+to a fast stream (an in-memory buffer) and to a slow one, whose writes
+take --slow-ms like a pipe whose reader has fallen behind or a stalled
+terminal. The slow case runs --slow-lines calls, spaced 5 ms apart like
+quick button clicks; after such an idle gap even the "off" call measures
+a few microseconds (cold caches), so compare within each column.
+
+Usage:
+    python benchmarks/bench_logging.py [--calls 100000] [--slow-ms 2]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import calculator_logging  # noqa: E402
+from calculator_logging import INFO, get_logger  # noqa: E402
+
+log = get_logger("bench")
+
+
+class SlowStream(io.StringIO):
+    """A stream whose every write blocks for a while."""
+
+    def __init__(self, delay_s):
+        super().__init__()
+        self.delay_s = delay_s
+
+    def write(self, text):
+        time.sleep(self.delay_s)
+        return super().write(text)
+
+
+def log_print(op, num1, num2, result):
+    print(f"{op}: {num1} and {num2} = {result}")
+
+
+def log_structured(op, num1, num2, result):
+    if log.enabled(INFO):
+        log.info("Calculated", op=op, num1=num1, num2=num2, result=result)
+
+
+def time_calls(func, calls, gap_s=0.0):
+    """Mean microseconds per call on this thread (gaps excluded)."""
+    total = 0.0
+    for index in range(calls):
+        start = time.perf_counter()
+        func("Division", 6.0, float(index), 6.0 / (index + 1))
+        total += time.perf_counter() - start
+        if gap_s:
+            time.sleep(gap_s)
+    return total / calls * 1e6
+
+
+def run(stream, calls, gap_s=0.0):
+    """Returns {mode: us per call} for one stream."""
+    results = {}
+    with contextlib.redirect_stdout(stream):
+        results["print"] = time_calls(log_print, calls, gap_s)
+    calculator_logging.setup_logging("info", stream=stream)
+    results["logger"] = time_calls(log_structured, calls, gap_s)
+    calculator_logging.shutdown_logging(timeout=60)
+    calculator_logging.setup_logging("off")
+    results["off"] = time_calls(log_structured, calls, gap_s)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--slow-ms", type=float, default=2.0)
+    parser.add_argument("--slow-lines", type=int, default=200)
+    args = parser.parse_args()
+
+    fast = run(io.StringIO(), args.calls)
+    slow = run(SlowStream(args.slow_ms / 1000), args.slow_lines, gap_s=0.005)
+
+    print(f"{'':<10}{'fast stream us':>16}{f'{args.slow_ms:g} ms stream us':>18}")
+    for mode in ("print", "logger", "off"):
+        print(f"{mode:<10}{fast[mode]:>16.3f}{slow[mode]:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
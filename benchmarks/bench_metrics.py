@@ -0,0 +1,108 @@
+"""
+Benchmark: what updating and exporting the metrics costs
+Author: Team Five
+
+Description:
+Times, per call:
+
+    counter inc        an unlabelled counter (cache hits)
+    labelled inc       labels("Division").inc(), as calculations{op} does
+    histogram observe  an unlabelled histogram
+    labelled observe   labels("Division").observe(), as operation_seconds does
+    timed_callback     a decorated no-op method minus the bare method
+
+and, for the calculator's registry after --calculations calculations over
+the five operations, render() and write_textfile() (one export).
+
+Usage:
+    python benchmarks/bench_metrics.py [--calls 1000000] [--calculations 100000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator_metrics import CalculatorMetrics, Histogram, timed_callback  # noqa: E402
+
+OPERATIONS = ("Addition", "Subtraction", "Multiplication", "Division", "expression")
+
+
+class Callbacks:
+    """A bare and a timed no-op callback on an object with metrics."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def bare(self):
+        pass
+
+    @timed_callback("timed")
+    def timed(self):
+        pass
+
+
+def per_call_ns(func, calls):
+    """Best of three runs, nanoseconds per call."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--calculations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    metrics = CalculatorMetrics()
+    callbacks = Callbacks(metrics)
+    histogram = Histogram("bench_seconds", "An unlabelled histogram")
+    empty = per_call_ns(lambda: None, args.calls)
+    results = {
+        "counter inc": per_call_ns(metrics.cache_hits.inc, args.calls) - empty,
+        "labelled inc": per_call_ns(
+            lambda: metrics.calculations.labels("Division").inc(), args.calls) - empty,
+        "histogram observe": per_call_ns(
+            lambda: histogram.observe(0.0007), args.calls) - empty,
+        "labelled observe": per_call_ns(
+            lambda: metrics.operation_seconds.labels("Division").observe(0.0007),
+            args.calls) - empty,
+        "timed_callback": per_call_ns(callbacks.timed, args.calls)
+            - per_call_ns(callbacks.bare, args.calls),
+    }
+    for name, ns in results.items():
+        print(f"{name:<20}{ns:>8.0f} ns")
+
+    # Fill the calculator's registry as a long session would
+    metrics = CalculatorMetrics()
+    rng = random.Random(2025)
+    for _ in range(args.calculations):
+        op = rng.choice(OPERATIONS)
+        metrics.calculations.labels(op).inc()
+        metrics.cache_misses.inc()
+        metrics.operation_seconds.labels(op).observe(rng.expovariate(2000))
+        metrics.callback_seconds.labels("perform_calculation").observe(
+            rng.expovariate(3000))
+
+    start = time.perf_counter()
+    text = metrics.registry.render()
+    render_ms = (time.perf_counter() - start) * 1000
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        metrics.registry.write_textfile(Path(directory) / "calculator.prom")
+        write_ms = (time.perf_counter() - start) * 1000
+    print(f"{'render':<20}{render_ms:>8.3f} ms  ({len(text.splitlines())} lines)")
+    print(f"{'write_textfile':<20}{write_ms:>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
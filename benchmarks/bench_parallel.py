@@ -0,0 +1,67 @@
+"""
+Benchmark: scaling of the process-pool batch path
+Author: Team Five
+
+Description:
+Times ParallelCalculator.calculate_batch on one large batch with 1 to N
+worker processes (N defaults to os.cpu_count()) against the single-process
+Calculator.calculate_batch, and reports speedup and scaling efficiency
+(speedup / workers). The pool is warmed up before timing.
+
+Usage:
+    python benchmarks/bench_parallel.py [--size 20000000] [--max-workers 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+
+from calculator_core import Calculator  # noqa: E402
+from calculator_parallel import ParallelCalculator, choose_chunk_size  # noqa: E402
+
+
+def best_of(repeat, func, *args):
+    """Returns the fastest wall-clock time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=20_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--operation", default="divide")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(2025)
+    operands1 = rng.uniform(-1e6, 1e6, args.size)
+    operands2 = rng.integers(-5, 5, args.size).astype(np.float64)
+
+    serial = best_of(args.repeat, Calculator.calculate_batch,
+                     args.operation, operands1, operands2)
+    print(f"single process: {serial * 1e3:.1f} ms for {args.size:,} elements")
+    print(f"{'workers':>8}{'chunk':>12}{'ms':>10}{'speedup':>10}{'efficiency':>12}")
+    for workers in range(1, args.max_workers + 1):
+        with ParallelCalculator(workers) as calculator:
+            calculator.calculate_batch(args.operation, operands1[:1 << 21],
+                                       operands2[:1 << 21])
+            seconds = best_of(args.repeat, calculator.calculate_batch,
+                              args.operation, operands1, operands2)
+        speedup = serial / seconds
+        print(f"{workers:>8}{choose_chunk_size(args.size, workers):>12,}"
+              f"{seconds * 1e3:>10.1f}{speedup:>9.2f}x{speedup / workers:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
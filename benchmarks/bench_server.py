@@ -0,0 +1,262 @@
+"""
+Benchmark: load generator for the JSON-RPC calculator server
+Author: Team Five
+
+Description:
+Starts calculator_server.py in its own process (or targets a running one
+with --address), opens --clients connections and keeps --pipeline
+requests in flight on each: every response is answered with the next
+request (a closed loop). After --warmup seconds it measures for
+--duration seconds and reports
+
+    requests/s    calculations answered per second (a batch of --batch
+                  requests counts as --batch)
+    p50/p99/max   latency from writing a request line until its response
+                  line arrived, in milliseconds
+    errors        responses carrying a JSON-RPC error (there should be none)
+
+By default the server and the generator are both pinned to one CPU
+(--cpu), so the numbers are for one core shared by both; the generator
+uses asyncio protocols like the server to take as little of it as it can.
+
+Usage:
+    python benchmarks/bench_server.py [--clients 1000] [--pipeline 1] [--batch 0]
+    python benchmarks/bench_server.py --unix        # over a Unix socket
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+METHODS = ("add", "subtract", "multiply", "divide")
+
+# Connections opened at the same time while the clients connect
+CONNECT_CONCURRENCY = 100
+
+
+def request_lines(count, batch, seed=2025):
+    """Returns count distinct request lines (batches of batch when batch > 0)."""
+    rng = random.Random(seed)
+
+    def request(request_id):
+        return {"jsonrpc": "2.0", "id": request_id, "method": rng.choice(METHODS),
+                "params": [round(rng.uniform(-1e6, 1e6), 3),
+                           round(rng.uniform(1, 1e3), 3)]}
+
+    lines = []
+    for index in range(count):
+        if batch:
+            message = [request(index * batch + item) for item in range(batch)]
+        else:
+            message = request(index)
+        lines.append(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+    return lines
+
+
+class LoadStats:
+    """What the clients saw while measuring."""
+
+    def __init__(self):
+        self.measuring = False
+        self.stopping = False
+        self.latencies = []
+        self.responses = 0
+        self.errors = 0
+
+
+class LoadClient(asyncio.Protocol):
+    """One connection keeping a fixed number of request lines in flight."""
+
+    def __init__(self, stats, lines, pipeline):
+        self.stats = stats
+        self.lines = lines
+        self.pipeline = pipeline
+        self.next_line = random.randrange(len(lines))
+        self.sent_at = collections.deque()
+        self.transport = None
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.send(self.pipeline)
+
+    def send(self, count):
+        lines = self.lines
+        index = self.next_line
+        chunk = []
+        for _ in range(count):
+            chunk.append(lines[index])
+            index = (index + 1) % len(lines)
+        self.next_line = index
+        now = time.perf_counter()
+        self.sent_at.extend([now] * count)
+        self.transport.write(b"".join(chunk))
+
+    def data_received(self, data):
+        answered = data.count(b"\n")
+        if not answered:
+            return
+        stats = self.stats
+        now = time.perf_counter()
+        sent_at = self.sent_at
+        if stats.measuring:
+            for _ in range(answered):
+                stats.latencies.append(now - sent_at.popleft())
+            stats.responses += answered
+            stats.errors += data.count(b'"error"')
+        else:
+            for _ in range(answered):
+                sent_at.popleft()
+        if not stats.stopping:
+            self.send(answered)
+
+    def connection_lost(self, exc):
+        if not self.closed.done():
+            self.closed.set_result(exc)
+
+
+async def connect_clients(address, clients, stats, lines, pipeline):
+    """Opens every client connection, CONNECT_CONCURRENCY at a time."""
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(CONNECT_CONCURRENCY)
+
+    async def connect():
+        async with limit:
+            factory = lambda: LoadClient(stats, lines, pipeline)
+            if isinstance(address, tuple):
+                _, client = await loop.create_connection(factory, *address)
+            else:
+                _, client = await loop.create_unix_connection(factory, address)
+            return client
+
+    return await asyncio.gather(*(connect() for _ in range(clients)))
+
+
+async def run_load(address, args):
+    """Drives the server; returns (LoadStats, measured seconds)."""
+    stats = LoadStats()
+    lines = request_lines(1000, args.batch)
+    clients = await connect_clients(address, args.clients, stats, lines, args.pipeline)
+
+    await asyncio.sleep(args.warmup)
+    stats.measuring = True
+    start = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    stats.measuring = False
+    elapsed = time.perf_counter() - start
+
+    stats.stopping = True
+    for client in clients:
+        client.transport.close()
+    await asyncio.gather(*(client.closed for client in clients))
+    return stats, elapsed
+
+
+def start_server(args, directory):
+    """Starts calculator_server.py; returns (process, address)."""
+    if args.unix:
+        address = os.path.join(directory, "calculator.sock")
+        listen = ["--unix", address]
+    else:
+        # Ask the kernel for a free port, then hand it to the server
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        address = ("127.0.0.1", port)
+        listen = ["--port", str(port)]
+
+    env = dict(os.environ, CALCULATOR_LOG="warning")
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / "calculator_server.py"), "--backend", args.backend,
+         *listen], env=env)
+    _pin(process.pid, args.cpu)
+
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            family = socket.AF_UNIX if args.unix else socket.AF_INET
+            with socket.socket(family) as probe:
+                probe.connect(address)
+            return process, address
+        except OSError:
+            if time.monotonic() > deadline or process.poll() is not None:
+                process.kill()
+                raise SystemExit("The server did not start")
+            time.sleep(0.05)
+
+
+def _pin(pid, cpu):
+    if cpu >= 0 and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(pid, {cpu})
+
+
+def _parse_address(text):
+    if ":" in text:
+        host, port = text.rsplit(":", 1)
+        return host, int(port)
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--pipeline", type=int, default=1,
+                        help="Request lines in flight per client")
+    parser.add_argument("--batch", type=int, default=0,
+                        help="Requests per JSON-RPC batch (0: single requests)")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--unix", action="store_true",
+                        help="Use a Unix socket instead of TCP")
+    parser.add_argument("--backend", default="float")
+    parser.add_argument("--cpu", type=int, default=0,
+                        help="CPU to pin the server and the generator to (-1: none)")
+    parser.add_argument("--address",
+                        help="host:port or socket path of a running server")
+    args = parser.parse_args()
+
+    _pin(0, args.cpu)
+    with tempfile.TemporaryDirectory() as directory:
+        process = None
+        if args.address:
+            address = _parse_address(args.address)
+        else:
+            process, address = start_server(args, directory)
+        try:
+            stats, elapsed = asyncio.run(run_load(address, args))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    latencies = sorted(stats.latencies)
+    per_line = max(args.batch, 1)
+
+    def percentile(fraction):
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000
+
+    transport = "unix" if args.unix else "tcp"
+    print(f"{args.clients} clients, {args.pipeline} in flight each, "
+          f"batch {args.batch}, {transport}, {args.backend}")
+    if not latencies:
+        raise SystemExit("No responses while measuring")
+    print(f"requests/s  {stats.responses * per_line / elapsed:>10,.0f}")
+    print(f"p50 ms      {percentile(0.50):>10.2f}")
+    print(f"p99 ms      {percentile(0.99):>10.2f}")
+    print(f"max ms      {latencies[-1] * 1000:>10.2f}")
+    print(f"errors      {stats.errors:>10}")
+
+
+if __name__ == "__main__":
+    main()
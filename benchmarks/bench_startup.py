@@ -0,0 +1,86 @@
+"""
+Benchmark: import time and time to first paint of the calculator
+Author: Team Five
+
+Description:
+Starts the calculator in fresh Python processes (so every import is cold)
+and reports, over several runs:
+
+    import       importing breakout2, tkinter included
+    build        creating the window and widgets (CalculatorApp.build())
+    first paint  import + build + the first update_idletasks()
+
+Each child process runs calculator_startup.profile_startup(). The build
+runs against the headless Tk stand-in by default (covering the Python side
+of the build only), or against the real Tk with --tk real (needs a
+display, e.g. under xvfb-run). The import is always the real tkinter
+import.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 15] [--tk fake|real]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {benchmarks!r})
+start = time.perf_counter()
+import breakout2
+import_ms = (time.perf_counter() - start) * 1000.0
+if {fake}:
+    import importlib
+    import headless_tk
+    headless_tk.install()
+    for name in ("app_theme", "breakout2"):
+        importlib.reload(sys.modules[name])
+import calculator_startup
+profiler, app = calculator_startup.profile_startup()
+report = profiler.report()
+report["phases"]["import"] = import_ms
+report["total_ms"] += import_ms
+print(json.dumps(report))
+"""
+
+
+def run_child(fake):
+    """Runs one cold start; returns its profiler report."""
+    script = CHILD_SCRIPT.format(root=str(ROOT), benchmarks=str(ROOT / "benchmarks"),
+                                 fake=fake)
+    output = subprocess.run([sys.executable, "-c", script], check=True,
+                            capture_output=True, text=True, cwd=ROOT).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--tk", choices=("fake", "real"), default="fake",
+                        help="Tk used for the build (default: fake)")
+    args = parser.parse_args()
+
+    rows = {"import": [], "build": [], "first paint": []}
+    for _ in range(args.runs):
+        report = run_child(args.tk == "fake")
+        phases = report["phases"]
+        import_ms = phases.pop("import")
+        rows["import"].append(import_ms)
+        rows["build"].append(sum(ms for name, ms in phases.items() if name != "layout"))
+        rows["first paint"].append(report["total_ms"])
+
+    print(f"{args.runs} cold starts, build with --tk {args.tk}\n")
+    print(f"{'':<14}{'median ms':>10}{'best ms':>10}")
+    for name, values in rows.items():
+        print(f"{name:<14}{statistics.median(values):>10.2f}{min(values):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: font tuples vs. shared named fonts and ttk styles
+Author: Team Five
+
+Description:
+Measures what the shared theme in app_theme.py saves when widgets are
+created and when the division by zero animation reconfigures the result
+label:
+
+    options   - tkinter's Python-side option conversion (runs anywhere)
+    create    - creating a ttk.Label with a font tuple, a named font or a
+                style (needs a display)
+    animate   - one animation step on the result label, re-sending the font
+                tuple as the old effect did vs. colors and text only with
+                the named font set once (needs a display)
+
+Without a display only the "options" rows are measured; run it under
+xvfb-run for the Tk rows.
+
+Usage:
+    python benchmarks/bench_styles.py [--count 2000]
+"""
+
+import argparse
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+from tkinter import ttk
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app_theme import get_theme  # noqa: E402
+
+FONT_TUPLE = ("Arial", 16, "bold")
+
+
+def best_of(repeat, func, *args):
+    """Returns the fastest wall-clock time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_options(count, repeat):
+    """Times tkinter's conversion of configure() options to Tcl words."""
+    converter = tk.Misc()
+    step = {"background": "#FF0000", "foreground": "white", "text": "ALERT"}
+    cases = {
+        "options: font tuple": dict(step, font=FONT_TUPLE),
+        "options: named font": dict(step, font="app_alert"),
+        "options: no font": step,
+    }
+    rows = {}
+    for label, options in cases.items():
+        def run():
+            for _ in range(count):
+                converter._options(options)
+        rows[label] = best_of(repeat, run) / count
+    return rows
+
+
+def measure_tk(root, count, repeat):
+    """Times widget creation and animation steps on a real Tk."""
+    fonts = get_theme(root).fonts
+    frame = ttk.Frame(root)
+
+    def create(**options):
+        def run():
+            labels = [ttk.Label(frame, text="Result", **options) for _ in range(count)]
+            for label in labels:
+                label.destroy()
+        return run
+
+    rows = {
+        "create: font tuple": best_of(repeat, create(font=FONT_TUPLE)),
+        "create: named font": best_of(repeat, create(font=fonts["alert"])),
+        "create: style": best_of(repeat, create(style="Title.TLabel")),
+    }
+
+    label = ttk.Label(frame, text="Result", font=fonts["alert"])
+    colors = ["#FF0000", "#FF4500", "#FFD700", "#FF6347", "#DC143C"]
+
+    def animate(**font):
+        def run():
+            for i in range(count):
+                label.configure(background=colors[i % 5], foreground="white",
+                                text=str(i), **font)
+        return run
+
+    rows["animate: font tuple"] = best_of(repeat, animate(font=FONT_TUPLE))
+    rows["animate: named font once"] = best_of(repeat, animate())
+    return {name: seconds / count for name, seconds in rows.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = measure_options(args.count * 50, args.repeat)
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"No display ({e}); Tk rows skipped\n")
+    else:
+        root.withdraw()
+        rows.update(measure_tk(root, args.count, args.repeat))
+        root.destroy()
+
+    for name, seconds in rows.items():
+        print(f"{name:<28}{seconds * 1e6:>10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
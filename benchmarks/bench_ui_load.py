@@ -0,0 +1,204 @@
+"""
+Benchmark: load test of the GUI layer on a virtual clock
+Author: Team Five
+
+Description:
+Drives both apps through the headless Tk stand-in, whose after() callbacks
+run on a virtual clock, and reports:
+
+    greetings      "Greet Me" presses per second in breakout1 (typed name,
+                   click, entry cleared)
+    calculations   operation button presses per second in CalculatorApp,
+                   --gap-ms of virtual time apart, cycling through the four
+                   operations
+    effects        full division by zero timelines: real milliseconds per
+                   timeline, frames sent, and how far the virtual end of
+                   each timeline is from its last keyframe (0 when every
+                   frame ran on time). Each timeline is clicked again every
+                   --retrigger-ms while it plays; the repeats coalesce, so
+                   frames per timeline must not change
+
+The benchmark checks what it drives (every greeting and result shown,
+every effect restoring the result label) and exits with status 1 if a
+check fails or a timeline ends late, so it doubles as a regression test.
+
+Usage:
+    python benchmarks/bench_ui_load.py [--presses 20000] [--effects 50]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import headless_tk  # noqa: E402
+
+BUTTONS = (("Add", "Addition"), ("Subtract", "Subtraction"),
+           ("Multiply", "Multiplication"), ("Divide", "Division"))
+
+
+def load_greetings(breakout1, presses):
+    """
+    Presses "Greet Me" with a new name each time.
+
+    Returns:
+        tuple: (presses per second, list of failed checks)
+    """
+    root = breakout1.create_personalized_greeting_app()
+    name_var, greeting_var = breakout1.setup_string_variables()
+    greet = breakout1.create_greet_function(name_var, greeting_var)
+    breakout1.create_widgets(root, name_var, greeting_var, greet)
+    button = headless_tk.find_button(root, "Greet Me")
+
+    failures = []
+    start = time.perf_counter()
+    for index in range(presses):
+        name = f"User {index}" if index % 10 else ""
+        name_var.set(name)
+        button.invoke()
+        expected = f"Hello, {name}!" if name else "Hello, friend!"
+        if greeting_var.get() != expected or name_var.get():
+            failures.append(f"greeting {index}: {greeting_var.get()!r}")
+    elapsed = time.perf_counter() - start
+    return presses / elapsed, failures
+
+
+def load_calculations(breakout2, presses, gap_ms, seed=2025):
+    """
+    Types two numbers and presses an operation button, presses times.
+
+    Returns:
+        tuple: (presses per second, list of failed checks)
+    """
+    app = breakout2.CalculatorApp()
+    root = app.root
+    app.timeline.clock = root.clock
+    buttons = [headless_tk.find_button(root, text).invoke for text, _ in BUTTONS]
+    rng = random.Random(seed)
+    inputs = [(str(rng.randint(-9999, 9999)), str(rng.randint(1, 9999)))
+              for _ in range(presses)]
+
+    start = time.perf_counter()
+    for index, (num1, num2) in enumerate(inputs):
+        app.num1_var.set(num1)
+        app.num2_var.set(num2)
+        buttons[index % len(buttons)]()
+        root.advance(gap_ms)
+    elapsed = time.perf_counter() - start
+
+    failures = []
+    for (_, operation), shown in zip(BUTTONS, _shown_per_operation(app)):
+        expected = len(range(BUTTONS.index((_, operation)), presses, len(BUTTONS)))
+        if shown != expected:
+            failures.append(f"{operation}: {shown} results shown, {expected} expected")
+    return presses / elapsed, failures
+
+
+def _shown_per_operation(app):
+    calculations = app.metrics.calculations
+    return [calculations.labels(operation).value for _, operation in BUTTONS]
+
+
+def load_effects(breakout2, effects, retrigger_ms):
+    """
+    Plays the division by zero effect to the end, effects times.
+
+    Returns:
+        tuple: (real ms per timeline, frames per timeline, worst lateness
+            (virtual ms), list of failed checks)
+    """
+    app = breakout2.CalculatorApp()
+    root = app.root
+    app.timeline.clock = root.clock
+    divide = headless_tk.find_button(root, "Divide").invoke
+    label = app.result_label
+    keyframes = breakout2.SpecialEffects.division_by_zero_keyframes(
+        root, label, "#f0f0f0", root.geometry(), {})
+    duration_ms = keyframes[-1].at
+    # One frame per distinct keyframe time, however often it is clicked
+    expected_frames = len({keyframe.at for keyframe in keyframes})
+
+    # Note the virtual time of every frame sent
+    batch = app.timeline.batch
+    flush = batch.flush
+    last_frame = [0.0]
+
+    def timed_flush():
+        frames = batch.frames
+        flush()
+        if batch.frames != frames:
+            last_frame[0] = root.now
+
+    batch.flush = timed_flush
+
+    failures = []
+    worst_late = 0.0
+    frames = batch.frames
+    start = time.perf_counter()
+    for index in range(effects):
+        app.num1_var.set("1")
+        app.num2_var.set("0")
+        divide()
+        started = root.now
+        if not app.timeline.is_playing("division_by_zero"):
+            failures.append(f"effect {index} did not start")
+            continue
+        while True:
+            root.advance(retrigger_ms)
+            if not app.timeline.is_playing("division_by_zero"):
+                break
+            app.num1_var.set("1")
+            app.num2_var.set("0")
+            divide()
+        root.run_until_idle()
+        worst_late = max(worst_late, last_frame[0] - started - duration_ms)
+        if label.cget("text") != breakout2.DIVISION_BY_ZERO_TEXT:
+            failures.append(f"effect {index} left the label at {label.cget('text')!r}")
+    elapsed = time.perf_counter() - start
+
+    frames = (batch.frames - frames) / effects
+    if frames != expected_frames:
+        failures.append(f"{frames:g} frames per effect, {expected_frames} expected")
+    if worst_late > 0:
+        failures.append(f"an effect ended {worst_late:g} ms late")
+    return elapsed * 1000 / effects, frames, duration_ms, worst_late, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--presses", type=int, default=20_000)
+    parser.add_argument("--gap-ms", type=float, default=100.0,
+                        help="Virtual time between calculation presses")
+    parser.add_argument("--effects", type=int, default=50)
+    parser.add_argument("--retrigger-ms", type=float, default=250.0,
+                        help="Virtual time between clicks while an effect plays")
+    args = parser.parse_args()
+
+    headless_tk.install()
+    import breakout1
+    import breakout2
+
+    greetings, failures = load_greetings(breakout1, args.presses)
+    calculations, more = load_calculations(breakout2, args.presses, args.gap_ms)
+    failures += more
+    effect_ms, frames, duration_ms, late_ms, more = load_effects(
+        breakout2, args.effects, args.retrigger_ms)
+    failures += more
+
+    virtual_s = args.presses * args.gap_ms / 1000
+    print(f"greetings      {greetings:>10,.0f} presses/s")
+    print(f"calculations   {calculations:>10,.0f} presses/s "
+          f"({virtual_s:,.0f} s of clicking in {args.presses / calculations:.2f} s)")
+    print(f"effects        {effect_ms:>10.2f} ms per {duration_ms / 1000:g} s timeline, "
+          f"{frames:g} frames, {late_ms:g} ms late")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: Calculator.validate_batch vs. per-value validate_input
+Author: Team Five
+
+Description:
+Compares the bulk, exception-free parser against calling validate_input
+once per string, on a clean feed and on a dirty feed where half of the
+values are invalid (so validate_input raises ValueError for each of them).
+
+Usage:
+    python benchmarks/bench_validate.py [--size 1000000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator_core import Calculator  # noqa: E402
+
+
+def make_feed(size, invalid_ratio, rng):
+    """Builds a feed of numeric strings with the given share of garbage."""
+    invalid_values = ["abc", "", "1.2.3", "--5", "12a", "N/A", " . "]
+    feed = []
+    for _ in range(size):
+        if rng.random() < invalid_ratio:
+            feed.append(rng.choice(invalid_values))
+        elif rng.random() < 0.5:
+            feed.append(f" {rng.uniform(-1e6, 1e6):.4f} ")
+        else:
+            feed.append(f"{rng.uniform(-10, 10):.3e}")
+    return feed
+
+
+def per_value_loop(feed):
+    """The current path: validate_input (try/except float()) per value."""
+    validate_input = Calculator.validate_input
+    return [validate_input(value) for value in feed]
+
+
+def best_of(repeat, func, *args):
+    """Returns the fastest wall-clock time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(2025)
+    print(f"{'feed':<14}{'n':>10}{'loop ms':>12}{'batch ms':>12}{'speedup':>10}")
+    for label, invalid_ratio in (("clean", 0.0), ("50% invalid", 0.5)):
+        feed = make_feed(args.size, invalid_ratio, rng)
+        loop_s = best_of(args.repeat, per_value_loop, feed)
+        batch_s = best_of(args.repeat, Calculator.validate_batch, feed)
+        print(
+            f"{label:<14}{args.size:>10}{loop_s * 1e3:>12.1f}"
+            f"{batch_s * 1e3:>12.1f}{loop_s / batch_s:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Headless Tk - a minimal tkinter stand-in for benchmarking the GUI code
+Author: Team Five
+
+Description:
+The calculator apps need a display to create a real Tk root. For timing the
+Python side of the GUI (button callbacks, StringVar updates, result
+formatting) a stand-in is enough: every widget accepts any options, stores
+them, and turns layout and styling calls into no-ops. Button.invoke() runs
+the widget's command, so button dispatch can be measured end to end.
+
+The root runs on a virtual clock. after() callbacks wait until advance(ms)
+moves the clock past their due time and then run in time order without
+any real waiting, so thousands of button presses or a whole ten-second
+effect take milliseconds, and every run sees exactly the same timing.
+clock() reads the virtual time in seconds; hand it to a Timeline (or any
+other clock= argument) to keep animations on the same clock. run_pending()
+still runs everything queued at once, ignoring the delays.
+
+install() must run before the app module is imported, because the apps do
+"import tkinter as tk" at import time. With a display (for example under
+Xvfb) the benchmarks can use the real tkinter instead.
+
+Timings taken with the stand-in exclude Tcl/Tk's own work; they measure the
+code this repository owns.
+"""
+
+import heapq
+import sys
+import types
+
+
+def _no_op(*args, **kwargs):
+    """Stands in for every layout, styling and window-manager call."""
+    return None
+
+
+class FakeWidget:
+    """Any Tk or ttk widget: stores options, ignores layout and drawing."""
+
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.options = options
+        self.children = []
+        self.destroyed = False
+        if master is not None:
+            master.children.append(self)
+
+    def configure(self, cnf=None, **options):
+        # ttk.Style.configure(style_name, ...) passes a name, not a dict
+        if isinstance(cnf, dict):
+            self.options.update(cnf)
+        self.options.update(options)
+
+    config = configure
+
+    def cget(self, key):
+        return self.options.get(key, "")
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def winfo_exists(self):
+        return 0 if self.destroyed else 1
+
+    def destroy(self):
+        """Marks the widget and its children destroyed (winfo_exists() is 0)."""
+        for child in self.children:
+            child.destroy()
+        self.destroyed = True
+
+    def after_idle(self, func, *args):
+        root = self
+        while root.master is not None:
+            root = root.master
+        return root.after(0, func, *args)
+
+    def invoke(self):
+        """Runs the widget's command, as clicking a button would."""
+        command = self.options.get("command")
+        return command() if command is not None else None
+
+    def __getattr__(self, name):
+        # pack, grid, bind, focus, title, geometry, ... all do nothing
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _no_op
+
+
+class FakeTk(FakeWidget):
+    """The root window; after() callbacks run on a virtual clock."""
+
+    def __init__(self, *args, **options):
+        super().__init__(None, **options)
+        self.pending = {}
+        self.now = 0.0          # Virtual milliseconds since the root was created
+        self._timers = []       # Heap of (due ms, sequence, after id)
+        self._after_ids = 0
+        self._geometry = "200x200+0+0"
+
+    def geometry(self, new_geometry=None):
+        if new_geometry is None:
+            return self._geometry
+        self._geometry = new_geometry
+
+    def after(self, ms, func=None, *args):
+        self._after_ids += 1
+        after_id = f"after#{self._after_ids}"
+        self.pending[after_id] = (func, args)
+        heapq.heappush(self._timers, (self.now + ms, self._after_ids, after_id))
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def eval(self, script):
+        return ""
+
+    def clock(self):
+        """The virtual time in seconds, for clock= arguments."""
+        return self.now / 1000.0
+
+    def advance(self, ms):
+        """
+        Moves the clock ms milliseconds on, running the callbacks that fall
+        due on the way in time order (each sees now at its due time).
+
+        Returns:
+            int: The number of callbacks run
+        """
+        target = self.now + ms
+        ran = 0
+        while self._timers and self._timers[0][0] <= target:
+            due, _, after_id = heapq.heappop(self._timers)
+            if after_id in self.pending:
+                self.now = max(self.now, due)
+                func, args = self.pending.pop(after_id)
+                ran += 1
+                if func is not None:
+                    func(*args)
+        self.now = target
+        return ran
+
+    def run_until_idle(self, limit_ms=60_000):
+        """
+        Advances the clock until no callback is pending, or by limit_ms.
+
+        Returns:
+            float: Virtual milliseconds that passed
+        """
+        start = self.now
+        while self.now - start < limit_ms:
+            # Drop timers cancelled (or already run by run_pending())
+            while self._timers and self._timers[0][2] not in self.pending:
+                heapq.heappop(self._timers)
+            if not self._timers:
+                break
+            due = min(self._timers[0][0], start + limit_ms)
+            self.advance(max(due - self.now, 0.0))
+        return self.now - start
+
+    def run_pending(self):
+        """Runs every queued after() callback at once, including newly queued ones."""
+        while self.pending:
+            after_id = next(iter(self.pending))
+            func, args = self.pending.pop(after_id)
+            if func is not None:
+                func(*args)
+
+
+class FakeVariable:
+    """StringVar/IntVar/...: a value plus write traces."""
+
+    def __init__(self, master=None, value="", name=None):
+        self._value = value
+        self._traces = {}
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+        for callback in list(self._traces.values()):
+            callback("", "", "write")
+
+    def trace_add(self, mode, callback):
+        name = f"trace#{len(self._traces) + 1}"
+        self._traces[name] = callback
+        return name
+
+    def trace_remove(self, mode, name):
+        self._traces.pop(name, None)
+
+
+class _FakeModule(types.ModuleType):
+    """A tkinter submodule where every unknown capitalised name is a widget."""
+
+    def __getattr__(self, name):
+        if name[:1].isupper():
+            return FakeWidget
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _no_op
+
+
+def _build_tkinter():
+    """Builds fake tkinter, tkinter.ttk, .messagebox and .font modules."""
+    tkinter = _FakeModule("tkinter")
+    tkinter.__path__ = []
+    tkinter.Tk = FakeTk
+    tkinter.TclError = type("TclError", (Exception,), {})
+    for name in ("StringVar", "IntVar", "DoubleVar", "BooleanVar", "Variable"):
+        setattr(tkinter, name, FakeVariable)
+    for name in ("BOTH", "X", "Y", "LEFT", "RIGHT", "TOP", "BOTTOM", "END",
+                 "CENTER", "N", "S", "E", "W", "HORIZONTAL", "VERTICAL"):
+        setattr(tkinter, name, name.lower())
+
+    tkinter.ttk = _FakeModule("tkinter.ttk")
+    tkinter.messagebox = _FakeModule("tkinter.messagebox")
+    tkinter.font = _FakeModule("tkinter.font")
+    return tkinter
+
+
+def install():
+    """
+    Replaces tkinter in sys.modules with the stand-in.
+
+    Returns:
+        module: The fake tkinter module
+    """
+    tkinter = _build_tkinter()
+    sys.modules["tkinter"] = tkinter
+    sys.modules["tkinter.ttk"] = tkinter.ttk
+    sys.modules["tkinter.messagebox"] = tkinter.messagebox
+    sys.modules["tkinter.font"] = tkinter.font
+    return tkinter
+
+
+def find_button(widget, text):
+    """
+    Finds a button whose label starts with text, searching depth first.
+
+    Works with the stand-in and with real Tk widgets alike.
+
+    Returns:
+        The button widget, or None
+    """
+    for child in widget.winfo_children():
+        try:
+            label = str(child.cget("text"))
+        except Exception:
+            label = ""
+        if label.startswith(text) and hasattr(child, "invoke"):
+            return child
+        found = find_button(child, text)
+        if found is not None:
+            return found
+    return None
@@ -0,0 +1,249 @@
+"""
+Benchmark Suite: calculator core and GUI dispatch, with baseline comparison
+Author: Team Five
+
+Description:
+Times the Calculator operations, validate_input, result formatting, the
+full perform_calculation path and a button click dispatched through the
+widget's command, all in one reproducible run. Results are per-operation
+times in nanoseconds (best of several repeats, as with timeit).
+
+The GUI cases run against the headless Tk stand-in in headless_tk.py by
+default, or against the real tkinter with --tk real (needs a display, for
+example "xvfb-run python benchmarks/run_suite.py --tk real").
+
+The results can be written as JSON and compared with a stored baseline; a
+case slower than the baseline by more than the tolerance is reported as a
+regression and the run exits with status 1. Absolute timings are only
+comparable on the machine that recorded them, so the baseline is local
+(benchmarks/baseline.json is not tracked): --compare without one records
+this run as the baseline, and a baseline from another machine or Python
+is re-recorded rather than compared. Record it on the code to compare
+against (for example before a change) with --save-baseline.
+
+Usage:
+    python benchmarks/run_suite.py [--json results.json]
+    python benchmarks/run_suite.py --save-baseline
+    python benchmarks/run_suite.py --compare [--tolerance 0.25]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import headless_tk  # noqa: E402
+
+# Stored results of --save-baseline; local to this machine, not tracked
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# Allowed slowdown against the baseline before a case counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Inputs processed per timed call, so call overhead stays small
+BATCH = 1000
+
+
+# ====================================================================
+# CASES
+# ====================================================================
+
+def core_cases(rng):
+    """Calculator operations, validate_input and result formatting."""
+    from calculator_core import OPERATIONS, Calculator, format_result, format_results
+
+    pairs = [(rng.uniform(-1e6, 1e6), rng.uniform(1, 1e6)) for _ in range(BATCH)]
+    valid_strs = [f"{rng.uniform(-1e6, 1e6):.4f}" for _ in range(BATCH)]
+    invalid_strs = [rng.choice(["abc", "", "1.2.3", "N/A"]) for _ in range(BATCH)]
+    whole_results = [float(rng.randint(-10 ** 6, 10 ** 6)) for _ in range(BATCH)]
+    fraction_results = [rng.uniform(-1e6, 1e6) for _ in range(BATCH)]
+
+    def operation_case(func):
+        def run():
+            for num1, num2 in pairs:
+                func(num1, num2)
+        return run
+
+    def validate_case(strings):
+        def run():
+            validate_input = Calculator.validate_input
+            for value in strings:
+                validate_input(value)
+        return run
+
+    def format_case(results):
+        def run():
+            for result in results:
+                format_result(result)
+        return run
+
+    cases = {f"core.{name}": operation_case(func) for name, func in OPERATIONS.items()}
+    cases["core.validate_input.valid"] = validate_case(valid_strs)
+    cases["core.validate_input.invalid"] = validate_case(invalid_strs)
+    cases["core.format_result.whole"] = format_case(whole_results)
+    cases["core.format_result.fraction"] = format_case(fraction_results)
+    fraction_array = np.array(fraction_results)
+    cases["core.format_results.fraction"] = lambda: format_results(fraction_array)
+    return cases
+
+
+def gui_cases(rng):
+    """perform_calculation and button dispatch on a headless CalculatorApp."""
+    import breakout2
+
+    inputs = [(f"{rng.uniform(-1e6, 1e6):.3f}", f"{rng.uniform(1, 1e3):.3f}")
+              for _ in range(BATCH)]
+
+    def calculation_case(cache_size, click):
+        app = breakout2.CalculatorApp(cache_size=cache_size)
+        num1_var, num2_var = app.num1_var, app.num2_var
+        if click:
+            action = headless_tk.find_button(app.root, "Divide").invoke
+        else:
+            action = lambda: app.perform_calculation("Division", breakout2.Calculator.divide)
+
+        def run():
+            for num1_str, num2_str in inputs:
+                num1_var.set(num1_str)
+                num2_var.set(num2_str)
+                action()
+        return run
+
+    return {
+        "gui.perform_calculation": calculation_case(0, click=False),
+        "gui.perform_calculation.cached": calculation_case(BATCH, click=False),
+        "gui.button_dispatch": calculation_case(0, click=True),
+    }
+
+
+def run_cases(cases, repeat):
+    """
+    Times every case.
+
+    Returns:
+        dict: Case name -> best nanoseconds per operation
+    """
+    results = {}
+    # The app prints every result; keep the terminal out of the timings
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name, run in cases.items():
+            timer = timeit.Timer(run)
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat, number))
+            results[name] = round(best / number / BATCH * 1e9, 1)
+    return results
+
+
+# ====================================================================
+# BASELINE COMPARISON
+# ====================================================================
+
+def compare(results, baseline, tolerance):
+    """
+    Compares results with a baseline.
+
+    Returns:
+        list: (name, baseline_ns, current_ns, ratio, is_regression) rows
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        ratio = current / previous
+        rows.append((name, previous, current, ratio, ratio > 1 + tolerance))
+    return rows
+
+
+def environment():
+    """Describes what the timings depend on; baselines must match it."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "node": platform.node(),
+    }
+
+
+def save_baseline(report, path):
+    Path(path).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Baseline saved to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tk", choices=("fake", "real"), default="fake",
+                        help="Tk used for the GUI cases (default: fake)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="PATH",
+                        help="Write the results as JSON to PATH")
+    parser.add_argument("--baseline", metavar="PATH", default=str(BASELINE_PATH))
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store these results as the new baseline")
+    parser.add_argument("--compare", action="store_true",
+                        help="Compare with the baseline; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    if args.tk == "fake":
+        headless_tk.install()
+
+    rng = random.Random(2025)
+    results = run_cases({**core_cases(rng), **gui_cases(rng)}, args.repeat)
+    report = {
+        **environment(),
+        "tk": args.tk,
+        "unit": "ns/op",
+        "results": results,
+    }
+
+    for name, ns in results.items():
+        print(f"{name:<34}{ns:>12.1f} ns/op")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n")
+    if args.save_baseline:
+        save_baseline(report, args.baseline)
+
+    if args.compare and not args.save_baseline:
+        if not Path(args.baseline).exists():
+            print("\nNo baseline on this machine yet; this run is the baseline.")
+            save_baseline(report, args.baseline)
+            return
+        baseline = json.loads(Path(args.baseline).read_text())
+        differences = [key for key, value in environment().items()
+                       if baseline.get(key) != value]
+        if baseline.get("tk") != args.tk:
+            differences.append("tk")
+        if differences:
+            print(f"\nThe baseline was recorded elsewhere ({', '.join(differences)} "
+                  "differ); its timings are not comparable. This run is the new "
+                  "baseline.")
+            save_baseline(report, args.baseline)
+            return
+        rows = compare(results, baseline["results"], args.tolerance)
+        print(f"\n{'case':<34}{'baseline':>10}{'now':>10}{'ratio':>8}")
+        for name, previous, current, ratio, is_regression in rows:
+            flag = "  REGRESSION" if is_regression else ""
+            print(f"{name:<34}{previous:>10.1f}{current:>10.1f}{ratio:>7.2f}x{flag}")
+        regressions = [row[0] for row in rows if row[4]]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond "
+                  f"{args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
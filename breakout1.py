@@ -21,6 +21,12 @@ Requirements Implemented:
 import tkinter as tk
 from tkinter import ttk  # ttk provides themed widgets for better appearance
 
+from app_theme import get_theme  # Shared named fonts and label styles
+from calculator_logging import INFO, get_logger, setup_logging, shutdown_logging
+
+# Greetings are logged off the Tk thread (see calculator_logging.py)
+log = get_logger("breakout1")
+
 # ====================================================================
 # MAIN APPLICATION SETUP
 # ====================================================================
@@ -115,12 +121,13 @@ def create_greet_function(name_var, greeting_var):
             personalized_message = f"Hello, {user_name}!"
             greeting_var.set(personalized_message)
             
-            # Print to console for debugging (can be removed in production)
-            print(f"Greeting created for: {user_name}")
+            # Log for debugging; a slow console never delays the click
+            if log.enabled(INFO):
+                log.info("Greeting created", user_name=user_name)
         else:
             # Use default greeting when no name is provided (bonus feature)
             greeting_var.set("Hello, friend!")
-            print("Default greeting used - no name provided")
+            log.info("Default greeting used - no name provided")
         
         # Clear the entry field after greeting (bonus feature)
         # This makes the form ready for the next input
@@ -148,10 +155,13 @@ def create_widgets(root, name_var, greeting_var, greet_function):
     # ----------------------------------------------------------------
     # 1. PROMPT LABEL (Requirement #1)
     # ----------------------------------------------------------------
+    # Named fonts and styles are created once and shared by every widget
+    fonts = get_theme(root).fonts
+    
     prompt_label = ttk.Label(
         root, 
         text="Enter your name:",
-        font=("Arial", 12, "bold")  # Make it visually prominent
+        style="Field.TLabel"  # Make it visually prominent
     )
     prompt_label.pack(pady=(20, 10))  # Add padding: 20px top, 10px bottom
     
@@ -162,7 +172,7 @@ def create_widgets(root, name_var, greeting_var, greet_function):
     name_entry = ttk.Entry(
         root,
         textvariable=name_var,  # Bind to our StringVar for automatic sync
-        font=("Arial", 11),
+        font=fonts["entry_small"],
         width=25,  # Set width to accommodate reasonable name lengths
         justify='center'  # Center the text for better appearance
     )
@@ -182,9 +192,7 @@ def create_widgets(root, name_var, greeting_var, greet_function):
     greeting_label = ttk.Label(
         root,
         textvariable=greeting_var,  # Bind to our StringVar for automatic updates
-        font=("Arial", 14, "bold"),
-        foreground="blue",  # Make the greeting visually distinct
-        background="lightgray",  # Add background color
+        style="Greeting.TLabel",  # Bold blue text on light gray, visually distinct
         padding=10  # Add padding around the text
     )
     greeting_label.pack(pady=20)
@@ -223,8 +231,7 @@ def create_widgets(root, name_var, greeting_var, greet_function):
     instructions_label = ttk.Label(
         root,
         text="Tip: You can also press Enter after typing your name!",
-        font=("Arial", 9),
-        foreground="gray"
+        style="Hint.TLabel"
     )
     instructions_label.pack(pady=(5, 10))
 
@@ -243,6 +250,7 @@ def main():
     - View: Tkinter widgets for user interface
     - Controller: Event handler functions for user interactions
     """
+    setup_logging()
     print("Starting Personalized Greeting Form Application...")
     print("=" * 50)
     
@@ -267,6 +275,7 @@ def main():
     # and responsive to user interactions until the window is closed
     root.mainloop()
     
+    shutdown_logging()
     print("Application closed successfully!")
 
 
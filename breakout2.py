@@ -18,86 +18,237 @@ Enhanced Features:
 6. Exit button and menu system
 """
 
+import math
+import os
+import sys
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Optional
+from functools import partial
+from tkinter import ttk
+
+from calculator_backends import get_backend
+from calculator_core import (
+    Calculator,
+    DEFAULT_CACHE_SIZE,
+    DIVISION_BY_ZERO_TEXT,
+    INVALID_INPUT_TEXT,
+    ResultCache,
+)
+from calculator_history import CalculationHistory
+from calculator_logging import INFO, get_logger, setup_logging, shutdown_logging
+from calculator_metrics import CalculatorMetrics, timed_callback
+from calculator_timeline import Effect, Keyframe, Timeline
+from app_theme import get_theme
+
+
+# How often (ms) finished worker results are collected in async mode; this
+# bounds the extra delay between a result being ready and being painted
+WORKER_POLL_MS = 10
+
+# Most worker results delivered per poll, so a burst never blocks the UI
+WORKER_DRAIN_LIMIT = 16
+
+# How often (ms) a history filter running on the writer thread is checked
+HISTORY_FILTER_POLL_MS = 20
+
+log = get_logger("breakout2")
+
+# Set to 1 to time every root.after() callback (see calculator_frametiming.py)
+FRAME_TIMING_ENV = "CALCULATOR_FRAME_TIMING"
+
+# Set to 0 to turn the main-loop stall watchdog off (see calculator_watchdog.py)
+WATCHDOG_ENV = "CALCULATOR_WATCHDOG"
+
+# Set to 1 to recompute the result while the numbers are typed (see
+# calculator_live.py)
+LIVE_ENV = "CALCULATOR_LIVE"
+
+# Set to a .prom file to export the metrics to it every 15 s (see
+# calculator_metrics.py)
+METRICS_FILE_ENV = "CALCULATOR_METRICS_FILE"
+
+# File the watchdog appends main-loop stalls to, under user_data_dir()
+STALL_LOG_PATH = "calculator_stalls.log"
+
+# File main() keeps the calculation history in, under user_data_dir() (see
+# calculator_historylog.py)
+HISTORY_LOG_PATH = "calculator_history.log"
+
+# Set to "sqlite" to keep the history in HISTORY_DB_PATH instead (see
+# calculator_historydb.py), or to "off" to keep it in memory only
+HISTORY_BACKEND_ENV = "CALCULATOR_HISTORY"
+HISTORY_DB_PATH = "calculator_history.db"
+
+# Directory under the platform's per-user data directory for the history
+DATA_DIR_NAME = "team-five-calculator"
+
+# Paths with these suffixes are opened as SQLite history databases
+HISTORY_DB_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Filter choices of the history window (SQLite histories only)
+ALL_OPERATIONS = "All operations"
+
+
+def user_data_dir():
+    """
+    Returns the calculator's per-user data directory (not created here).
+
+    That is DATA_DIR_NAME under %APPDATA% on Windows, ~/Library/Application
+    Support on macOS and $XDG_DATA_HOME (default ~/.local/share) elsewhere.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, DATA_DIR_NAME)
+
+
+class _Untimed:
+    """Stands in for a startup profiler phase when no profiler is attached."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+_UNTIMED = _Untimed()
 
 
 # ====================================================================
-# CALCULATOR BUSINESS LOGIC
+# SPECIAL EFFECTS CLASS
 # ====================================================================
 
-class Calculator:
-    """Calculator class to handle arithmetic operations and input validation."""
-    
-    @staticmethod
-    def validate_input(value_str):
-        """
-        Validates if a string can be converted to a float.
-        
-        Args:
-            value_str (str): The string to validate
-            
-        Returns:
-            tuple: (is_valid: bool, number: float or None)
-        """
-        try:
-            number = float(value_str.strip())
-            return True, number
-        except (ValueError, AttributeError):
-            return False, None
+class SpecialEffects:
+    """Class to handle visual effects for the calculator."""
     
-    @staticmethod
-    def add(num1, num2):
-        """Performs addition operation."""
-        return num1 + num2
+    # Warning messages to cycle through
+    WARNING_MESSAGES = [
+        "⚠️ DIVISION BY ZERO! ⚠️",
+        "🚨 MATH ERROR DETECTED! 🚨", 
+        "⛔ INFINITY ALERT! ⛔",
+        "🔥 UNIVERSE BREAKING! 🔥",
+        "💀 CATASTROPHIC ERROR! 💀"
+    ]
     
-    @staticmethod
-    def subtract(num1, num2):
-        """Performs subtraction operation."""
-        return num1 - num2
+    # Color sequences for dramatic effect
+    BG_COLORS = ['#FF0000', '#FF4500', '#FFD700', '#FF6347', '#DC143C']
+    TEXT_COLORS = ['white', 'yellow', 'black', 'white', 'yellow']
+    FADE_COLORS = ['#330000', '#660000', '#990000', '#CC0000']
     
-    @staticmethod
-    def multiply(num1, num2):
-        """Performs multiplication operation."""
-        return num1 * num2
+    # Timing of the division by zero effect (milliseconds)
+    START_DELAY = 100
+    PULSE_CYCLES = 3
+    PULSE_STEP = 300
+    SHAKES = 5
+    SHAKE_STEP = 50
+    PHASE_GAP = 100
+    FINAL_HOLD = 5000
+    FADE_STEP = 200
     
     @staticmethod
-    def divide(num1, num2):
+    def division_by_zero_keyframes(root, result_label, original_bg,
+                                   original_geometry, restore):
         """
-        Performs division operation with division by zero handling.
+        Builds the keyframes of the division by zero effect.
         
         Args:
-            num1 (float): The dividend
-            num2 (float): The divisor
+            root: The main window
+            result_label: The label to animate
+            original_bg (str): Window background to fade back to
+            original_geometry (str): Window geometry the shake starts from
+            restore (dict): Label options that end the effect
             
         Returns:
-            float: The result of division
-            
-        Raises:
-            ZeroDivisionError: When attempting to divide by zero
+            list: Keyframe list for calculator_timeline.Effect
         """
-        if num2 == 0:
-            raise ZeroDivisionError("Cannot divide by zero!")
-        return num1 / num2
-
-
-# ====================================================================
-# SPECIAL EFFECTS CLASS
-# ====================================================================
-
-class SpecialEffects:
-    """Class to handle visual effects for the calculator."""
+        fonts = get_theme(root).fonts
+        keyframes = []
+        at = SpecialEffects.START_DELAY
+        
+        # The alert font is set once; later pulse steps only change colors
+        keyframes.append(Keyframe(at, result_label, {'font': fonts["alert"]}))
+        
+        # Shake offsets around the original position (skipped if the
+        # geometry cannot be parsed)
+        shake_geometries = []
+        geometry_parts = original_geometry.split('+')
+        if len(geometry_parts) >= 3:
+            try:
+                x = int(geometry_parts[1])
+                y = int(geometry_parts[2])
+                for shake in range(SpecialEffects.SHAKES):
+                    offset = (-1) ** shake
+                    shake_geometries.append(
+                        f"{geometry_parts[0]}+{x + offset * 15}+{y + offset * 8}"
+                    )
+            except ValueError:
+                pass
+        
+        # Pulse: five warnings, then a shake, three times over
+        for cycle in range(SpecialEffects.PULSE_CYCLES):
+            for message, bg_color, text_color in zip(
+                SpecialEffects.WARNING_MESSAGES,
+                SpecialEffects.BG_COLORS,
+                SpecialEffects.TEXT_COLORS
+            ):
+                keyframes.append(Keyframe(at, root, {'bg': bg_color}))
+                keyframes.append(Keyframe(at, result_label, {
+                    'background': bg_color,
+                    'foreground': text_color,
+                    'text': message
+                }))
+                at += SpecialEffects.PULSE_STEP
+            
+            for geometry in shake_geometries:
+                keyframes.append(Keyframe(at, root, {'geometry': geometry}))
+                at += SpecialEffects.SHAKE_STEP
+            if shake_geometries:
+                keyframes.append(Keyframe(at, root, {'geometry': original_geometry}))
+            at += SpecialEffects.PHASE_GAP
+        
+        # Final dramatic message, held for five seconds
+        at += SpecialEffects.PHASE_GAP
+        keyframes.append(Keyframe(at, result_label, {
+            'background': 'black',
+            'foreground': 'red',
+            'text': "🔥 DIVISION BY ZERO IS FORBIDDEN! 🔥",
+            'font': fonts["result"]
+        }))
+        keyframes.append(Keyframe(at, root, {'bg': 'black'}))
+        at += SpecialEffects.FINAL_HOLD
+        
+        # Fade back to normal, then restore the original appearance
+        for fade_color in SpecialEffects.FADE_COLORS + [original_bg]:
+            keyframes.append(Keyframe(at, root, {'bg': fade_color}))
+            at += SpecialEffects.FADE_STEP
+        at += SpecialEffects.PHASE_GAP
+        keyframes.append(Keyframe(at, root, {'bg': original_bg}))
+        keyframes.append(Keyframe(at, result_label, restore))
+        return keyframes
     
     @staticmethod
-    def division_by_zero_effect(root, result_label):
+    def division_by_zero_effect(root, result_label, timeline=None):
         """
         Creates a dramatic animated effect when division by zero occurs.
         
+        The effect plays on the window's animation timeline. Triggering it
+        again while it plays is coalesced into the running effect, so
+        repeated clicks cost no extra Tcl calls.
+        
         Args:
             root: The main window
             result_label: The label to animate
+            timeline: The window's Timeline (a private one if omitted)
         """
+        if timeline is None:
+            timeline = Timeline(root)
+        if timeline.is_playing("division_by_zero"):
+            return
+        
         # Store original values safely with defaults
         original_bg = '#f0f0f0'
         original_label_bg = 'lightyellow'
@@ -112,160 +263,40 @@ class SpecialEffects:
         except tk.TclError:
             pass  # Use defaults
         
-        # Warning messages to cycle through
-        warning_messages = [
-            "⚠️ DIVISION BY ZERO! ⚠️",
-            "🚨 MATH ERROR DETECTED! 🚨", 
-            "⛔ INFINITY ALERT! ⛔",
-            "🔥 UNIVERSE BREAKING! 🔥",
-            "💀 CATASTROPHIC ERROR! 💀"
-        ]
-        
-        # Color sequences for dramatic effect
-        bg_colors = ['#FF0000', '#FF4500', '#FFD700', '#FF6347', '#DC143C']
-        text_colors = ['white', 'yellow', 'black', 'white', 'yellow']
-        
         # Get original window position safely
         try:
             original_geometry = root.geometry()
         except tk.TclError:
-            original_geometry = "650x650+100+100"
-        
-        # Animation state
-        animation_state = {
-            'cycle': 0,
-            'step': 0,
-            'shake_count': 0,
-            'phase': 'pulse'  # pulse, final, fade, restore
+            original_geometry = "650x720+100+100"
+        
+        restore = {
+            'background': original_label_bg,
+            'foreground': original_label_fg,
+            'text': DIVISION_BY_ZERO_TEXT,
+            'font': get_theme(root).fonts["result"]
         }
         
-        def animate_step():
-            """Single animation step using root.after() for proper thread safety"""
+        def restore_now():
+            """Puts the window back when the effect is cancelled."""
             try:
-                # Check if widgets still exist
-                if not root.winfo_exists() or not result_label.winfo_exists():
-                    return
-                
-                if animation_state['phase'] == 'pulse':
-                    # Pulse effect with color changes
-                    if animation_state['cycle'] < 3:  # 3 cycles
-                        if animation_state['step'] < 5:  # 5 messages per cycle
-                            i = animation_state['step']
-                            bg_color = bg_colors[i]
-                            text_color = text_colors[i]
-                            message = warning_messages[i]
-                            
-                            # Update colors and message
-                            root.configure(bg=bg_color)
-                            result_label.configure(
-                                background=bg_color,
-                                foreground=text_color,
-                                text=message,
-                                font=("Arial", 16, "bold")
-                            )
-                            
-                            # Schedule next step
-                            animation_state['step'] += 1
-                            root.after(300, animate_step)  # 300ms delay
-                            
-                        else:
-                            # End of message cycle, start shake effect
-                            animation_state['step'] = 0
-                            animation_state['shake_count'] = 0
-                            start_shake()
-                    else:
-                        # Move to final phase
-                        animation_state['phase'] = 'final'
-                        root.after(100, animate_step)
-                
-                elif animation_state['phase'] == 'final':
-                    # Final dramatic message
-                    result_label.configure(
-                        background='black',
-                        foreground='red',
-                        text="🔥 DIVISION BY ZERO IS FORBIDDEN! 🔥",
-                        font=("Arial", 14, "bold")
-                    )
-                    root.configure(bg='black')
-                    
-                    # Wait 5 seconds as requested by user, then move to fade
-                    animation_state['phase'] = 'fade'
-                    animation_state['step'] = 0
-                    root.after(5000, animate_step)  # 5 second delay
-                
-                elif animation_state['phase'] == 'fade':
-                    # Fade back to normal
-                    fade_colors = ['#330000', '#660000', '#990000', '#CC0000', original_bg]
-                    if animation_state['step'] < len(fade_colors):
-                        fade_color = fade_colors[animation_state['step']]
-                        root.configure(bg=fade_color)
-                        animation_state['step'] += 1
-                        root.after(200, animate_step)  # 200ms per fade step
-                    else:
-                        # Move to restore phase
-                        animation_state['phase'] = 'restore'
-                        root.after(100, animate_step)
-                
-                elif animation_state['phase'] == 'restore':
-                    # Restore original appearance
-                    root.configure(bg=original_bg)
-                    result_label.configure(
-                        background=original_label_bg,
-                        foreground=original_label_fg,
-                        text="Please enter valid numbers (divisor cannot be zero)",
-                        font=("Arial", 14, "bold")
-                    )
-                    print("Division by zero animation completed!")
-                    
+                root.configure(bg=original_bg)
+                root.geometry(original_geometry)
+                result_label.configure(**restore)
             except tk.TclError:
-                # Widget was destroyed during animation
-                print("Animation stopped - window was closed")
-                return
-            except Exception as e:
-                print(f"Animation error: {e}")
-        
-        def start_shake():
-            """Start the shake effect"""
-            def shake_step():
-                try:
-                    if not root.winfo_exists() or animation_state['shake_count'] >= 5:
-                        # End shake, return to original position and continue with next cycle
-                        try:
-                            root.geometry(original_geometry)
-                        except tk.TclError:
-                            pass
-                        animation_state['cycle'] += 1
-                        animation_state['step'] = 0
-                        animation_state['shake_count'] = 0
-                        root.after(100, animate_step)
-                        return
-                    
-                    # Parse current geometry for shake effect
-                    try:
-                        geometry_parts = original_geometry.split('+')
-                        if len(geometry_parts) >= 3:
-                            x = int(geometry_parts[1])
-                            y = int(geometry_parts[2])
-                            
-                            # Create shake offset
-                            shake_x = x + ((-1) ** animation_state['shake_count']) * 15
-                            shake_y = y + ((-1) ** animation_state['shake_count']) * 8
-                            
-                            root.geometry(f"{geometry_parts[0]}+{shake_x}+{shake_y}")
-                    except (ValueError, tk.TclError):
-                        pass  # Skip this shake if geometry parsing fails
-                    
-                    animation_state['shake_count'] += 1
-                    root.after(50, shake_step)  # 50ms shake interval
-                    
-                except tk.TclError:
-                    return
-            
-            shake_step()
+                pass  # Window already closed
+        
+        effect = Effect(
+            "division_by_zero",
+            SpecialEffects.division_by_zero_keyframes(
+                root, result_label, original_bg, original_geometry, restore
+            ),
+            on_finish=lambda: log.info("Division by zero effect finished"),
+            on_cancel=restore_now
+        )
         
         # Start the animation
-        print("Starting division by zero visual effect...")
-        root.after(100, animate_step)  # Start after 100ms
+        log.info("Division by zero effect started")
+        timeline.play(effect)
 
 
 # ====================================================================
@@ -275,8 +306,72 @@ class SpecialEffects:
 class CalculatorApp:
     """Main calculator application class for better organization."""
     
-    def __init__(self):
-        """Initialize the calculator application."""
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE, backend="float",
+                 async_mode=False, frame_timing=False, stall_watchdog=False,
+                 lazy=False, profiler=None, history_path=None, live=False,
+                 live_debounce_ms=None, metrics_path=None):
+        """
+        Initialize the calculator application.
+        
+        Args:
+            cache_size (int): Entries kept in the result cache; 0 disables it
+            backend (str): Numeric backend - "float", "decimal", "fraction"
+                or "auto" (see calculator_backends.py)
+            async_mode (bool): Run calculations on a worker thread instead of
+                inside the button callback (see calculator_worker.py)
+            frame_timing (bool): Record the timing of every root.after()
+                callback and add a Diagnostics menu (see
+                calculator_frametiming.py)
+            stall_watchdog (bool): Watch the main loop from a background
+                thread and log stalls with the blocking stack to
+                STALL_LOG_PATH in user_data_dir() (see calculator_watchdog.py)
+            lazy (bool): Leave building the window to build() or run()
+            profiler: StartupProfiler that times the build phases (see
+                calculator_startup.py)
+            history_path: Log file (or, with a HISTORY_DB_SUFFIXES suffix,
+                SQLite database) that keeps the history across restarts;
+                None keeps it in memory only
+            live (bool): Recompute the result with the last operation while
+                the numbers are typed (see calculator_live.py)
+            live_debounce_ms (int): Quiet time after a keystroke before a
+                live recompute; None uses LIVE_DEBOUNCE_MS
+            metrics_path: Prometheus textfile the metrics are written to
+                every METRICS_EXPORT_INTERVAL; None only keeps them in the
+                app (see calculator_metrics.py)
+        """
+        self.result_cache = ResultCache(cache_size)
+        self.backend = get_backend(backend)
+        self.metrics = CalculatorMetrics()
+        self.metrics_exporter = None
+        if metrics_path is not None:
+            from calculator_metrics import MetricsExporter
+            self.metrics_exporter = MetricsExporter(self.metrics.registry,
+                                                    metrics_path).start()
+        self.worker = None
+        self._worker_poll_id = None
+        if async_mode:
+            from calculator_worker import CalculationWorker
+            self.worker = CalculationWorker()
+        self.frame_timing = frame_timing
+        self.frame_timer = None
+        self.stall_watchdog = stall_watchdog
+        self.watchdog = None
+        self.profiler = profiler
+        self.built = False
+        self.history = self.open_history(history_path)
+        self._history_flush_id = None
+        self.history_window = None
+        self.history_panel = None
+        self.history_filter = None
+        self._history_query = None      # Filter running on the writer thread
+        self.live = live
+        self.live_debounce_ms = live_debounce_ms
+        self.live_debouncer = None
+        self.live_counts = None
+        self.live_operation = ("Addition", Calculator.add)
+        self._live_key = None
+        self._live_generation = 0
+        
         # Initialize all attributes properly to avoid type checking issues
         self.root: tk.Tk
         self.num1_var: tk.StringVar
@@ -285,55 +380,286 @@ class CalculatorApp:
         self.result_label: ttk.Label
         self.num1_entry: ttk.Entry
         self.num2_entry: ttk.Entry
+        self.expression_var: tk.StringVar
         
         # Create the application
-        self._initialize_app()
+        if not lazy:
+            self.build()
         
-    def _initialize_app(self):
-        """Initialize the complete application."""
+    def build(self):
+        """Builds the window and its widgets; does nothing once built."""
+        if self.built:
+            return
         self.create_main_window()
-        self.setup_variables()
+        with self._phase("variables"):
+            self.setup_variables()
         self.create_ui()
+        if self.live:
+            self.setup_live()
+        self.built = True
+        
+    def _phase(self, name):
+        """Times a build phase when a startup profiler is attached."""
+        if self.profiler is None:
+            return _UNTIMED
+        return self.profiler.phase(name)
         
     def create_main_window(self):
         """Creates and configures the main application window."""
-        self.root = tk.Tk()
+        with self._phase("tk_init"):
+            self.root = tk.Tk()
+        if self.frame_timing:
+            from calculator_frametiming import FrameTimer
+            self.frame_timer = FrameTimer(self.root).install()
+        if self.stall_watchdog:
+            with self._phase("watchdog"):
+                from calculator_watchdog import StallWatchdog
+                self.watchdog = StallWatchdog(
+                    self.root, log_path=os.path.join(user_data_dir(), STALL_LOG_PATH)
+                ).start()
+        self.timeline = Timeline(self.root)
+        with self._phase("theme"):
+            self.fonts = get_theme(self.root).fonts
         self.root.title("Enhanced Calculator with Division - Breakout #2")
-        self.root.geometry("650x650")
+        self.root.geometry("650x720")
         self.root.resizable(False, False)
         self.root.eval('tk::PlaceWindow . center')
         self.root.configure(bg='#f0f0f0')
         
         # Create menu bar
-        self.create_menu()
+        with self._phase("menu"):
+            self.create_menu()
         
         # Bind Escape key to exit
         self.root.bind('<Escape>', lambda event: self.safe_exit())
+        # Closing the window also goes through safe_exit (history, threads)
+        self.root.protocol("WM_DELETE_WINDOW", self.safe_exit)
+        self.root.bind('<Control-h>', lambda event: self.show_history())
         
     def create_menu(self):
-        """Creates the menu bar."""
+        """
+        Creates the menu bar.
+        
+        Only the menu bar and its empty menus are built at startup; each
+        menu's items are added the first time it opens (see fill_menu_once).
+        """
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.configure(postcommand=partial(self.fill_menu_once, file_menu,
+                                                self.fill_file_menu))
         menubar.add_cascade(label="File", menu=file_menu)
         
-        file_menu.add_command(label="Exit", command=self.safe_exit, accelerator="Esc")
-        file_menu.add_separator()
-        file_menu.add_command(
-            label="About", 
-            command=lambda: messagebox.showinfo(
-                "About", 
-                "Enhanced Calculator v2.0\\nTeam Five\\n\\nFeatures auto-clear and special effects!"
+        # View menu
+        view_menu = tk.Menu(menubar, tearoff=0)
+        view_menu.configure(postcommand=partial(self.fill_menu_once, view_menu,
+                                                self.fill_view_menu))
+        menubar.add_cascade(label="View", menu=view_menu)
+        
+        # Diagnostics menu (metrics are always kept)
+        diagnostics_menu = tk.Menu(menubar, tearoff=0)
+        diagnostics_menu.configure(postcommand=partial(
+            self.fill_menu_once, diagnostics_menu, self.fill_diagnostics_menu
+        ))
+        menubar.add_cascade(label="Diagnostics", menu=diagnostics_menu)
+    
+    def fill_menu_once(self, menu, fill):
+        """Menu postcommand: adds the menu's items when it opens for the first time."""
+        menu.configure(postcommand="")
+        fill(menu)
+    
+    def fill_file_menu(self, menu):
+        """Adds the File menu items."""
+        menu.add_command(label="Exit", command=self.safe_exit, accelerator="Esc")
+        menu.add_separator()
+        menu.add_command(label="About", command=self.show_about)
+    
+    def fill_view_menu(self, menu):
+        """Adds the View menu items."""
+        menu.add_command(label="History", command=self.show_history,
+                         accelerator="Ctrl+H")
+    
+    def fill_diagnostics_menu(self, menu):
+        """Adds the Diagnostics menu items."""
+        menu.add_command(label="Metrics...", command=self.show_metrics)
+        if self.frame_timer is not None:
+            menu.add_command(label="Frame Timing...", command=self.show_frame_timing)
+            menu.add_command(label="Save Frame Timing...", command=self.save_frame_timing)
+        if self.watchdog is not None:
+            menu.add_command(label="Main-loop Stalls...", command=self.show_stalls)
+    
+    def show_about(self):
+        """Shows the About dialog."""
+        from tkinter import messagebox
+        messagebox.showinfo(
+            "About", 
+            "Enhanced Calculator v2.0\\nTeam Five\\n\\nFeatures auto-clear and special effects!"
+        )
+    
+    def show_history(self):
+        """Opens the history window, or raises it if it is open."""
+        if self.history_window is not None:
+            self.history_window.deiconify()
+            self.history_window.lift()
+            return
+        
+        from calculator_history import HistoryPanel
+        self.history_window = tk.Toplevel(self.root)
+        self.history_window.title("Calculation History")
+        self.history_window.protocol("WM_DELETE_WINDOW", self.close_history)
+        self.history_filter = None
+        if hasattr(self.history, "filtered"):
+            # Indexed queries can narrow a database history to one operation
+            self.history_filter = ttk.Combobox(
+                self.history_window,
+                values=[ALL_OPERATIONS, "Addition", "Subtraction",
+                        "Multiplication", "Division"],
+                state="readonly"
+            )
+            self.history_filter.set(ALL_OPERATIONS)
+            self.history_filter.bind(
+                "<<ComboboxSelected>>",
+                lambda event: self.filter_history(self.history_filter.get())
             )
+            self.history_filter.pack(fill=tk.X, padx=10, pady=(10, 0))
+        self.history_panel = HistoryPanel(
+            self.history_window, self.history, font=self.fonts["history"]
+        )
+        self.history_panel.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        ttk.Button(
+            self.history_window,
+            text="Clear History",
+            command=self.clear_history
+        ).pack(pady=(0, 10))
+    
+    def close_history(self):
+        """Closes the history window; the history itself is kept."""
+        self.history_window.destroy()
+        self.history_window = None
+        self.history_panel = None
+        self.history_filter = None
+        self._history_query = None
+    
+    def filter_history(self, op_name):
+        """Shows the stored entries of one operation, or the whole history."""
+        self._history_query = None
+        if op_name == ALL_OPERATIONS:
+            self.show_filtered_history(self.history)
+            return
+        # The writer thread commits the entries still queued first, so none
+        # are missing; the Tk thread only polls for the result
+        self._history_query = self.history.filtered_later(op=op_name)
+        self.root.after(HISTORY_FILTER_POLL_MS, self.poll_history_query,
+                        self._history_query)
+    
+    def poll_history_query(self, query):
+        """Shows a filtered history once the writer thread has built it."""
+        if query is not self._history_query or self.history_panel is None:
+            return  # Another filter was chosen, or the window was closed
+        if not query.done():
+            self.root.after(HISTORY_FILTER_POLL_MS, self.poll_history_query, query)
+            return
+        self._history_query = None
+        if query.error is not None:
+            log.warning("History filter failed", error=repr(query.error))
+            return
+        self.show_filtered_history(query.view)
+    
+    def show_filtered_history(self, history):
+        """Points the history panel at history (a filtered view or the whole)."""
+        self.history_panel.history = history
+        self.history_panel.scroll_to(len(history))
+    
+    def clear_history(self):
+        """Clears the whole history, whatever the panel is filtered to."""
+        if self.history_filter is not None:
+            self.history_filter.set(ALL_OPERATIONS)
+            self._history_query = None
+            self.history_panel.history = self.history
+        self.history_panel.clear()
+    
+    def open_history(self, path):
+        """Returns the persistent history at path, or an in-memory one."""
+        if path is None:
+            return CalculationHistory()
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        except OSError as e:
+            log.warning("History directory unavailable, keeping history in memory",
+                        error=repr(e))
+            return CalculationHistory()
+        if str(path).endswith(HISTORY_DB_SUFFIXES):
+            import sqlite3
+            from calculator_historydb import SQLiteHistory
+            try:
+                return SQLiteHistory(path)
+            except sqlite3.Error as e:
+                log.warning("History database unavailable, keeping history in memory",
+                            error=repr(e))
+                return CalculationHistory()
+        from calculator_historylog import HistoryLogError, PersistentHistory
+        try:
+            return PersistentHistory(path)
+        except (OSError, HistoryLogError) as e:
+            log.warning("History log unavailable, keeping history in memory",
+                        error=repr(e))
+            return CalculationHistory()
+    
+    def record_history(self, op_name, num1, num2, result):
+        """Adds a successful calculation to the history (and its panel, if open)."""
+        self.history.append(op_name, num1, num2, result)
+        if self.history_panel is not None:
+            self.history_panel.notify_appended()
+        self.schedule_history_flush()
+    
+    def schedule_history_flush(self):
+        """Batches history writes: one flush per HISTORY_FLUSH_MS at most."""
+        if self._history_flush_id is None and self.history.pending:
+            from calculator_historylog import HISTORY_FLUSH_MS
+            self._history_flush_id = self.root.after(HISTORY_FLUSH_MS, self.flush_history)
+    
+    def flush_history(self):
+        """Hands buffered history entries to the history's writer thread."""
+        self._history_flush_id = None
+        self.history.flush()
+    
+    def show_metrics(self):
+        """Opens the metrics window."""
+        from calculator_metrics import show_metrics
+        show_metrics(self.root, self.metrics.registry)
+    
+    def show_frame_timing(self):
+        """Opens the live frame timing window."""
+        from calculator_frametiming import show_diagnostics
+        show_diagnostics(self.root, self.frame_timer)
+    
+    def show_stalls(self):
+        """Opens the list of recent main-loop stalls."""
+        from calculator_watchdog import show_stalls
+        show_stalls(self.root, self.watchdog)
+    
+    def save_frame_timing(self):
+        """Asks for a file and writes the frame timing report (JSON or text)."""
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(
+            parent=self.root,
+            title="Save Frame Timing",
+            initialfile="frame_timing.json",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("Text", "*.txt")],
         )
+        if path:
+            self.frame_timer.write_report(path)
+            log.info("Frame timing saved", path=path)
     
     def setup_variables(self):
         """Creates StringVar objects for data binding."""
         self.num1_var = tk.StringVar()
         self.num2_var = tk.StringVar()
         self.result_var = tk.StringVar(value="Result will appear here")
+        self.expression_var = tk.StringVar()
     
     def create_ui(self):
         """Creates the main user interface."""
@@ -342,35 +668,42 @@ class CalculatorApp:
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title section
-        self.create_title_section(main_frame)
+        with self._phase("ui.title"):
+            self.create_title_section(main_frame)
         
         # Input section
-        self.create_input_section(main_frame)
+        with self._phase("ui.input"):
+            self.create_input_section(main_frame)
         
         # Button section
-        self.create_button_section(main_frame)
+        with self._phase("ui.buttons"):
+            self.create_button_section(main_frame)
+        
+        # Expression section
+        with self._phase("ui.expression"):
+            self.create_expression_section(main_frame)
         
         # Result section
-        self.create_result_section(main_frame)
+        with self._phase("ui.result"):
+            self.create_result_section(main_frame)
         
         # Utility buttons
-        self.create_utility_section(main_frame)
+        with self._phase("ui.utility"):
+            self.create_utility_section(main_frame)
     
     def create_title_section(self, parent):
         """Creates the title section."""
         title_label = ttk.Label(
             parent,
             text="Enhanced Calculator with Division",
-            font=("Arial", 18, "bold"),
-            foreground="darkblue"
+            style="Title.TLabel"
         )
         title_label.pack(pady=(0, 20))
         
         subtitle_label = ttk.Label(
             parent,
             text="⚠️ Warning: Division by zero triggers special effects! ⚠️",
-            font=("Arial", 10, "italic"),
-            foreground="red"
+            style="Warning.TLabel"
         )
         subtitle_label.pack(pady=(0, 15))
     
@@ -380,11 +713,11 @@ class CalculatorApp:
         num1_frame = ttk.Frame(parent)
         num1_frame.pack(pady=10, fill=tk.X)
         
-        ttk.Label(num1_frame, text="First Number:", font=("Arial", 12, "bold")).pack(side=tk.LEFT)
+        ttk.Label(num1_frame, text="First Number:", style="Field.TLabel").pack(side=tk.LEFT)
         self.num1_entry = ttk.Entry(
             num1_frame,
             textvariable=self.num1_var,
-            font=("Arial", 12),
+            font=self.fonts["entry"],
             width=15,
             justify='center'
         )
@@ -394,11 +727,11 @@ class CalculatorApp:
         num2_frame = ttk.Frame(parent)
         num2_frame.pack(pady=10, fill=tk.X)
         
-        ttk.Label(num2_frame, text="Second Number:", font=("Arial", 12, "bold")).pack(side=tk.LEFT)
+        ttk.Label(num2_frame, text="Second Number:", style="Field.TLabel").pack(side=tk.LEFT)
         self.num2_entry = ttk.Entry(
             num2_frame,
             textvariable=self.num2_var,
-            font=("Arial", 12),
+            font=self.fonts["entry"],
             width=15,
             justify='center'
         )
@@ -455,10 +788,37 @@ class CalculatorApp:
         ttk.Label(
             warning_frame,
             text="💀 Beware: Dividing by zero unleashes chaos! 💀",
-            font=("Arial", 9, "italic"),
-            foreground="darkred"
+            style="Note.TLabel"
         ).pack()
     
+    def create_expression_section(self, parent):
+        """Creates the expression mode section (a and b are the two numbers)."""
+        expression_frame = ttk.Frame(parent)
+        expression_frame.pack(pady=5, fill=tk.X)
+        
+        ttk.Label(
+            expression_frame,
+            text="Expression (a, b):",
+            style="Field.TLabel"
+        ).pack(side=tk.LEFT)
+        
+        ttk.Button(
+            expression_frame,
+            text="Evaluate 🧮",
+            command=self.evaluate_expression,
+            width=12
+        ).pack(side=tk.RIGHT, padx=(5, 0))
+        
+        expression_entry = ttk.Entry(
+            expression_frame,
+            textvariable=self.expression_var,
+            font=self.fonts["entry"],
+            width=22,
+            justify='center'
+        )
+        expression_entry.pack(side=tk.RIGHT)
+        expression_entry.bind('<Return>', lambda event: self.evaluate_expression())
+    
     def create_result_section(self, parent):
         """Creates the result display section."""
         separator = ttk.Separator(parent, orient='horizontal')
@@ -468,7 +828,7 @@ class CalculatorApp:
         self.result_label = ttk.Label(
             parent,
             textvariable=self.result_var,
-            font=("Arial", 14, "bold"),
+            font=self.fonts["result"],
             foreground="darkgreen",
             background="lightyellow",
             padding=15,
@@ -496,42 +856,282 @@ class CalculatorApp:
             width=18
         ).pack(side=tk.LEFT, padx=5)
     
+    @timed_callback("perform_calculation")
     def perform_calculation(self, operation_name, operation_func):
         """Generic function to perform calculations with error handling."""
+        started = time.perf_counter()
+        if self.live_debouncer is not None:
+            # Live results follow this operation; one in flight is now stale
+            self.live_operation = (operation_name, operation_func)
+            self.live_debouncer.cancel()
+            self._live_key = None
+            self._live_generation += 1
+        
         num1_str = self.num1_var.get()
         num2_str = self.num2_var.get()
         
         # Validate inputs
-        is_valid1, num1 = Calculator.validate_input(num1_str)
-        is_valid2, num2 = Calculator.validate_input(num2_str)
+        is_valid1, num1 = self.backend.parse(num1_str)
+        is_valid2, num2 = self.backend.parse(num2_str)
         
         if not is_valid1 or not is_valid2:
-            self.result_var.set("Please enter valid numbers.")
+            self.metrics.validation_failures.inc()
+            self.result_var.set(INVALID_INPUT_TEXT)
             return
         
-        try:
-            result = operation_func(num1, num2)
-            
-            # Format result
-            if result.is_integer():
-                result_text = f"Result: {int(result)}"
-            else:
-                result_text = f"Result: {result:.6f}".rstrip('0').rstrip('.')
-            
+        cache_key = (operation_name, num1, num2)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            self.metrics.cache_hits.inc()
+            self.finish_calculation(cache_key, cached, None, started)
+            return
+        self.metrics.cache_misses.inc()
+        
+        self.run_calculation(
+            partial(self.finish_calculation, cache_key, started=started),
+            self.calculate_and_format,
+            self.backend.prepare(operation_func), num1, num2
+        )
+    
+    def calculate_and_format(self, calculate, *operands):
+        """Computes and formats a result; safe to run on the worker thread."""
+        result = calculate(*operands)
+        return result, self.backend.format(result)
+    
+    def finish_calculation(self, cache_key, outcome, error, started=None):
+        """
+        Shows the outcome of a calculation; always runs on the Tk thread.
+        
+        Args:
+            cache_key (tuple): (operation_name, num1, num2)
+            outcome (tuple): (result, result_text), or None on error
+            error (Exception): The error raised, or None on success
+            started (float): time.perf_counter() at the click, for the
+                operation duration metric
+        """
+        operation_name, num1, num2 = cache_key
+        
+        if error is None:
+            self.metrics.calculations.labels(operation_name).inc()
+            result, result_text = outcome
+            # Only successful results are cached, never division by zero
+            self.result_cache.put(cache_key, result, result_text)
             self.result_var.set(result_text)
-            print(f"{operation_name}: {num1} and {num2} = {result}")
+            self.record_history(operation_name, num1, num2, result)
+            if log.enabled(INFO):
+                log.info("Calculated", op=operation_name, num1=num1, num2=num2,
+                         result=result)
             
             # Clear input boxes after successful operation
             self.clear_inputs_and_focus()
             
-        except ZeroDivisionError:
+        elif isinstance(error, ZeroDivisionError):
             # Trigger the special division by zero effect
-            print("Division by zero detected - triggering special effect!")
-            SpecialEffects.division_by_zero_effect(self.root, self.result_label)
+            self.metrics.division_by_zero.inc()
+            if log.enabled(INFO):
+                log.info("Division by zero", op=operation_name, num1=num1)
+            SpecialEffects.division_by_zero_effect(
+                self.root, self.result_label, self.timeline
+            )
             
-        except Exception as e:
+        else:
+            self.metrics.errors.labels(operation_name).inc()
             self.result_var.set("Error in calculation.")
-            print(f"Calculation error: {e}")
+            log.warning("Calculation failed", op=operation_name, error=repr(error))
+        
+        if started is not None:
+            self.metrics.operation_seconds.labels(operation_name).observe(
+                time.perf_counter() - started
+            )
+    
+    def run_calculation(self, callback, func, *args):
+        """
+        Runs func(*args) and hands (result, error) to callback.
+        
+        Without a worker both happen right away. In async mode func runs on
+        the worker thread, and callback is invoked on the Tk thread once the
+        poll loop drains the result; a newer request supersedes this one.
+        """
+        if self.worker is None:
+            try:
+                result = func(*args)
+            except Exception as e:
+                callback(None, e)
+            else:
+                callback(result, None)
+            return
+        
+        self.worker.submit(callback, func, *args)
+        self.schedule_worker_poll()
+    
+    def schedule_worker_poll(self):
+        """Schedules the next drain of the worker's result queue."""
+        if self._worker_poll_id is None:
+            self._worker_poll_id = self.root.after(WORKER_POLL_MS, self.poll_worker)
+    
+    def poll_worker(self):
+        """Delivers finished worker results; keeps polling while work is pending."""
+        self._worker_poll_id = None
+        for callback, result, error in self.worker.drain(WORKER_DRAIN_LIMIT):
+            callback(result, error)
+        if self.worker.busy:
+            self.schedule_worker_poll()
+    
+    def setup_live(self):
+        """Recomputes the result (debounced) whenever either number changes."""
+        from calculator_live import LIVE_DEBOUNCE_MS, Debouncer, LiveCounts
+        
+        delay_ms = self.live_debounce_ms
+        if delay_ms is None:
+            delay_ms = LIVE_DEBOUNCE_MS
+        self.live_counts = LiveCounts()
+        self.live_debouncer = Debouncer(self.root, delay_ms, self.live_recompute)
+        for value_var in (self.num1_var, self.num2_var):
+            value_var.trace_add("write", self.on_number_typed)
+    
+    def on_number_typed(self, *trace_args):
+        """StringVar write trace: restarts the live debounce."""
+        self.live_counts.triggers += 1
+        self.live_debouncer.trigger()
+    
+    @timed_callback("live_recompute")
+    def live_recompute(self):
+        """
+        Recomputes the result with the live operation, unless the parsed
+        numbers are the ones last computed. Empty numbers leave the result
+        as it is (inputs are cleared after every button calculation).
+        """
+        num1_str = self.num1_var.get()
+        num2_str = self.num2_var.get()
+        if not num1_str.strip() or not num2_str.strip():
+            self._live_key = None
+            return
+        
+        is_valid1, num1 = self.backend.parse(num1_str)
+        is_valid2, num2 = self.backend.parse(num2_str)
+        if not is_valid1 or not is_valid2:
+            self._live_key = None
+            self.show_live_text(INVALID_INPUT_TEXT)
+            return
+        
+        operation_name, operation_func = self.live_operation
+        cache_key = (operation_name, num1, num2)
+        if cache_key == self._live_key:
+            self.live_counts.unchanged += 1
+            return
+        self._live_key = cache_key
+        self._live_generation += 1
+        self.live_counts.recomputed += 1
+        
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            self.metrics.cache_hits.inc()
+            self.finish_live(self._live_generation, cache_key, cached, None)
+            return
+        self.metrics.cache_misses.inc()
+        
+        self.run_calculation(
+            partial(self.finish_live, self._live_generation, cache_key),
+            self.calculate_and_format,
+            self.backend.prepare(operation_func), num1, num2
+        )
+    
+    def finish_live(self, generation, cache_key, outcome, error):
+        """
+        Shows a live result; drops it if a newer recompute (or a button)
+        has started since. Live results neither clear the numbers nor go
+        into the history, and division by zero only shows its message.
+        """
+        if generation != self._live_generation:
+            self.live_counts.stale += 1
+            return
+        
+        if error is None:
+            result, result_text = outcome
+            self.result_cache.put(cache_key, result, result_text)
+            self.show_live_text(result_text)
+        elif isinstance(error, ZeroDivisionError):
+            self.show_live_text(DIVISION_BY_ZERO_TEXT)
+        else:
+            self.show_live_text("Error in calculation.")
+    
+    def show_live_text(self, text):
+        """Sets the result text unless it is already showing."""
+        if text != self.result_var.get():
+            self.result_var.set(text)
+            self.live_counts.painted += 1
+    
+    @timed_callback("evaluate_expression")
+    def evaluate_expression(self):
+        """
+        Evaluates the expression entry, e.g. "(a + b) * 2 / b".
+        
+        The variables a and b take the First and Second Number values. The
+        expression is compiled once and cached by its text, so re-evaluating
+        it with new numbers skips parsing.
+        """
+        started = time.perf_counter()
+        from calculator_expression import ExpressionError, compile_expression
+        
+        try:
+            expression = compile_expression(self.expression_var.get(), self.backend)
+        except ExpressionError as e:
+            self.result_var.set(str(e))
+            return
+        
+        unknown = [name for name in expression.variables if name not in ("a", "b")]
+        if unknown:
+            self.result_var.set(f"Unknown variable: {', '.join(unknown)} (use a and b)")
+            return
+        
+        bindings = {}
+        for name, value_var in (("a", self.num1_var), ("b", self.num2_var)):
+            if name in expression.variables:
+                is_valid, number = self.backend.parse(value_var.get())
+                if not is_valid:
+                    self.metrics.validation_failures.inc()
+                    self.result_var.set(INVALID_INPUT_TEXT)
+                    return
+                bindings[name] = number
+        
+        self.run_calculation(
+            partial(self.finish_expression, expression, bindings, started=started),
+            self.calculate_and_format,
+            expression.evaluate, bindings
+        )
+    
+    def finish_expression(self, expression, bindings, outcome, error, started=None):
+        """Shows the outcome of an expression; always runs on the Tk thread."""
+        if error is None:
+            self.metrics.calculations.labels("expression").inc()
+            result, result_text = outcome
+            self.result_var.set(result_text)
+            self.record_history(
+                expression.source,
+                bindings.get("a", math.nan), bindings.get("b", math.nan), result
+            )
+            if log.enabled(INFO):
+                log.info("Evaluated", expression=expression.source, **bindings,
+                         result=result)
+            
+        elif isinstance(error, ZeroDivisionError):
+            self.metrics.division_by_zero.inc()
+            if log.enabled(INFO):
+                log.info("Division by zero", expression=expression.source)
+            SpecialEffects.division_by_zero_effect(
+                self.root, self.result_label, self.timeline
+            )
+            
+        else:
+            self.metrics.errors.labels("expression").inc()
+            self.result_var.set("Error in calculation.")
+            log.warning("Evaluation failed", expression=expression.source,
+                        error=repr(error))
+        
+        if started is not None:
+            self.metrics.operation_seconds.labels("expression").observe(
+                time.perf_counter() - started
+            )
     
     def clear_inputs_and_focus(self):
         """Clears input fields and returns focus to first field."""
@@ -555,8 +1155,18 @@ class CalculatorApp:
         """Performs division operation."""
         self.perform_calculation("Division", Calculator.divide)
     
+    @timed_callback("clear_all")
     def clear_all(self):
         """Clears all input fields and result display."""
+        # A calculation still in flight must not overwrite the cleared display
+        if self.worker is not None:
+            self.worker.cancel()
+        if self.live_debouncer is not None:
+            self._live_key = None
+            self._live_generation += 1
+        # A running effect is stopped before the display is reset
+        self.timeline.cancel_all()
+        
         self.num1_var.set("")
         self.num2_var.set("")
         self.result_var.set("Result will appear here")
@@ -568,15 +1178,25 @@ class CalculatorApp:
             self.result_label.configure(
                 background="lightyellow",
                 foreground="darkgreen",
-                font=("Arial", 14, "bold")
+                font=self.fonts["result"]
             )
         except tk.TclError:
             pass
-        print("All fields cleared")
+        log.info("All fields cleared")
     
     def safe_exit(self):
         """Safely exits the application."""
-        print("Closing Enhanced Calculator...")
+        log.info("Closing Enhanced Calculator")
+        if self.worker is not None:
+            self.worker.shutdown()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.stop()
+        try:
+            self.history.close()
+        except OSError as e:
+            log.error("Could not close the history", error=repr(e))
         try:
             self.root.quit()
             self.root.destroy()
@@ -591,10 +1211,8 @@ class CalculatorApp:
         print("🎭 Get ready for a show if you try to divide by zero!")
         print("=" * 60)
         
-        # Create and configure the application
-        self.create_main_window()
-        self.setup_variables()
-        self.create_ui()
+        # Create the application unless it was built already
+        self.build()
         
         print("Enhanced Calculator application ready!")
         print("Features:")
@@ -618,8 +1236,25 @@ class CalculatorApp:
 
 def main():
     """Main function that creates and runs the enhanced calculator application."""
-    app = CalculatorApp()
-    app.root.mainloop()
+    setup_logging()
+    history_backend = os.environ.get(HISTORY_BACKEND_ENV)
+    history_path = None
+    if history_backend != "off":
+        history_path = os.path.join(
+            user_data_dir(),
+            HISTORY_DB_PATH if history_backend == "sqlite" else HISTORY_LOG_PATH)
+    app = CalculatorApp(
+        frame_timing=os.environ.get(FRAME_TIMING_ENV) == "1",
+        stall_watchdog=os.environ.get(WATCHDOG_ENV) != "0",
+        live=os.environ.get(LIVE_ENV) == "1",
+        metrics_path=os.environ.get(METRICS_FILE_ENV),
+        lazy=True,
+        history_path=history_path,
+    )
+    try:
+        app.run()
+    finally:
+        shutdown_logging()
 
 
 # ====================================================================
@@ -0,0 +1,394 @@
+"""
+Numeric Backends - float, Decimal and Fraction arithmetic for the calculator
+Author: Team Five
+
+Description:
+Calculator forces every operand through float(), so large integers lose
+precision and decimal money values drift. A backend decides how operand
+strings are parsed, how an operation is carried out and how the result is
+formatted:
+
+    float     - the original behaviour and the fastest path
+    decimal   - exact decimal +, -, * (money values never drift); division
+                rounds to a configurable number of significant digits
+    fraction  - exact rational arithmetic, big integers included
+    auto      - stays on float while the inputs and the result are exactly
+                representable as floats, and switches to Fraction only for
+                the operations where float would round
+
+Backends are tkinter-free and plug into CalculatorApp and calculator_cli.py.
+"""
+
+import decimal
+import math
+from decimal import Decimal
+from fractions import Fraction
+
+from calculator_core import Calculator, format_result
+
+
+# Significant digits kept by DecimalBackend when a quotient does not terminate
+DEFAULT_DECIMAL_PRECISION = 28
+
+# Integers with at most this many digits are always exact as floats
+_SAFE_INTEGER_DIGITS = 15
+
+# Largest decimal exponent and most digits an exact operand may have; a
+# bigger one is invalid input (10**99999999 alone takes minutes to build)
+MAX_EXACT_EXPONENT = 10_000
+MAX_EXACT_DIGITS = 1000
+
+# Exact results from 10**EXACT_FULL_DIGITS up are shown in scientific
+# notation (no float result has more than 309 integer digits)
+EXACT_FULL_DIGITS = 400
+
+_MAX_EXACT_BITS = math.ceil(MAX_EXACT_DIGITS * math.log2(10))
+_SCIENTIFIC_FROM = 10 ** EXACT_FULL_DIGITS
+
+
+# ====================================================================
+# EXACT RESULT FORMATTING
+# ====================================================================
+
+def format_exact(result):
+    """
+    Formats a Decimal or Fraction result with the float display rules.
+
+    Whole numbers are shown in full (no float rounding of big integers) up
+    to EXACT_FULL_DIGITS digits, and in scientific notation with seven
+    significant digits beyond; anything else is rounded exactly to six
+    decimal places with trailing zeros stripped. Infinite and NaN Decimals
+    are shown as float would.
+
+    Args:
+        result (Decimal or Fraction): The calculation result
+
+    Returns:
+        str: The display text, e.g. "Result: 12345678901234567890"
+    """
+    if isinstance(result, Decimal) and not result.is_finite():
+        return format_result(float(result))
+    if abs(result) >= _SCIENTIFIC_FROM:
+        return _format_scientific(result)
+
+    scaled = round(Fraction(result) * 1_000_000)
+    whole, fraction = divmod(abs(scaled), 1_000_000)
+    sign = "-" if scaled < 0 else ""
+    if fraction == 0:
+        return f"Result: {sign}{whole}"
+    return f"Result: {sign}{whole}.{fraction:06d}".rstrip('0')
+
+
+def _format_scientific(result):
+    """Formats a huge exact result as e.g. "Result: 1.234568e+5000"."""
+    with decimal.localcontext() as context:
+        context.prec = 7
+        if isinstance(result, Fraction):
+            value = Decimal(result.numerator) / result.denominator
+        else:
+            value = +result
+    mantissa, exponent = f"{value:.6e}".split("e")
+    if "." in mantissa:
+        mantissa = mantissa.rstrip("0").rstrip(".")
+    return f"Result: {mantissa}e{exponent}"
+
+
+def _in_exact_range(number):
+    """
+    True when an exact operand is small enough to calculate with.
+
+    Args:
+        number (Decimal or Fraction): A parsed operand
+
+    Returns:
+        bool: False for more than MAX_EXACT_DIGITS digits or a decimal
+            exponent beyond MAX_EXACT_EXPONENT
+    """
+    if isinstance(number, Fraction):
+        return (number.numerator.bit_length() <= _MAX_EXACT_BITS
+                and number.denominator.bit_length() <= _MAX_EXACT_BITS)
+    if not number.is_finite() or not number:
+        return True
+    return (abs(number.adjusted()) <= MAX_EXACT_EXPONENT
+            and len(number.as_tuple().digits) <= MAX_EXACT_DIGITS)
+
+
+def _parse_decimal(text):
+    """Returns text as a Decimal, or None if Decimal does not accept it."""
+    try:
+        return Decimal(text)
+    except decimal.InvalidOperation:
+        return None
+
+
+# ====================================================================
+# BACKENDS
+# ====================================================================
+
+class FloatBackend:
+    """The original float arithmetic; every call goes straight through."""
+
+    name = "float"
+
+    # The original code path is reused as-is, without wrapper calls
+    parse = staticmethod(Calculator.validate_input)
+    format = staticmethod(format_result)
+
+    def prepare(self, operation_func):
+        """Returns the callable that performs operation_func on this backend."""
+        return operation_func
+
+
+class DecimalBackend(FloatBackend):
+    """Decimal arithmetic: exact +, -, * and precision-bounded division."""
+
+    name = "decimal"
+
+    def __init__(self, precision=DEFAULT_DECIMAL_PRECISION):
+        """
+        Creates the backend.
+
+        Args:
+            precision (int): Significant digits kept for inexact quotients
+        """
+        # With the maximum precision, +, - and * never round
+        self._exact_context = decimal.Context(
+            prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+        )
+        self._division_context = decimal.Context(prec=precision)
+        self._prepared = {}
+
+    def parse(self, value_str):
+        """Parses a Decimal; signalling NaNs and out-of-range values are rejected."""
+        try:
+            number = Decimal(value_str.strip())
+        except (decimal.InvalidOperation, AttributeError):
+            return False, None
+        if number.is_snan() or not _in_exact_range(number):
+            return False, None
+        return True, number
+
+    def prepare(self, operation_func):
+        """Wraps operation_func so it runs in the right decimal context."""
+        prepared = self._prepared.get(operation_func)
+        if prepared is None:
+            if operation_func is Calculator.divide:
+                context = self._division_context
+            else:
+                context = self._exact_context
+
+            def prepared(num1, num2):
+                with decimal.localcontext(context):
+                    return operation_func(num1, num2)
+
+            self._prepared[operation_func] = prepared
+        return prepared
+
+    def format(self, result):
+        """Formats a Decimal result for display."""
+        return format_exact(result)
+
+
+class FractionBackend(FloatBackend):
+    """Exact rational arithmetic; integers of any size stay exact."""
+
+    name = "fraction"
+
+    def parse(self, value_str):
+        """Parses a Fraction ("1.5", "1e3" and "3/4" are all accepted)."""
+        try:
+            text = value_str.strip()
+        except AttributeError:
+            return False, None
+        # Check the exponent before Fraction builds 10**exponent
+        exact = _parse_decimal(text)
+        if exact is not None and exact.is_finite() and not _in_exact_range(exact):
+            return False, None
+        try:
+            number = Fraction(text)
+        except ValueError:
+            return False, None
+        # "numerator/denominator" is not a Decimal; limit its digits instead
+        if exact is None and not _in_exact_range(number):
+            return False, None
+        return True, number
+
+    def format(self, result):
+        """Formats a Fraction result for display."""
+        return format_exact(result)
+
+
+class AutoBackend(FloatBackend):
+    """
+    Float fast path with automatic promotion to Fraction.
+
+    Operands that are exactly representable as floats (small integers,
+    dyadic decimals such as 0.5) are parsed as floats; anything else
+    ("0.1", 20-digit integers) is parsed exactly. An operation on two floats
+    runs in float first and is recomputed with Fractions only when an
+    error-free transformation shows that the float result was rounded.
+    """
+
+    name = "auto"
+
+    def __init__(self):
+        """Creates the backend."""
+        self._prepared = {}
+
+    def parse(self, value_str):
+        """Parses a float when that is exact, otherwise a Fraction."""
+        is_valid, number = Calculator.validate_input(value_str)
+        if not is_valid or math.isnan(number):
+            return is_valid, number
+
+        text = value_str.strip()
+        digits = text.lstrip("+-")
+        if digits.isdigit() and len(digits) <= _SAFE_INTEGER_DIGITS:
+            return True, number
+
+        exact = Decimal(text)
+        if not exact.is_finite():
+            return True, number     # "inf" itself
+        if not _in_exact_range(exact):
+            return False, None
+        # Beyond the float range ("1e5000") the value stays exact, not inf
+        if math.isfinite(number) and exact == Decimal(number):
+            return True, number
+        return True, Fraction(exact)
+
+    def prepare(self, operation_func):
+        """Wraps operation_func with the float-first, exact-if-needed logic."""
+        prepared = self._prepared.get(operation_func)
+        if prepared is None:
+            is_exact = _EXACTNESS_CHECKS.get(operation_func)
+
+            def prepared(num1, num2):
+                if type(num1) is float and type(num2) is float:
+                    result = operation_func(num1, num2)
+                    if is_exact is None or is_exact(num1, num2, result):
+                        return result
+                if _is_non_finite(num1) or _is_non_finite(num2):
+                    # inf and NaN have no Fraction: answer as the float backend
+                    return operation_func(_to_float(num1), _to_float(num2))
+                return operation_func(Fraction(num1), Fraction(num2))
+
+            self._prepared[operation_func] = prepared
+        return prepared
+
+    def format(self, result):
+        """Formats a float or Fraction result for display."""
+        if type(result) is float:
+            return format_result(result)
+        return format_exact(result)
+
+
+def _is_non_finite(number):
+    return type(number) is float and not math.isfinite(number)
+
+
+def _to_float(number):
+    """float(number), with exact values beyond the float range as ±inf."""
+    try:
+        return float(number)
+    except OverflowError:
+        return math.inf if number > 0 else -math.inf
+
+
+# ====================================================================
+# FLOAT EXACTNESS CHECKS (error-free transformations)
+# ====================================================================
+
+# Veltkamp splitter for double precision: 2**27 + 1
+_SPLITTER = 134217729.0
+
+# Below this magnitude the rounding error of a product may itself underflow
+_TINY = 2.0 ** -969
+
+
+def _sum_is_exact(num1, num2, total):
+    """TwoSum: True when total == num1 + num2 without rounding."""
+    if not math.isfinite(total):
+        return not (math.isfinite(num1) and math.isfinite(num2))
+    virtual = total - num1
+    return (num1 - (total - virtual)) + (num2 - virtual) == 0.0
+
+
+def _split(value):
+    """Splits a float into two halves whose products are exact."""
+    scaled = _SPLITTER * value
+    high = scaled - (scaled - value)
+    return high, value - high
+
+
+def _product_is_exact(num1, num2, product):
+    """TwoProduct: True when product == num1 * num2 without rounding."""
+    if not math.isfinite(product):
+        return not (math.isfinite(num1) and math.isfinite(num2))
+    if product == 0.0:
+        return num1 == 0.0 or num2 == 0.0
+    if abs(product) < _TINY:
+        return False
+    high1, low1 = _split(num1)
+    high2, low2 = _split(num2)
+    error = ((high1 * high2 - product) + high1 * low2 + low1 * high2) + low1 * low2
+    return error == 0.0
+
+
+def _add_is_exact(num1, num2, result):
+    return _sum_is_exact(num1, num2, result)
+
+
+def _subtract_is_exact(num1, num2, result):
+    return _sum_is_exact(num1, -num2, result)
+
+
+def _multiply_is_exact(num1, num2, result):
+    return _product_is_exact(num1, num2, result)
+
+
+def _divide_is_exact(num1, num2, result):
+    if not (math.isfinite(num1) and math.isfinite(num2)):
+        return True
+    product = result * num2
+    return product == num1 and _product_is_exact(result, num2, product)
+
+
+_EXACTNESS_CHECKS = {
+    Calculator.add: _add_is_exact,
+    Calculator.subtract: _subtract_is_exact,
+    Calculator.multiply: _multiply_is_exact,
+    Calculator.divide: _divide_is_exact,
+}
+
+
+# ====================================================================
+# BACKEND REGISTRY
+# ====================================================================
+
+BACKENDS = {
+    "float": FloatBackend,
+    "decimal": DecimalBackend,
+    "fraction": FractionBackend,
+    "auto": AutoBackend,
+}
+
+
+def get_backend(backend="float"):
+    """
+    Returns a backend instance.
+
+    Args:
+        backend (str or backend): A name from BACKENDS, or a backend instance
+
+    Returns:
+        The backend instance
+
+    Raises:
+        ValueError: For an unknown backend name
+    """
+    if not isinstance(backend, str):
+        return backend
+    try:
+        return BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(f"Unknown numeric backend: {backend!r}") from None
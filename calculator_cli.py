@@ -0,0 +1,219 @@
+"""
+Headless Calculator CLI - streaming calculations without a window
+Author: Team Five
+
+Description:
+Streams "op,num1,num2" records from a file or stdin through the same
+Calculator validation and operations the GUI uses, and writes one formatted
+result per record ("Result: 8", "Please enter valid numbers.", ...).
+
+Every stage is a generator, so memory use stays constant no matter how large
+the input is, and tkinter is never imported.
+
+Usage:
+    python calculator_cli.py records.csv -o results.txt
+    printf 'add,5,3\\ndivide,1,0\\n' | python calculator_cli.py
+
+Accepted operations: add, subtract, multiply, divide (or + - * /).
+Blank lines are skipped.
+"""
+
+import argparse
+import sys
+
+from calculator_backends import BACKENDS, get_backend
+from calculator_core import (
+    DIVISION_BY_ZERO_TEXT,
+    INVALID_INPUT_TEXT,
+    OPERATIONS,
+    ResultCache,
+)
+
+
+# Message written for records whose operation name is not recognised
+UNKNOWN_OPERATION_TEXT = "Unknown operation."
+
+# Message written for records whose calculation failed otherwise (as the GUI)
+CALCULATION_ERROR_TEXT = "Error in calculation."
+
+# I/O buffer size; large buffers keep the pipeline at disk speed
+BUFFER_SIZE = 1 << 20
+
+# Symbol aliases accepted alongside the operation names
+OPERATION_ALIASES = {
+    "+": "add",
+    "-": "subtract",
+    "*": "multiply",
+    "/": "divide",
+}
+
+
+# ====================================================================
+# STREAMING PIPELINE
+# ====================================================================
+
+def read_records(lines, delimiter=","):
+    """
+    Splits input lines into (op, num1_str, num2_str) records.
+
+    Args:
+        lines: Iterable of text lines
+        delimiter (str): Field separator
+
+    Yields:
+        list: [op, num1_str, num2_str], or None for a malformed line
+    """
+    for line in lines:
+        fields = line.split(delimiter)
+        if len(fields) == 3:
+            yield fields
+        elif line.strip():
+            yield None
+
+
+def calculate_records(records, cache=None, backend="float"):
+    """
+    Runs each record through Calculator validation and its operation.
+
+    Mirrors CalculatorApp.perform_calculation: invalid operands produce the
+    invalid-input message, division by zero produces the message the GUI
+    settles on once its special effect has finished, and any other failure
+    of a record's calculation produces the GUI's error message without
+    stopping the stream.
+
+    Args:
+        records: Iterable of records as produced by read_records
+        cache (ResultCache): Optional cache for inputs with many repeats
+        backend (str): Numeric backend name, or a backend instance
+
+    Yields:
+        str: One formatted output line (newline included) per record
+    """
+    backend = get_backend(backend)
+    operations = {name: backend.prepare(func) for name, func in OPERATIONS.items()}
+    for alias, name in OPERATION_ALIASES.items():
+        operations[alias] = operations[name]
+    get_operation = operations.get
+    validate_input = backend.parse
+    format_result = backend.format
+
+    invalid_line = INVALID_INPUT_TEXT + "\n"
+    zero_line = DIVISION_BY_ZERO_TEXT + "\n"
+    unknown_line = UNKNOWN_OPERATION_TEXT + "\n"
+    error_line = CALCULATION_ERROR_TEXT + "\n"
+
+    for record in records:
+        if record is None:
+            yield invalid_line
+            continue
+        op, num1_str, num2_str = record
+
+        # Exact names are the common case; normalise only when that misses
+        operation_func = get_operation(op) or get_operation(op.strip().lower())
+        if operation_func is None:
+            yield unknown_line
+            continue
+
+        is_valid1, num1 = validate_input(num1_str)
+        is_valid2, num2 = validate_input(num2_str)
+        if not is_valid1 or not is_valid2:
+            yield invalid_line
+            continue
+
+        if cache is None:
+            try:
+                result_text = format_result(operation_func(num1, num2))
+            except ZeroDivisionError:
+                yield zero_line
+                continue
+            except (ArithmeticError, ValueError):
+                yield error_line
+                continue
+            yield result_text + "\n"
+            continue
+
+        cache_key = (operation_func, num1, num2)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            yield cached[1] + "\n"
+            continue
+        try:
+            result = operation_func(num1, num2)
+            result_text = format_result(result)
+        except ZeroDivisionError:
+            yield zero_line
+            continue
+        except (ArithmeticError, ValueError):
+            yield error_line
+            continue
+        cache.put(cache_key, result, result_text)
+        yield result_text + "\n"
+
+
+def run(input_stream, output_stream, delimiter=",", cache=None,
+        backend="float"):
+    """
+    Streams every record from input_stream to output_stream.
+
+    Args:
+        input_stream: Readable text stream of records
+        output_stream: Writable text stream for the results
+        delimiter (str): Field separator
+        cache (ResultCache): Optional result cache
+        backend (str): Numeric backend name, or a backend instance
+    """
+    records = read_records(input_stream, delimiter)
+    output_stream.writelines(calculate_records(records, cache, backend))
+
+
+# ====================================================================
+# COMMAND LINE ENTRY POINT
+# ====================================================================
+
+def _open_input(path):
+    """Opens the input file, or stdin for "-", with a large buffer."""
+    if path == "-":
+        return open(sys.stdin.fileno(), encoding="utf-8", buffering=BUFFER_SIZE,
+                    closefd=False)
+    return open(path, encoding="utf-8", buffering=BUFFER_SIZE)
+
+
+def _open_output(path):
+    """Opens the output file, or stdout for "-", with a large buffer."""
+    if path == "-":
+        return open(sys.stdout.fileno(), "w", encoding="utf-8",
+                    buffering=BUFFER_SIZE, closefd=False)
+    return open(path, "w", encoding="utf-8", buffering=BUFFER_SIZE)
+
+
+def main(argv=None):
+    """Parses the command line and streams the records."""
+    parser = argparse.ArgumentParser(
+        description="Stream op,num1,num2 records through the calculator."
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="input file of records (default: stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file (default: stdout)")
+    parser.add_argument("-d", "--delimiter", default=",",
+                        help="field separator (default: ',')")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="float",
+                        help="numeric backend (default: float)")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="LRU result cache entries for repetitive input "
+                             "(default: 0, disabled)")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="print cache hit/miss/eviction counts to stderr")
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.cache_size) if args.cache_size > 0 else None
+    with _open_input(args.input) as input_stream, \
+            _open_output(args.output) as output_stream:
+        run(input_stream, output_stream, args.delimiter, cache, args.backend)
+    if cache is not None and args.cache_stats:
+        print(cache.stats(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
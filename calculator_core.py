@@ -0,0 +1,316 @@
+"""
+Calculator Core - arithmetic and validation without any GUI
+Author: Team Five
+
+Description:
+The business logic behind the Enhanced Calculator (breakout2.py). It is kept
+free of tkinter so headless tools (the streaming CLI, batch jobs) can use the
+exact same arithmetic, validation and result formatting as the GUI.
+"""
+
+from collections import OrderedDict
+
+
+# Messages shared by the GUI and the headless tools
+INVALID_INPUT_TEXT = "Please enter valid numbers."
+DIVISION_BY_ZERO_TEXT = "Please enter valid numbers (divisor cannot be zero)"
+
+# Default number of entries kept by ResultCache
+DEFAULT_CACHE_SIZE = 1024
+
+# Zero-division policies accepted by Calculator.calculate_batch
+ZERO_DIVISION_POLICIES = ("nan", "inf", "mask", "raise")
+
+
+def _require_numpy():
+    """Imports NumPy on first use so the GUI never pays for it at startup."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Batch calculations require NumPy (pip install numpy)"
+        ) from exc
+    return numpy
+
+
+# ====================================================================
+# CALCULATOR BUSINESS LOGIC
+# ====================================================================
+
+class Calculator:
+    """Calculator class to handle arithmetic operations and input validation."""
+    
+    @staticmethod
+    def validate_input(value_str):
+        """
+        Validates if a string can be converted to a float.
+        
+        Args:
+            value_str (str): The string to validate
+            
+        Returns:
+            tuple: (is_valid: bool, number: float or None)
+        """
+        try:
+            number = float(value_str.strip())
+            return True, number
+        except (ValueError, AttributeError):
+            return False, None
+    
+    @staticmethod
+    def validate_batch(value_strs, thousands_separators=False):
+        """
+        Validates and converts a whole batch of strings in one call.
+        
+        Accepts exactly what validate_input accepts (including scientific
+        notation and surrounding whitespace), plus "," thousands separators
+        when enabled. Validation runs as a vectorized scan over the whole
+        batch (see calculator_parsing.py) and only the valid strings are
+        converted, so no exception is raised per invalid value.
+        
+        Args:
+            value_strs: Iterable of strings to validate; non-strings are invalid
+            thousands_separators (bool): Accept values such as "1,234.5"
+            
+        Returns:
+            tuple: (values: numpy.ndarray of float64 with NaN where invalid,
+                    valid: numpy.ndarray of bool)
+        """
+        _require_numpy()
+        from calculator_parsing import parse_numbers
+        return parse_numbers(value_strs, thousands_separators)
+    
+    @staticmethod
+    def add(num1, num2):
+        """Performs addition operation."""
+        return num1 + num2
+    
+    @staticmethod
+    def subtract(num1, num2):
+        """Performs subtraction operation."""
+        return num1 - num2
+    
+    @staticmethod
+    def multiply(num1, num2):
+        """Performs multiplication operation."""
+        return num1 * num2
+    
+    @staticmethod
+    def divide(num1, num2):
+        """
+        Performs division operation with division by zero handling.
+        
+        Args:
+            num1 (float): The dividend
+            num2 (float): The divisor
+            
+        Returns:
+            float: The result of division
+            
+        Raises:
+            ZeroDivisionError: When attempting to divide by zero
+        """
+        if num2 == 0:
+            raise ZeroDivisionError("Cannot divide by zero!")
+        return num1 / num2
+    
+    @staticmethod
+    def calculate_batch(operation, operands1, operands2, zero_division="nan",
+                        workers=None):
+        """
+        Applies one operation to whole columns of operands at once.
+        
+        The operands are converted to float64 NumPy arrays (broadcasting
+        rules apply) and the operation runs as a single vectorized call
+        instead of one Python call per pair.
+        
+        Args:
+            operation (str): One of "add", "subtract", "multiply", "divide"
+            operands1: Array-like of first operands
+            operands2: Array-like of second operands
+            zero_division (str): How to report division by zero:
+                "nan"   - the result is NaN where the divisor is zero
+                "inf"   - plain IEEE semantics (+/-inf, NaN for 0/0)
+                "mask"  - a numpy.ma.MaskedArray with zero divisors masked
+                "raise" - ZeroDivisionError if any divisor is zero
+            workers (int): When above 1, large batches are sharded across
+                that many processes (see calculator_parallel.py)
+                
+        Returns:
+            numpy.ndarray: The float64 results (a MaskedArray for "mask")
+            
+        Raises:
+            ValueError: For an unknown operation or zero-division policy
+            ZeroDivisionError: For zero divisors under the "raise" policy
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation!r}")
+        if zero_division not in ZERO_DIVISION_POLICIES:
+            raise ValueError(f"Unknown zero-division policy: {zero_division!r}")
+        
+        np = _require_numpy()
+        if workers is not None and workers > 1:
+            from calculator_parallel import calculate_batch_parallel
+            return calculate_batch_parallel(
+                operation, operands1, operands2, zero_division, workers
+            )
+        
+        a = np.asarray(operands1, dtype=np.float64)
+        b = np.asarray(operands2, dtype=np.float64)
+        
+        if operation == "add":
+            return np.add(a, b)
+        if operation == "subtract":
+            return np.subtract(a, b)
+        if operation == "multiply":
+            return np.multiply(a, b)
+        
+        zero_divisors = b == 0
+        if zero_division == "raise" and zero_divisors.any():
+            raise ZeroDivisionError("Cannot divide by zero!")
+        
+        result = np.empty(np.broadcast_shapes(a.shape, b.shape), dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(a, b, out=result)
+        
+        if zero_division == "nan":
+            np.copyto(result, np.nan, where=zero_divisors)
+        elif zero_division == "mask":
+            result = np.ma.masked_array(
+                result, mask=np.broadcast_to(zero_divisors, result.shape)
+            )
+        return result
+
+
+# Operation names mapped to the Calculator methods that implement them
+OPERATIONS = {
+    "add": Calculator.add,
+    "subtract": Calculator.subtract,
+    "multiply": Calculator.multiply,
+    "divide": Calculator.divide,
+}
+
+
+# ====================================================================
+# RESULT FORMATTING
+# ====================================================================
+
+def format_result(result):
+    """
+    Formats a calculation result the way the result label displays it.
+    
+    Whole numbers collapse to integers; everything else is shown with up to
+    six decimal places and trailing zeros stripped.
+    
+    Args:
+        result (float): The calculation result
+        
+    Returns:
+        str: The display text, e.g. "Result: 8" or "Result: 0.333333"
+    """
+    if result.is_integer():
+        return f"Result: {int(result)}"
+    return f"Result: {result:.6f}".rstrip('0').rstrip('.')
+
+
+def format_results(results):
+    """
+    Formats a whole array of results in one call.
+    
+    Produces exactly the strings format_result would, using the vectorized
+    formatter in calculator_formatting.py.
+    
+    Args:
+        results: Array-like of float results, e.g. from calculate_batch
+        
+    Returns:
+        list: One display string per result, in order
+    """
+    _require_numpy()
+    from calculator_formatting import RESULT_FORMATTER
+    return RESULT_FORMATTER.format_many(results)
+
+
+# ====================================================================
+# RESULT CACHE
+# ====================================================================
+
+class ResultCache:
+    """
+    Bounded LRU cache of calculation results.
+    
+    Entries are keyed on (operation, num1, num2) and hold both the numeric
+    result and its formatted "Result: ..." text. Only successful calculations
+    are stored: callers put() after the operation returned, so a division
+    by zero (which raises) never reaches the cache.
+    """
+    
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, enabled=True):
+        """
+        Creates the cache.
+        
+        Args:
+            maxsize (int): Maximum number of entries; 0 disables the cache
+            enabled (bool): Whether lookups and stores are active
+        """
+        self.maxsize = maxsize
+        self.enabled = enabled and maxsize > 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+    
+    def get(self, key):
+        """
+        Looks up a cached entry and marks it most recently used.
+        
+        Args:
+            key (tuple): (operation, num1, num2)
+            
+        Returns:
+            tuple: (result, result_text), or None on a miss
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+    
+    def put(self, key, result, result_text):
+        """
+        Stores a result, evicting the least recently used entry when full.
+        
+        Args:
+            key (tuple): (operation, num1, num2)
+            result: The numeric result
+            result_text (str): The formatted result text
+        """
+        if not self.enabled:
+            return
+        self._entries[key] = (result, result_text)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Drops all entries and resets the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def stats(self):
+        """Returns the cache counters as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
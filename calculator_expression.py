@@ -0,0 +1,184 @@
+"""
+Expression Engine - multi-operand expressions for the calculator
+Author: Team Five
+
+Description:
+Parses arithmetic expressions such as "(a + b) * c / d" once and compiles
+them into a plain Python function built from the Calculator operations, so
+evaluating the same expression over many variable bindings never re-parses
+it. Compiled expressions are cached by their source text.
+
+Only numbers, variable names, parentheses, unary +/- and the four
+operations + - * / are accepted. Division goes through Calculator.divide,
+so dividing by zero raises ZeroDivisionError just like the Divide button.
+"""
+
+import ast
+import operator
+from functools import lru_cache
+
+from calculator_backends import FloatBackend
+from calculator_core import Calculator
+
+
+# Number of compiled expressions kept by compile_expression
+EXPRESSION_CACHE_SIZE = 256
+
+# AST operator node -> Calculator operation
+_BINARY_OPERATIONS = {
+    ast.Add: Calculator.add,
+    ast.Sub: Calculator.subtract,
+    ast.Mult: Calculator.multiply,
+    ast.Div: Calculator.divide,
+}
+
+_UNARY_OPERATIONS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Shared default so cache keys stay stable when no backend is given
+_FLOAT_BACKEND = FloatBackend()
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is malformed or uses unsupported syntax."""
+
+
+# ====================================================================
+# COMPILED EXPRESSION
+# ====================================================================
+
+class CompiledExpression:
+    """An expression parsed once and ready for repeated evaluation."""
+
+    def __init__(self, source, variables, function):
+        """
+        Args:
+            source (str): The expression text
+            variables (tuple): Variable names in order of first appearance
+            function: Callable taking the variables positionally
+        """
+        self.source = source
+        self.variables = variables
+        self._function = function
+
+    def evaluate(self, bindings=None, **kwargs):
+        """
+        Evaluates the expression for one set of variable values.
+
+        Args:
+            bindings (dict): Variable name -> number
+            **kwargs: Variable values given as keywords
+
+        Returns:
+            The result of the expression
+
+        Raises:
+            ExpressionError: When a variable has no value
+            ZeroDivisionError: When the expression divides by zero
+        """
+        if bindings is not None:
+            kwargs = {**bindings, **kwargs}
+        missing = [name for name in self.variables if name not in kwargs]
+        if missing:
+            raise ExpressionError(f"No value for: {', '.join(missing)}")
+        return self._function(*[kwargs[name] for name in self.variables])
+
+    def evaluate_many(self, rows):
+        """
+        Evaluates the expression for many sets of variable values.
+
+        Args:
+            rows: Iterable of tuples with one value per variable, in the
+                order of self.variables
+
+        Yields:
+            The result for each row (ZeroDivisionError propagates)
+        """
+        function = self._function
+        for row in rows:
+            yield function(*row)
+
+    def __call__(self, *values):
+        """Evaluates with the variable values given positionally."""
+        return self._function(*values)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+
+# ====================================================================
+# COMPILER
+# ====================================================================
+
+class _Compiler:
+    """Translates a validated expression AST into Python source code."""
+
+    def __init__(self, source, backend):
+        self.source = source
+        self.backend = backend
+        self.variables = []
+        self.namespace = {"__builtins__": {}}
+
+    def bind(self, value):
+        """Stores a constant or operation in the namespace; returns its name."""
+        name = f"_v{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def visit(self, node):
+        """Returns Python source for the given AST node."""
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATIONS:
+            func = self.backend.prepare(_BINARY_OPERATIONS[type(node.op)])
+            return (f"{self.bind(func)}({self.visit(node.left)}, "
+                    f"{self.visit(node.right)})")
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATIONS:
+            func = _UNARY_OPERATIONS[type(node.op)]
+            return f"{self.bind(func)}({self.visit(node.operand)})"
+
+        if isinstance(node, ast.Name):
+            if node.id.startswith("_"):
+                raise ExpressionError(f"Invalid variable name: {node.id}")
+            if node.id not in self.variables:
+                self.variables.append(node.id)
+            return node.id
+
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            # Parse the literal text with the backend so "0.1" stays exact
+            literal = ast.get_source_segment(self.source, node)
+            is_valid, number = self.backend.parse(literal)
+            if not is_valid:
+                raise ExpressionError(f"Invalid number: {literal}")
+            return self.bind(number)
+
+        raise ExpressionError(
+            f"Unsupported syntax: {ast.get_source_segment(self.source, node)}"
+        )
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(source, backend=_FLOAT_BACKEND):
+    """
+    Parses and compiles an expression, caching the result by source text.
+
+    Args:
+        source (str): Expression such as "(a + b) * c / d"
+        backend: Numeric backend used for literals and operations
+
+    Returns:
+        CompiledExpression: The compiled expression
+
+    Raises:
+        ExpressionError: For malformed or unsupported expressions
+    """
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+        compiler = _Compiler(source.strip(), backend)
+        body = compiler.visit(tree.body)
+        parameters = ", ".join(compiler.variables)
+        function = eval(f"lambda {parameters}: {body}", compiler.namespace)
+    except (SyntaxError, RecursionError, MemoryError):
+        raise ExpressionError(f"Malformed expression: {source!r}") from None
+    return CompiledExpression(source, tuple(compiler.variables), function)
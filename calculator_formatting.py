@@ -0,0 +1,221 @@
+"""
+Result Formatting - fast scalar and bulk formatting of calculation results
+Author: Team Five
+
+Description:
+format_result() in calculator_core.py formats one float at a time with
+is_integer(), int() and an f-string followed by rstrip('0').rstrip('.').
+That is fine for a button click, but formatting millions of batch results
+or history rows spends most of its time there.
+
+ResultFormatter produces exactly the same strings. Its scalar path uses
+templates built once per formatter. Its bulk path formats a whole float64
+array with NumPy integer arithmetic: each value is split into whole and
+fractional digits, the digits are written into a byte matrix with one row
+per value, and unused cells are left as NUL bytes and squeezed out at the
+end, so no Python string is created per value unless a list is asked for.
+
+Values the integer arithmetic cannot represent (magnitudes of 2**63 and
+above, inf, nan, and the rare values within a few ulps of a rounding tie
+at the sixth decimal) are formatted with the scalar path and spliced back
+in, which keeps the output identical.
+"""
+
+import numpy as np
+
+
+# Decimal places shown by the result label
+DISPLAY_DECIMALS = 6
+
+# Rows formatted per step; bounds the size of the byte matrix
+CHUNK_SIZE = 1 << 16
+
+# Largest whole value handled by the integer path (uint64 digits)
+_MAX_WHOLE = 2.0 ** 63
+
+_ZERO = ord("0")
+
+
+class ResultFormatter:
+    """Formats results as "Result: <number>", one at a time or in bulk."""
+
+    def __init__(self, prefix="Result: ", decimals=DISPLAY_DECIMALS):
+        """
+        Builds the format templates.
+
+        Args:
+            prefix (str): Single-line ASCII text placed before every number
+            decimals (int): Decimal places before trailing zeros are stripped
+
+        Raises:
+            ValueError: For a non-ASCII or multi-line prefix, or decimals
+                outside 1-15
+        """
+        if not prefix.isascii() or "\n" in prefix:
+            raise ValueError("The result prefix must be single-line ASCII")
+        if not 1 <= decimals <= 15:
+            raise ValueError(f"decimals must be between 1 and 15, got {decimals}")
+
+        self.prefix = prefix
+        self.decimals = decimals
+        self.format = _compile_scalar_format(prefix, decimals)
+        self._scale = 10 ** decimals
+        self._prefix_bytes = np.frombuffer(prefix.encode("ascii"), dtype=np.uint8)
+
+    # ----------------------------------------------------------------
+    # Bulk path
+    # ----------------------------------------------------------------
+
+    def format_many(self, results):
+        """
+        Formats an array of results.
+
+        Args:
+            results: Array-like of numbers (converted to float64)
+
+        Returns:
+            list: One display string per result, in order
+        """
+        results = np.asarray(results, dtype=np.float64).ravel()
+        if results.size == 0:
+            return []
+        return self.format_text(results, "\n")[:-1].split("\n")
+
+    def format_text(self, results, separator="\n"):
+        """
+        Formats an array of results into one string.
+
+        The separator follows every result, including the last, so the text
+        can be written straight to a file of one result per line.
+
+        Args:
+            results: Array-like of numbers (converted to float64)
+            separator (str): ASCII text written after each result
+
+        Returns:
+            str: The formatted results
+        """
+        results = np.asarray(results, dtype=np.float64).ravel()
+        separator_bytes = np.frombuffer(separator.encode("ascii"), dtype=np.uint8)
+        pieces = []
+        for start in range(0, results.size, CHUNK_SIZE):
+            self._format_chunk(results[start:start + CHUNK_SIZE], separator_bytes,
+                               separator, pieces)
+        return "".join(pieces)
+
+    def _format_chunk(self, values, separator_bytes, separator, pieces):
+        """Formats one chunk, appending text pieces in order."""
+        magnitudes = np.abs(values)
+        with np.errstate(invalid="ignore"):
+            # Whole part and exact remainder (a - floor(a) never rounds)
+            floors = np.floor(magnitudes)
+            scaled = (magnitudes - floors) * self._scale
+            rounded = np.rint(scaled)
+            # The scaled remainder is inexact, so one within a few ulps of a
+            # rounding tie might round the other way in exact decimal
+            near_tie = (np.abs(np.abs(scaled - rounded) - 0.5)
+                        <= 2 * np.spacing(scaled))
+            fast = (magnitudes < _MAX_WHOLE) & ~near_tie
+        fallback = np.flatnonzero(~fast)
+
+        # Rounding up to a whole unit carries into the whole digits
+        whole = np.where(fast, floors, 0).astype(np.uint64)
+        units = np.where(fast, rounded, 0).astype(np.uint64)
+        whole += units // np.uint64(self._scale)
+        fraction = units % np.uint64(self._scale)
+
+        matrix = self._build_matrix(values, whole, fraction, separator_bytes)
+        if fallback.size:
+            matrix[fallback] = 0
+        keep = matrix != 0
+        text = matrix[keep].tobytes().decode("ascii")
+        if not fallback.size:
+            pieces.append(text)
+            return
+
+        # Fallback rows are empty in the matrix; their scalar text is
+        # spliced in at the row's offset
+        ends = np.cumsum(keep.sum(axis=1))[fallback].tolist()
+        start = 0
+        format_result = self.format
+        for end, value in zip(ends, values[fallback].tolist()):
+            pieces.append(text[start:end])
+            pieces.append(format_result(value) + separator)
+            start = end
+        pieces.append(text[start:])
+
+    def _build_matrix(self, values, whole, fraction, separator_bytes):
+        """
+        Lays the digits out in a byte matrix, one row per value.
+
+        Columns: prefix | sign | whole digits (right aligned) | "." |
+        fractional digits | separator. Cells that are not part of a row's
+        text are NUL. The matrix is filled one column at a time (stored
+        transposed so each column is contiguous), dividing by a scalar 10
+        so NumPy can use its fast constant-divisor path.
+        """
+        largest = int(np.max(whole))
+        whole = whole.astype(_narrowest_unsigned(largest))
+        fraction = fraction.astype(_narrowest_unsigned(self._scale))
+        decimals = self.decimals
+        prefix_width = self._prefix_bytes.size
+        dot_column = prefix_width + 1 + len(str(largest))
+        width = dot_column + 1 + decimals + separator_bytes.size
+
+        columns = np.empty((width, values.size), dtype=np.uint8)
+        columns[:prefix_width] = self._prefix_bytes[:, None]
+        # "-" for negative values; -0.0 is whole and shows as "0"
+        columns[prefix_width] = (values < 0) * np.uint8(ord("-"))
+
+        # Whole digits from the units digit leftwards; leading zeros are NUL
+        columns[dot_column - 1] = whole % 10 + _ZERO
+        whole //= 10
+        for column in range(dot_column - 2, prefix_width, -1):
+            columns[column] = (whole % 10 + _ZERO) * (whole > 0)
+            whole //= 10
+
+        # Fractional digits from the last one leftwards; trailing zeros are
+        # NUL, and so is the "." when no digit remains
+        significant = np.zeros(values.size, dtype=bool)
+        for column in range(dot_column + decimals, dot_column, -1):
+            digit = fraction % 10
+            significant |= digit != 0
+            columns[column] = (digit + _ZERO) * significant
+            fraction //= 10
+        columns[dot_column] = significant * np.uint8(ord("."))
+
+        columns[width - separator_bytes.size:] = separator_bytes[:, None]
+        return columns.T
+
+
+def _compile_scalar_format(prefix, decimals):
+    """
+    Compiles the scalar formatting function for a prefix and precision.
+
+    The format spec is baked into f-strings, the cheapest way CPython has
+    to apply one, so the compiled function costs the same as format_result.
+    """
+    template = prefix.replace("{", "{{").replace("}", "}}")
+    source = (
+        "def format(result):\n"
+        "    if result.is_integer():\n"
+        f"        return f{template + '{int(result)}'!r}\n"
+        f"    return f{template + '{result:.%df}' % decimals!r}.rstrip('0').rstrip('.')\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    function = namespace["format"]
+    function.__doc__ = (
+        f"Formats one result as {prefix!r} followed by the number; whole "
+        f"numbers collapse to integers, others show up to {decimals} decimals."
+    )
+    return function
+
+
+def _narrowest_unsigned(largest):
+    """Returns uint32 when it can hold largest (faster division), else uint64."""
+    return np.uint32 if largest < 2 ** 32 else np.uint64
+
+
+# Formatter with the result label's display rules
+RESULT_FORMATTER = ResultFormatter()
@@ -0,0 +1,274 @@
+"""
+Frame Timing - opt-in timing of root.after() callbacks
+Author: Team Five
+
+Description:
+The effects and the worker poll run as root.after() callbacks, and nothing
+told us whether a 300 ms pulse step really ran after 300 ms on a loaded
+machine. A FrameTimer replaces root.after() on one window with a wrapper
+that records, for every scheduled callback:
+
+    - the intended delay (the ms passed to after())
+    - how late it was dispatched (actual delay minus intended delay)
+    - how long the callback itself ran
+
+Statistics are kept per callback (by qualified name, e.g. Timeline._tick):
+count, mean and worst lateness and duration, a lateness histogram and the
+number of dropped frames (each full frame period a callback was late by).
+They can be written to a file (JSON or text) or shown in a live
+diagnostics window.
+
+Nothing is measured unless a FrameTimer is installed, so the normal app
+pays nothing. The module only imports tkinter for the diagnostics window.
+
+Usage:
+    timer = FrameTimer(root).install()
+    ...
+    timer.write_report("frame_timing.json")
+    show_diagnostics(root, timer)
+"""
+
+import json
+import time
+from pathlib import Path
+
+
+# One frame at 60 frames per second, in milliseconds
+FRAME_MS = 1000 / 60
+
+# Upper edges (ms) of the lateness histogram buckets; the last bucket
+# counts everything later than the last edge
+JITTER_BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66, 133, 266)
+
+# Refresh interval of the diagnostics window
+DIAGNOSTICS_REFRESH_MS = 1000
+
+
+class CallbackTimings:
+    """Timing statistics of one scheduled callback."""
+
+    def __init__(self):
+        self.count = 0
+        self.intended_ms = 0            # Delay of the most recent after() call
+        self.late_total_ms = 0.0
+        self.late_max_ms = 0.0
+        self.duration_total_ms = 0.0
+        self.duration_max_ms = 0.0
+        self.dropped_frames = 0
+        self.histogram = [0] * (len(JITTER_BUCKETS_MS) + 1)
+
+    def record(self, intended_ms, late_ms, duration_ms, frame_ms=FRAME_MS):
+        """
+        Adds one dispatch.
+
+        Args:
+            intended_ms (int): Delay passed to after()
+            late_ms (float): Actual minus intended delay
+            duration_ms (float): Time spent in the callback
+            frame_ms (float): Frame period used to count dropped frames
+        """
+        late_ms = max(late_ms, 0.0)     # Clock granularity can show -0.0x ms
+        self.count += 1
+        self.intended_ms = intended_ms
+        self.late_total_ms += late_ms
+        self.late_max_ms = max(self.late_max_ms, late_ms)
+        self.duration_total_ms += duration_ms
+        self.duration_max_ms = max(self.duration_max_ms, duration_ms)
+        self.dropped_frames += int(late_ms // frame_ms)
+        for bucket, edge in enumerate(JITTER_BUCKETS_MS):
+            if late_ms <= edge:
+                break
+        else:
+            bucket = len(JITTER_BUCKETS_MS)
+        self.histogram[bucket] += 1
+
+    def as_dict(self):
+        """Returns the statistics as JSON-ready values."""
+        count = self.count or 1
+        labels = [f"<={edge}ms" for edge in JITTER_BUCKETS_MS]
+        labels.append(f">{JITTER_BUCKETS_MS[-1]}ms")
+        return {
+            "count": self.count,
+            "intended_ms": self.intended_ms,
+            "late_mean_ms": round(self.late_total_ms / count, 3),
+            "late_max_ms": round(self.late_max_ms, 3),
+            "duration_mean_ms": round(self.duration_total_ms / count, 3),
+            "duration_max_ms": round(self.duration_max_ms, 3),
+            "dropped_frames": self.dropped_frames,
+            "jitter_histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class FrameTimer:
+    """Wraps root.after() and records the timing of every callback."""
+
+    def __init__(self, root, clock=time.perf_counter, frame_ms=FRAME_MS):
+        """
+        Args:
+            root: The Tk root (anything with after())
+            clock: Returns the current time in seconds
+            frame_ms (float): Frame period used to count dropped frames
+        """
+        self.root = root
+        self.clock = clock
+        self.frame_ms = frame_ms
+        self.timings = {}       # callback name -> CallbackTimings
+        self._after = None      # The unwrapped root.after
+
+    @property
+    def installed(self):
+        """True while root.after() is wrapped."""
+        return self._after is not None
+
+    def install(self):
+        """
+        Starts timing root.after() callbacks.
+
+        Returns:
+            FrameTimer: self, for chaining
+        """
+        if self._after is None:
+            self._after = self.root.after
+            self.root.after = self.after
+        return self
+
+    def uninstall(self):
+        """Restores the original root.after(); the statistics are kept."""
+        if self._after is not None:
+            del self.root.after
+            self._after = None
+
+    def reset(self):
+        """Forgets all statistics."""
+        self.timings.clear()
+
+    def after(self, ms, func=None, *args):
+        """Drop-in for root.after() that times the callback."""
+        if func is None:
+            return self._after(ms)      # Plain sleep; nothing to time
+
+        name = _callback_name(func)
+        clock = self.clock
+        scheduled = clock()
+
+        def timed():
+            dispatched = clock()
+            try:
+                func(*args)
+            finally:
+                finished = clock()
+                timings = self.timings.get(name)
+                if timings is None:
+                    timings = self.timings[name] = CallbackTimings()
+                timings.record(
+                    ms,
+                    (dispatched - scheduled) * 1000.0 - ms,
+                    (finished - dispatched) * 1000.0,
+                    self.frame_ms,
+                )
+
+        return self._after(ms, timed)
+
+    # ----------------------------------------------------------------
+    # Reports
+    # ----------------------------------------------------------------
+
+    def report(self):
+        """
+        Returns the statistics of every callback.
+
+        Returns:
+            dict: frame_ms, dropped_frames (total) and callbacks (name -> stats)
+        """
+        callbacks = {name: timings.as_dict()
+                     for name, timings in sorted(self.timings.items())}
+        return {
+            "frame_ms": round(self.frame_ms, 3),
+            "dropped_frames": sum(t["dropped_frames"] for t in callbacks.values()),
+            "callbacks": callbacks,
+        }
+
+    def format_report(self):
+        """Returns the statistics as a text table with one histogram per callback."""
+        report = self.report()
+        lines = [f"Frame period {report['frame_ms']} ms, "
+                 f"{report['dropped_frames']} dropped frame(s)", ""]
+        if not report["callbacks"]:
+            lines.append("No callbacks recorded yet.")
+        for name, stats in report["callbacks"].items():
+            lines.append(f"{name}  ({stats['count']} calls, "
+                         f"last intended delay {stats['intended_ms']} ms)")
+            lines.append(f"  late     mean {stats['late_mean_ms']:8.3f} ms   "
+                         f"max {stats['late_max_ms']:8.3f} ms")
+            lines.append(f"  duration mean {stats['duration_mean_ms']:8.3f} ms   "
+                         f"max {stats['duration_max_ms']:8.3f} ms")
+            lines.append(f"  dropped frames {stats['dropped_frames']}")
+            largest = max(stats["jitter_histogram"].values()) or 1
+            for label, count in stats["jitter_histogram"].items():
+                bar = "#" * round(count / largest * 30)
+                lines.append(f"  {label:>8} {count:>7} {bar}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def write_report(self, path):
+        """
+        Writes the statistics to a file: JSON for a .json path, text otherwise.
+
+        Args:
+            path: File to write
+
+        Returns:
+            Path: The file written
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".json":
+            path.write_text(json.dumps(self.report(), indent=2) + "\n")
+        else:
+            path.write_text(self.format_report() + "\n")
+        return path
+
+
+def _callback_name(func):
+    """Names a callback by its qualified name, looking through partials."""
+    func = getattr(func, "func", func)
+    return getattr(func, "__qualname__", None) or repr(func)
+
+
+def show_diagnostics(root, timer, refresh_ms=DIAGNOSTICS_REFRESH_MS):
+    """
+    Opens a window showing the timer's report, refreshed while it is open.
+
+    The refresh is scheduled with the unwrapped after(), so the window does
+    not show up in its own statistics.
+
+    Args:
+        root: The Tk root window
+        timer (FrameTimer): The timer to show
+        refresh_ms (int): Refresh interval
+
+    Returns:
+        tk.Toplevel: The diagnostics window
+    """
+    import tkinter as tk
+    from tkinter import ttk
+
+    window = tk.Toplevel(root)
+    window.title("Frame Timing")
+    text = tk.Text(window, width=72, height=30, font="TkFixedFont")
+    text.pack(fill=tk.BOTH, expand=True)
+    buttons = ttk.Frame(window, padding=5)
+    buttons.pack(fill=tk.X)
+    ttk.Button(buttons, text="Reset", command=timer.reset).pack(side=tk.LEFT)
+    ttk.Button(buttons, text="Close", command=window.destroy).pack(side=tk.RIGHT)
+
+    def refresh():
+        if not window.winfo_exists():
+            return
+        text.configure(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        text.insert("1.0", timer.format_report())
+        text.configure(state=tk.DISABLED)
+        (timer._after or root.after)(refresh_ms, refresh)
+
+    refresh()
+    return window
@@ -0,0 +1,256 @@
+"""
+Calculation History - compact storage and a virtualized history panel
+Author: Team Five
+
+Description:
+CalculationHistory keeps every calculation of a session in parallel typed
+arrays instead of one Python object per entry:
+
+    num1, num2, result   array('d')  8 bytes each
+    op code              array('I')  4 bytes
+
+That is 28 bytes per entry (plus up to about 12% spare capacity while the
+arrays grow), so a million entries take about 28 MB. A list of
+(str, float, float, float) tuples needs about 150 bytes per entry for the
+same data. Operation names are interned: each distinct name (the four
+operations, or an expression's text) is stored once and entries refer to
+it by code. Values are kept as floats; Decimal and Fraction results are
+rounded to the nearest float for display.
+
+HistoryPanel shows the history in a fixed pool of row labels, one per
+visible row, and a scrollbar. Scrolling only rewrites the texts of those
+labels and appending only moves the scrollbar (or the rows, while the panel
+follows the newest entry), so both cost the same with ten entries or ten
+million. Updates are coalesced to one redraw per idle cycle.
+
+The storage is tkinter-free; the panel imports tkinter when it is built.
+"""
+
+import math
+import sys
+from array import array
+
+
+# Display symbols of the calculator's operations; other operation names
+# are expressions and are shown with their a and b values
+OPERATION_SYMBOLS = {
+    "Addition": "+",
+    "Subtraction": "-",
+    "Multiplication": "×",
+    "Division": "÷",
+}
+
+# Rows (label widgets) shown by a HistoryPanel
+HISTORY_ROWS = 12
+
+
+def format_number(value):
+    """Formats a stored number with the result label's rules, without "Result: "."""
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:.6f}".rstrip('0').rstrip('.')
+
+
+def _to_float(value):
+    """float(value), with exact values beyond the float range as ±inf."""
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+# ====================================================================
+# STORAGE
+# ====================================================================
+
+class CalculationHistory:
+    """Append-only calculation history in typed arrays."""
+
+    # Nothing is ever waiting to be written (see PersistentHistory)
+    pending = False
+
+    def __init__(self):
+        CalculationHistory.clear(self)
+
+    def __len__(self):
+        return len(self.op_codes)
+
+    def op_code(self, op_name):
+        """Returns the code of an operation name, interning it on first use."""
+        code = self._codes.get(op_name)
+        if code is None:
+            code = self._codes[op_name] = len(self.op_names)
+            self.op_names.append(op_name)
+        return code
+
+    def append(self, op_name, num1, num2, result):
+        """
+        Records one calculation.
+
+        Args:
+            op_name (str): Operation name ("Division") or expression text
+            num1, num2: The operands (NaN for an unused expression variable)
+            result: The result (anything float() accepts)
+        """
+        # Convert everything first: a failure must not leave the arrays
+        # with different lengths
+        num1 = _to_float(num1)
+        num2 = _to_float(num2)
+        result = _to_float(result)
+        code = self.op_code(op_name)
+        self.num1.append(num1)
+        self.num2.append(num2)
+        self.results.append(result)
+        self.op_codes.append(code)
+
+    def clear(self):
+        """Forgets every entry and interned name."""
+        self.num1 = array('d')
+        self.num2 = array('d')
+        self.results = array('d')
+        self.op_codes = array('I')
+        self.op_names = []          # code -> operation name
+        self._codes = {}            # operation name -> code
+
+    def row(self, index):
+        """
+        Returns one entry.
+
+        Returns:
+            tuple: (op_name, num1, num2, result)
+        """
+        return (self.op_names[self.op_codes[index]], self.num1[index],
+                self.num2[index], self.results[index])
+
+    def format_row(self, index):
+        """Formats one entry for display, e.g. "#42  12 ÷ 4 = 3"."""
+        op_name, num1, num2, result = self.row(index)
+        symbol = OPERATION_SYMBOLS.get(op_name)
+        if symbol is not None:
+            text = f"{format_number(num1)} {symbol} {format_number(num2)}"
+        else:
+            bound = [f"{name}={format_number(value)}"
+                     for name, value in (("a", num1), ("b", num2))
+                     if not math.isnan(value)]
+            text = f"{op_name} ({', '.join(bound)})" if bound else op_name
+        return f"#{index + 1}  {text} = {format_number(result)}"
+
+    def flush(self):
+        """Writes buffered entries; in-memory histories have none."""
+
+    def close(self):
+        """Releases the history's files; in-memory histories have none."""
+
+    def memory_bytes(self):
+        """Bytes held by the arrays and interned names (capacity included)."""
+        arrays = (self.num1, self.num2, self.results, self.op_codes)
+        return (sum(sys.getsizeof(values) for values in arrays)
+                + sys.getsizeof(self.op_names)
+                + sum(sys.getsizeof(name) for name in self.op_names))
+
+
+# ====================================================================
+# VIRTUALIZED PANEL
+# ====================================================================
+
+class HistoryPanel:
+    """Shows a CalculationHistory with one label per visible row."""
+
+    def __init__(self, parent, history, rows=HISTORY_ROWS, font=None):
+        """
+        Builds the row labels and the scrollbar in a frame (pack or grid
+        panel.frame to show it).
+
+        Args:
+            parent: The parent widget
+            history (CalculationHistory): The entries to show
+            rows (int): Visible rows
+            font: Font of the rows
+        """
+        import tkinter as tk
+        from tkinter import ttk
+
+        self.history = history
+        self.rows = rows
+        self.first = 0              # Index of the top visible entry
+        self.follow = True          # Keep the newest entry in view
+        self._texts = [None] * rows
+        self._refresh_id = None
+
+        self.frame = ttk.Frame(parent)
+        self.frame.columnconfigure(0, weight=1)
+        self.labels = []
+        for row in range(rows):
+            label = ttk.Label(self.frame, anchor="w", font=font)
+            label.grid(row=row, column=0, sticky="ew")
+            self.labels.append(label)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL,
+                                       command=self.on_scroll)
+        self.scrollbar.grid(row=0, column=1, rowspan=rows, sticky="ns")
+
+        for widget in [self.frame, *self.labels]:
+            widget.bind("<MouseWheel>", self.on_mouse_wheel)
+            widget.bind("<Button-4>", lambda event: self.scroll_by(-3))
+            widget.bind("<Button-5>", lambda event: self.scroll_by(3))
+
+        self.refresh()
+
+    def _last_first(self):
+        """The top index that shows the newest entry in the last row."""
+        return max(len(self.history) - self.rows, 0)
+
+    def on_scroll(self, action, amount, unit=None):
+        """Scrollbar command: "moveto" fraction or "scroll" n units/pages."""
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.history)))
+        elif action == "scroll":
+            step = int(amount) * (self.rows if unit == "pages" else 1)
+            self.scroll_to(self.first + step)
+
+    def on_mouse_wheel(self, event):
+        """Windows and macOS wheel events (X11 sends Button-4/5)."""
+        self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.first + rows)
+
+    def scroll_to(self, first):
+        """Shows the entries from index first on; follows the newest at the end."""
+        last_first = self._last_first()
+        self.first = min(max(first, 0), last_first)
+        self.follow = self.first == last_first
+        self.refresh()
+
+    def notify_appended(self):
+        """Call after appending; the panel redraws once the app is idle."""
+        if self._refresh_id is None:
+            self._refresh_id = self.frame.after_idle(self._refresh_after_append)
+
+    def _refresh_after_append(self):
+        self._refresh_id = None
+        if self.follow:
+            self.first = self._last_first()
+        self.refresh()
+
+    def refresh(self):
+        """Rewrites the visible rows and the scrollbar."""
+        history = self.history
+        total = len(history)
+        for row, label in enumerate(self.labels):
+            index = self.first + row
+            text = history.format_row(index) if index < total else ""
+            # Unchanged rows cost no Tcl call
+            if text != self._texts[row]:
+                label.configure(text=text)
+                self._texts[row] = text
+        if total <= self.rows:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.first / total, (self.first + self.rows) / total)
+
+    def clear(self):
+        """Clears the history and the rows."""
+        self.history.clear()
+        self.first = 0
+        self.follow = True
+        self.refresh()
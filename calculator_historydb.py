@@ -0,0 +1,435 @@
+"""
+History Database - calculation history in SQLite, written off the UI thread
+Author: Team Five
+
+Description:
+SQLiteHistory is a CalculationHistory that also stores every entry in a
+local SQLite database. The Tk thread only puts entries on a queue; a writer
+thread drains the queue and inserts whatever has arrived in one
+transaction (up to WRITE_BATCH rows), so a button click never waits for
+the disk and a burst of entries costs one commit.
+
+Schema:
+
+    ops(id INTEGER PRIMARY KEY, name TEXT UNIQUE)     interned op names
+    history(id INTEGER PRIMARY KEY, ts REAL, op INTEGER,
+            num1 REAL, num2 REAL, result REAL)
+    indexes: (op, ts), (ts), (num1), (num2)
+
+history.id is the entry's position + 1, so the history panel pages through
+earlier sessions by primary key. NaN operands and results are stored as
+NULL (sqlite3 binds NaN that way) and read back as NaN; an id whose row
+could not be written reads as a placeholder entry. Entries of the running session are shown
+from memory, as with the other histories. The indexes serve query() and
+filtered() (by operation, time range and operand range, feeding a filtered
+history panel) and summary() (per-operation batch reports).
+
+Reads use their own connection on the calling thread; the database runs in
+WAL mode so they never wait for the writer.
+"""
+
+import math
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+
+from calculator_history import CalculationHistory
+from calculator_logging import get_logger
+
+
+log = get_logger("calculator_historydb")
+
+# Most rows inserted per transaction
+WRITE_BATCH = 10_000
+
+# Writer connection: page cache (KiB) and WAL pages between checkpoints.
+# The operand indexes take inserts at random positions; a cache larger than
+# SQLite's 2 MB default keeps more of their pages (about 1.6x the insert
+# rate at a million rows), and fewer checkpoints write each page less often.
+WRITER_CACHE_KIB = 65536
+WRITER_CHECKPOINT_PAGES = 10_000
+
+# Newest matches held by a filtered view (8 bytes each), so filtering ten
+# million entries takes about as long as filtering a million
+FILTER_LIMIT = 100_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ops (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    op INTEGER NOT NULL REFERENCES ops(id),
+    num1 REAL,
+    num2 REAL,
+    result REAL
+);
+CREATE INDEX IF NOT EXISTS history_op_ts ON history(op, ts);
+CREATE INDEX IF NOT EXISTS history_ts ON history(ts);
+CREATE INDEX IF NOT EXISTS history_num1 ON history(num1);
+CREATE INDEX IF NOT EXISTS history_num2 ON history(num2);
+"""
+
+INSERT_HISTORY = "INSERT OR REPLACE INTO history VALUES (?, ?, ?, ?, ?, ?)"
+
+# Queue commands besides history rows
+_OP = "op"
+_CLEAR = "clear"
+_SYNC = "sync"
+_FILTER = "filter"
+_STOP = "stop"
+
+
+# fetch() result for an id with no row (one that failed to insert)
+_MISSING = (math.nan, "?", math.nan, math.nan, math.nan)
+
+
+def _real(value):
+    """SQLite stores NaN (an unused expression variable, a NaN result) as NULL."""
+    return math.nan if value is None else value
+
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class SQLiteHistory(CalculationHistory):
+    """CalculationHistory stored in SQLite by a background writer thread."""
+
+    def __init__(self, path, clock=time.time):
+        """
+        Opens (or creates) the database and starts the writer thread.
+
+        Args:
+            path: The database file
+            clock: Returns the timestamp stored with each entry
+
+        Raises:
+            sqlite3.Error: If the file is not a usable database
+        """
+        super().__init__()
+        self.path = str(path)
+        self.clock = clock
+        self.error = None               # Last error of the writer thread
+        self._reader = _connect(self.path)
+        self._reader.executescript(SCHEMA)
+        for code, name in self._reader.execute("SELECT id, name FROM ops ORDER BY id"):
+            # Codes are contiguous from 0, as CalculationHistory assigns them
+            self._codes[name] = code
+            self.op_names.append(name)
+        self._stored = self._reader.execute(
+            "SELECT coalesce(max(id), 0) FROM history"
+        ).fetchone()[0]                 # Entries of earlier sessions
+
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop,
+                                        name="history-writer", daemon=True)
+        self._writer.start()
+
+    # ----------------------------------------------------------------
+    # Tk thread: appending
+    # ----------------------------------------------------------------
+
+    def op_code(self, op_name):
+        """Interns an operation name; new names are queued for the ops table."""
+        code = self._codes.get(op_name)
+        if code is None:
+            code = super().op_code(op_name)
+            self._queue.put((_OP, code, op_name))
+        return code
+
+    def append(self, op_name, num1, num2, result):
+        """Records one calculation in memory and queues it for the database."""
+        entry_id = len(self) + 1
+        super().append(op_name, num1, num2, result)
+        self._queue.put((entry_id, self.clock(), self.op_codes[-1],
+                         self.num1[-1], self.num2[-1], self.results[-1]))
+
+    def clear(self):
+        """Forgets every entry, in the database as well."""
+        super().clear()
+        self._stored = 0
+        self._queue.put((_CLEAR,))
+
+    def wait(self, timeout=None):
+        """
+        Blocks until everything queued so far is committed.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        done = threading.Event()
+        self._queue.put((_SYNC, done))
+        return done.wait(timeout)
+
+    def close(self):
+        """Commits the queued entries and stops the writer thread."""
+        if not self._writer.is_alive():
+            return
+        self._queue.put((_STOP,))
+        self._writer.join()
+        self._reader.close()
+
+    # ----------------------------------------------------------------
+    # Writer thread
+    # ----------------------------------------------------------------
+
+    def _write_loop(self):
+        """Inserts queued rows in transactions until stopped."""
+        connection = _connect(self.path)
+        connection.execute(f"PRAGMA cache_size=-{WRITER_CACHE_KIB}")
+        connection.execute(f"PRAGMA wal_autocheckpoint={WRITER_CHECKPOINT_PAGES}")
+        rows = []
+        try:
+            while True:
+                # Wait for work, then take whatever else is already queued
+                item = self._queue.get()
+                while True:
+                    kind = item[0]
+                    if isinstance(kind, int):
+                        rows.append(item)
+                        if len(rows) >= WRITE_BATCH:
+                            self._commit(connection, rows)
+                    else:
+                        self._commit(connection, rows)
+                        if kind == _STOP:
+                            return
+                        self._run_command(connection, item)
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._commit(connection, rows)
+        finally:
+            connection.close()
+
+    def _commit(self, connection, rows):
+        """Inserts rows in one transaction and empties the list."""
+        if not rows:
+            return
+        try:
+            with connection:
+                connection.executemany(INSERT_HISTORY, rows)
+        except sqlite3.IntegrityError:
+            # One bad row must not cost the whole batch (e.g. a NaN result
+            # in a database created when result was NOT NULL)
+            for row in rows:
+                try:
+                    with connection:
+                        connection.execute(INSERT_HISTORY, row)
+                except sqlite3.Error as e:
+                    self.error = e
+                    log.error("Could not write a history entry", id=row[0],
+                              error=repr(e))
+        except sqlite3.Error as e:
+            self.error = e
+            log.error("Could not write the history database", error=repr(e))
+        rows.clear()
+
+    def _run_command(self, connection, item):
+        try:
+            if item[0] == _OP:
+                with connection:
+                    connection.execute("INSERT OR REPLACE INTO ops VALUES (?, ?)",
+                                       item[1:])
+            elif item[0] == _CLEAR:
+                with connection:
+                    connection.execute("DELETE FROM history")
+                    connection.execute("DELETE FROM ops")
+        except sqlite3.Error as e:
+            self.error = e
+            log.error("Could not write the history database", error=repr(e))
+        if item[0] == _SYNC:
+            item[1].set()
+        elif item[0] == _FILTER:
+            _, query, conditions = item
+            try:
+                query.view = self._filter(connection, **conditions)
+            except sqlite3.Error as e:
+                query.error = e
+            query.finished.set()
+
+    # ----------------------------------------------------------------
+    # Reading
+    # ----------------------------------------------------------------
+
+    def __len__(self):
+        return self._stored + len(self.op_codes)
+
+    def row(self, index):
+        """Returns (op_name, num1, num2, result) of any entry, old or new."""
+        if index < 0:
+            index += len(self)
+        if index >= self._stored:
+            return super().row(index - self._stored)
+        return self.fetch(index + 1)[1:]
+
+    def fetch(self, entry_id):
+        """
+        Reads one stored entry by id (position + 1).
+
+        Returns:
+            tuple: (timestamp, op_name, num1, num2, result); op_name "?"
+                and NaNs if the entry is missing
+        """
+        row = self._reader.execute(
+            "SELECT ts, op, num1, num2, result FROM history WHERE id = ?", (entry_id,)
+        ).fetchone()
+        if row is None:
+            return _MISSING
+        ts, code, num1, num2, result = row
+        return ts, self.op_names[code], _real(num1), _real(num2), _real(result)
+
+    def _where(self, op, since, until, operand_min, operand_max):
+        """Builds the WHERE clause shared by query(), filtered() and summary()."""
+        clauses, parameters = [], []
+        if op is not None:
+            clauses.append("op = ?")
+            parameters.append(self._codes.get(op, -1))
+        if since is not None:
+            clauses.append("ts >= ?")
+            parameters.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            parameters.append(until)
+        if operand_min is not None or operand_max is not None:
+            low = float("-inf") if operand_min is None else operand_min
+            high = float("inf") if operand_max is None else operand_max
+            clauses.append("(num1 BETWEEN ? AND ? OR num2 BETWEEN ? AND ?)")
+            parameters.extend((low, high, low, high))
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, parameters
+
+    def query(self, op=None, since=None, until=None, operand_min=None,
+              operand_max=None, limit=None):
+        """
+        Returns stored entries matching every given condition, oldest first.
+
+        Args:
+            op (str): Operation name or expression text
+            since, until (float): Time range [since, until) in epoch seconds
+            operand_min, operand_max (float): Either operand in this range
+            limit (int): Most rows returned
+
+        Returns:
+            list: (id, timestamp, op_name, num1, num2, result) tuples
+        """
+        where, parameters = self._where(op, since, until, operand_min, operand_max)
+        sql = f"SELECT id, ts, op, num1, num2, result FROM history{where} ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        names = self.op_names
+        return [(entry_id, ts, names[code], _real(num1), _real(num2), _real(result))
+                for entry_id, ts, code, num1, num2, result
+                in self._reader.execute(sql, parameters)]
+
+    def filtered(self, op=None, since=None, until=None, operand_min=None,
+                 operand_max=None, limit=FILTER_LIMIT):
+        """
+        Returns a read-only view of the newest limit matching stored entries
+        that a HistoryPanel can show; only their ids are held in memory.
+        Entries still queued for the writer are not included (see
+        filtered_later()).
+        """
+        return self._filter(self._reader, op, since, until, operand_min,
+                            operand_max, limit)
+
+    def filtered_later(self, **conditions):
+        """
+        Runs filtered() on the writer thread, after the entries queued so far
+        are committed, so the caller never waits for the disk.
+
+        Args:
+            **conditions: filtered()'s arguments
+
+        Returns:
+            FilterQuery: Poll done(), then read view (or error)
+        """
+        query = FilterQuery()
+        self._queue.put((_FILTER, query, conditions))
+        return query
+
+    def _filter(self, connection, op=None, since=None, until=None, operand_min=None,
+                operand_max=None, limit=FILTER_LIMIT):
+        where, parameters = self._where(op, since, until, operand_min, operand_max)
+        ids = array('q')
+        # Newest by time: the (op, ts) and (ts) indexes return them in order,
+        # where ORDER BY id would sort every match first
+        cursor = connection.execute(
+            f"SELECT id FROM history{where} ORDER BY ts DESC, id DESC LIMIT ?",
+            [*parameters, limit]
+        )
+        while True:
+            chunk = cursor.fetchmany(WRITE_BATCH)
+            if not chunk:
+                break
+            ids.extend(entry_id for entry_id, in chunk)
+        ids.reverse()
+        return HistoryView(self, ids)
+
+    def summary(self, since=None, until=None):
+        """
+        Per-operation batch report of the stored entries.
+
+        Returns:
+            list: (op_name, count, min, max, mean) of the results; NaN
+                results count but are left out of min, max and mean
+        """
+        where, parameters = self._where(None, since, until, None, None)
+        rows = self._reader.execute(
+            "SELECT op, count(*), min(result), max(result), avg(result) "
+            f"FROM history{where} GROUP BY op ORDER BY op", parameters
+        )
+        return [(self.op_names[code], count, _real(low), _real(high), _real(mean))
+                for code, count, low, high, mean in rows]
+
+
+class FilterQuery:
+    """A filtered() call handed to the writer thread."""
+
+    def __init__(self):
+        self.view = None                # The HistoryView, once done
+        self.error = None               # Or the sqlite3.Error it failed with
+        self.finished = threading.Event()
+
+    def done(self):
+        return self.finished.is_set()
+
+
+class HistoryView(CalculationHistory):
+    """A filtered, read-only selection of SQLiteHistory entries."""
+
+    def __init__(self, history, ids):
+        """
+        Args:
+            history (SQLiteHistory): The database history
+            ids (array): Matching entry ids, oldest first
+        """
+        super().__init__()
+        self.history = history
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, index):
+        return self.history.fetch(self.ids[index])[1:]
+
+    def format_row(self, index):
+        # Numbered by position in the whole history, not in the view
+        return self.history.format_row(self.ids[index] - 1)
+
+    def append(self, *entry):
+        raise TypeError("A filtered history view is read-only")
+
+    def clear(self):
+        """Views forget their selection; the history itself is kept."""
+        self.ids = array('q')
@@ -0,0 +1,379 @@
+"""
+History Log - calculation history that persists across restarts
+Author: Team Five
+
+Description:
+PersistentHistory is a CalculationHistory that also appends every entry to
+an append-only binary log, and on start-up shows the entries of earlier
+sessions straight from the memory-mapped log instead of loading them.
+
+Files (for a log path "calculator_history.log"):
+
+    calculator_history.log        16-byte header, then fixed 36-byte
+                                  records: timestamp (float64), op code
+                                  (uint32), num1, num2, result (float64),
+                                  little-endian
+    calculator_history.log.names  interned operation names (the four
+                                  operations, expression texts), one per
+                                  line; op code = line number
+    calculator_history.log.idx    sparse index: the timestamp of every
+                                  INDEX_STRIDE-th record (float64)
+
+Opening a log maps it and reads only the names and the sparse index, so it
+takes the same time for a thousand or tens of millions of records; the
+history panel then pages through the records it shows. find_time() finds
+the first record at or after a time from the sparse index plus one block.
+
+Appends are buffered in memory. flush(), which the app calls every
+HISTORY_FLUSH_MS, only hands the buffer to a writer thread, so the Tk
+thread never waits for the disk: the writer writes the three files and
+fsyncs them at most every fsync_interval seconds (0 - after every write,
+None - never, leaving it to the OS). A record cut off by a crash is
+dropped when the log is opened again.
+"""
+
+import bisect
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+
+from calculator_history import CalculationHistory
+from calculator_logging import get_logger
+
+
+# Header: magic, record size, reserved
+HEADER = struct.Struct("<8sII")
+MAGIC = b"CALCHST1"
+
+# One record: timestamp, op code, num1, num2, result
+RECORD = struct.Struct("<dIddd")
+
+# Records per sparse index entry
+INDEX_STRIDE = 4096
+
+# Default seconds between fsyncs
+DEFAULT_FSYNC_INTERVAL = 1.0
+
+# Interval (ms) at which the app writes buffered entries
+HISTORY_FLUSH_MS = 500
+
+# Queue commands besides writes
+_CLEAR = "clear"
+_SYNC = "sync"
+_STOP = "stop"
+
+log = get_logger("calculator_historylog")
+
+
+class HistoryLogError(Exception):
+    """The history log exists but is not a log this version can read."""
+
+
+class PersistentHistory(CalculationHistory):
+    """CalculationHistory backed by an append-only, memory-mapped log."""
+
+    def __init__(self, path, fsync_interval=DEFAULT_FSYNC_INTERVAL, clock=time.time):
+        """
+        Opens (or creates) the log, maps the records of earlier sessions
+        and starts the writer thread.
+
+        Args:
+            path: The log file; the .names and .idx files sit next to it
+            fsync_interval (float): Seconds between fsyncs; 0 fsyncs every
+                write, None never fsyncs
+            clock: Returns the timestamp stored with each entry
+
+        Raises:
+            HistoryLogError: If the file is not a history log
+            OSError: If the files cannot be opened
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.names_path = self.path.with_name(self.path.name + ".names")
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.fsync_interval = fsync_interval
+        self.clock = clock
+        self.error = None                   # Last error of the writer thread
+        self.timestamps = array('d')        # This session's entries
+        self.sparse_index = array('d')
+        self._map = None
+        self._mapped = 0                    # Records of earlier sessions
+        self._pending_names = []
+        self._pending_records = bytearray()
+        self._pending_index = array('d')
+        self._open()
+
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop,
+                                        name="history-log-writer", daemon=True)
+        self._writer.start()
+
+    # ----------------------------------------------------------------
+    # Opening
+    # ----------------------------------------------------------------
+
+    def _open(self):
+        """Checks the files, drops torn writes, maps the records, loads names and index."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            self.path.write_bytes(HEADER.pack(MAGIC, RECORD.size, 0))
+        with self.path.open("rb") as log:
+            header = log.read(HEADER.size)
+        if len(header) < HEADER.size or HEADER.unpack(header)[:2] != (MAGIC, RECORD.size):
+            raise HistoryLogError(f"{self.path} is not a calculation history log")
+
+        # A crash can leave part of a record at the end
+        size = self.path.stat().st_size
+        self._mapped = (size - HEADER.size) // RECORD.size
+        complete = HEADER.size + self._mapped * RECORD.size
+        if size != complete:
+            os.truncate(self.path, complete)
+
+        self._load_names()
+        self._log = self.path.open("ab")
+        self._names = self.names_path.open("a", encoding="utf-8", newline="\n")
+        if self._mapped:
+            with self.path.open("rb") as log:
+                self._map = mmap.mmap(log.fileno(), complete, access=mmap.ACCESS_READ)
+        self._load_index()
+        self._index_file = self.index_path.open("ab")
+
+    def _load_names(self):
+        """Interns the names of earlier sessions in their code order."""
+        if not self.names_path.exists():
+            return
+        # newline="": names are split on "\n" only, as they were written
+        with self.names_path.open(encoding="utf-8", newline="") as names:
+            text = names.read()
+        lines = text.split("\n")
+        if lines[-1]:
+            # The last name was cut off; no record can refer to it yet
+            with self.names_path.open("r+", encoding="utf-8", newline="") as names:
+                names.truncate(len(text.encode("utf-8")) - len(lines[-1].encode("utf-8")))
+        for name in lines[:-1]:
+            self._codes[name] = len(self.op_names)
+            self.op_names.append(name)
+
+    def _load_index(self):
+        """Reads the sparse index, completing it from the map if it is short."""
+        expected = -(-self._mapped // INDEX_STRIDE)
+        data = self.index_path.read_bytes() if self.index_path.exists() else b""
+        stored = min(len(data) // 8, expected)
+        self.sparse_index.frombytes(data[:stored * 8])
+        for position in range(stored * INDEX_STRIDE, self._mapped, INDEX_STRIDE):
+            self.sparse_index.append(self._mapped_row(position)[0])
+        if len(data) != expected * 8:
+            # Short after a crash, or longer than the records that survived
+            with self.index_path.open("wb") as index:
+                self.sparse_index.tofile(index)
+
+    # ----------------------------------------------------------------
+    # Reading
+    # ----------------------------------------------------------------
+
+    def __len__(self):
+        return self._mapped + len(self.op_codes)
+
+    def _mapped_row(self, index):
+        """Returns (timestamp, code, num1, num2, result) of an earlier session's record."""
+        return RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+
+    def row(self, index):
+        """Returns (op_name, num1, num2, result) of any entry, old or new."""
+        if index < 0:
+            index += len(self)
+        if index >= self._mapped:
+            return super().row(index - self._mapped)
+        _, code, num1, num2, result = self._mapped_row(index)
+        op_name = self.op_names[code] if code < len(self.op_names) else "?"
+        return op_name, num1, num2, result
+
+    def timestamp(self, index):
+        """Returns the time (seconds since the epoch) an entry was recorded."""
+        if index >= self._mapped:
+            return self.timestamps[index - self._mapped]
+        return self._mapped_row(index)[0]
+
+    def find_time(self, timestamp):
+        """
+        Returns the index of the first entry recorded at or after timestamp
+        (len(self) if there is none); timestamps are assumed to grow.
+        """
+        block = max(bisect.bisect_right(self.sparse_index, timestamp) - 1, 0)
+        low, high = block * INDEX_STRIDE, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    # ----------------------------------------------------------------
+    # Tk thread: appending
+    # ----------------------------------------------------------------
+
+    def op_code(self, op_name):
+        """Interns an operation name; new names are queued for the names file."""
+        code = self._codes.get(op_name)
+        if code is None:
+            if op_name and op_name.splitlines() != [op_name]:
+                # One name per line: fold every line break ("\r", "\u2028"...)
+                op_name = " ".join(op_name.split())
+                return self.op_code(op_name)
+            code = super().op_code(op_name)
+            self._pending_names.append(op_name)
+        return code
+
+    def append(self, op_name, num1, num2, result):
+        """Records one calculation in memory and queues it for the log."""
+        timestamp = self.clock()
+        # First, as it is the only step that can fail
+        super().append(op_name, num1, num2, result)
+        if (len(self) - 1) % INDEX_STRIDE == 0:
+            self.sparse_index.append(timestamp)
+            self._pending_index.append(timestamp)
+        self.timestamps.append(timestamp)
+        self._pending_records += RECORD.pack(
+            timestamp, self.op_codes[-1], self.num1[-1], self.num2[-1], self.results[-1]
+        )
+
+    @property
+    def pending(self):
+        """True while entries are buffered but not yet handed to the writer."""
+        return bool(self._pending_records)
+
+    def flush(self):
+        """Hands the buffered entries to the writer thread; never blocks."""
+        if not self._pending_records:
+            return
+        # Names go with the records, so no record on disk refers to a
+        # missing name
+        self._queue.put((self._pending_names, self._pending_records,
+                         self._pending_index))
+        self._pending_names = []
+        self._pending_records = bytearray()
+        self._pending_index = array('d')
+
+    def sync(self, timeout=None):
+        """
+        Blocks until everything appended so far is written and fsync'd.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        self.flush()
+        done = threading.Event()
+        self._queue.put((_SYNC, done))
+        return done.wait(timeout)
+
+    def close(self):
+        """Writes and fsyncs everything, stops the writer, then closes the files."""
+        if self._log.closed:
+            return
+        self.flush()
+        self._queue.put((_STOP,))
+        self._writer.join()
+        for file in (self._names, self._log, self._index_file):
+            file.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def clear(self):
+        """Forgets every entry, on disk as well."""
+        super().clear()
+        self.timestamps = array('d')
+        self.sparse_index = array('d')
+        self._pending_names = []
+        self._pending_records = bytearray()
+        self._pending_index = array('d')
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._mapped = 0
+        self._queue.put((_CLEAR,))
+
+    # ----------------------------------------------------------------
+    # Writer thread
+    # ----------------------------------------------------------------
+
+    def _write_loop(self):
+        """Writes queued entries and fsyncs them until stopped."""
+        unsynced = False
+        last_fsync = time.monotonic()
+        while True:
+            # Wait for work, or until the written data is due for an fsync
+            timeout = None
+            if unsynced and self.fsync_interval is not None:
+                timeout = max(last_fsync + self.fsync_interval - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            while item is not None:
+                kind = item[0]
+                if kind == _STOP:
+                    if unsynced:
+                        self._fsync()
+                    return
+                if kind == _SYNC:
+                    if unsynced:
+                        self._fsync()
+                        unsynced = False
+                        last_fsync = time.monotonic()
+                    item[1].set()
+                else:
+                    unsynced = self._write(item) or unsynced
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            if (unsynced and self.fsync_interval is not None
+                    and time.monotonic() - last_fsync >= self.fsync_interval):
+                self._fsync()
+                unsynced = False
+                last_fsync = time.monotonic()
+
+    def _write(self, item):
+        """Writes one handed-over buffer, or clears the files; True on success."""
+        try:
+            if item[0] == _CLEAR:
+                for file in (self._names, self._log, self._index_file):
+                    file.truncate(0)
+                self._log.write(HEADER.pack(MAGIC, RECORD.size, 0))
+                self._log.flush()
+                return True
+            names, records, index = item
+            if names:
+                self._names.write("".join(name + "\n" for name in names))
+                self._names.flush()
+            self._log.write(records)
+            self._log.flush()
+            if index:
+                index.tofile(self._index_file)
+                self._index_file.flush()
+            return True
+        except OSError as e:
+            self.error = e
+            log.error("Could not write the history log", error=repr(e))
+            return False
+
+    def _fsync(self):
+        """fsyncs the names, the log and the index."""
+        try:
+            for file in (self._names, self._log, self._index_file):
+                os.fsync(file.fileno())
+        except OSError as e:
+            self.error = e
+            log.error("Could not fsync the history log", error=repr(e))
+
+    def memory_bytes(self):
+        """Bytes held in memory; the mapped records are not counted."""
+        return (super().memory_bytes() + sys.getsizeof(self.timestamps)
+                + sys.getsizeof(self.sparse_index))
@@ -0,0 +1,81 @@
+"""
+Live Evaluation - debounced recompute while the numbers are typed
+Author: Team Five
+
+Description:
+In live mode CalculatorApp recomputes the result as the numbers are typed.
+A recompute per keystroke would calculate (and paint) every prefix of a
+number: typing "1234" would show the results for 1, 12 and 123 on the way.
+Debouncer instead runs its callback once the input has been quiet for
+delay_ms, so a burst of keystrokes costs one recompute.
+
+The app then skips recomputes whose parsed operands did not change ("5" ->
+"5." -> "5.0", or a leading space) and drops results that a newer recompute
+superseded while they were in flight. LiveCounts keeps the tallies that
+benchmarks/bench_live.py reports.
+
+The delay trades latency for work: the result settles delay_ms after the
+last keystroke, and pauses shorter than delay_ms between keystrokes cost
+no recompute. With keystrokes 60-220 ms apart, LIVE_DEBOUNCE_MS roughly
+halves the recomputes of updating on every keystroke; a delay above the
+slowest gap (250 ms) leaves about two per pair of numbers, at a visibly
+later result (see benchmarks/bench_live.py).
+
+This module never imports tkinter.
+"""
+
+
+# Quiet time (ms) after the last keystroke before recomputing
+LIVE_DEBOUNCE_MS = 150
+
+
+class Debouncer:
+    """Runs a callback once its triggers have been quiet for a while."""
+
+    def __init__(self, root, delay_ms, callback):
+        """
+        Args:
+            root: The Tk root (anything with after() and after_cancel())
+            delay_ms (int): Quiet time before the callback runs
+            callback: Called without arguments
+        """
+        self.root = root
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._after_id = None
+
+    @property
+    def pending(self):
+        return self._after_id is not None
+
+    def trigger(self, *args):
+        """Restarts the quiet period; accepts (and ignores) trace arguments."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(self.delay_ms, self._fire)
+
+    def cancel(self):
+        """Forgets a pending run."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _fire(self):
+        self._after_id = None
+        self.callback()
+
+
+class LiveCounts:
+    """Tallies of a live session."""
+
+    __slots__ = ("triggers", "recomputed", "unchanged", "stale", "painted")
+
+    def __init__(self):
+        self.triggers = 0       # Keystrokes (writes to either number)
+        self.recomputed = 0     # Calculations started
+        self.unchanged = 0      # Recomputes skipped: same parsed operands
+        self.stale = 0          # Results dropped: superseded in flight
+        self.painted = 0        # Result label updates
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
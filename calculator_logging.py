@@ -0,0 +1,220 @@
+"""
+Calculator Logging - leveled, structured logging off the Tk thread
+Author: Team Five
+
+Description:
+The apps used to print() a line on every calculation, clear and greeting.
+print() writes synchronously: with stdout piped to a slow reader (or a
+stalled terminal) the write blocks, and so does the Tk main loop.
+
+The apps now log through Logger objects. A log call only puts a tuple
+(time, level, logger, message, fields) on a queue; a writer thread
+formats the records and writes them to the stream. The queue is bounded:
+if the writer falls LOG_QUEUE_SIZE records behind, new records are dropped
+(and counted) rather than blocking the caller.
+
+Records are structured: keyword arguments are fields, printed as key=value
+pairs after the message, or as the keys of one JSON object per line with
+CALCULATOR_LOG_FORMAT=json:
+
+    log.info("Calculated", op="Division", num1=6, num2=3, result=2)
+    2025-06-02 10:15:04.132 INFO    breakout2  Calculated  op=Division ...
+
+CALCULATOR_LOG picks the level: debug, info (the default), warning, error,
+or off. Until setup_logging() runs, and with logging off, a log call
+returns after one comparison; info and debug calls that pass fields and
+run per click, calculation or connection check log.enabled(level) first,
+so with logging off they do not even build the fields.
+
+The standard logging module is not used: importing it (with
+logging.handlers for its queue handler) would add about 20 ms to the
+calculator's start-up, close to what all its other imports, tkinter
+included, take.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+
+
+# Environment variables read by setup_logging()
+LOG_LEVEL_ENV = "CALCULATOR_LOG"
+LOG_FORMAT_ENV = "CALCULATOR_LOG_FORMAT"
+
+# Most records waiting for the writer thread
+LOG_QUEUE_SIZE = 10_000
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+LEVEL_NAMES = {level: name.upper() for name, level in LEVELS.items()}
+
+
+class _State:
+    """The process-wide level, queue and writer thread."""
+
+    level = OFF
+    queue = None
+    writer = None
+    dropped = 0
+
+
+def _emit(level, name, message, fields):
+    log_queue = _State.queue
+    if log_queue is None:
+        return  # Shut down by another thread since the level check
+    if log_queue.qsize() >= LOG_QUEUE_SIZE:
+        _State.dropped += 1
+        return
+    log_queue.put((time.time(), level, name, message, fields))
+
+
+class Logger:
+    """Leveled logger of one module; see get_logger()."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def enabled(self, level):
+        """True if records of level are written."""
+        return level >= _State.level
+
+    def debug(self, message, **fields):
+        if DEBUG >= _State.level:
+            _emit(DEBUG, self.name, message, fields)
+
+    def info(self, message, **fields):
+        if INFO >= _State.level:
+            _emit(INFO, self.name, message, fields)
+
+    def warning(self, message, **fields):
+        if WARNING >= _State.level:
+            _emit(WARNING, self.name, message, fields)
+
+    def error(self, message, **fields):
+        if ERROR >= _State.level:
+            _emit(ERROR, self.name, message, fields)
+
+
+def get_logger(name):
+    """Returns a logger named after its module, e.g. get_logger("breakout2")."""
+    return Logger(name)
+
+
+def format_text(record):
+    """Formats a record as one line of text with key=value fields."""
+    created, level, name, message, fields = record
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+    text = f"{stamp}.{int(created % 1 * 1000):03d} {LEVEL_NAMES[level]:<7} {name}  {message}"
+    if fields:
+        text += "  " + " ".join(f"{key}={value}" for key, value in fields.items())
+    return text
+
+
+def format_json(record):
+    """Formats a record as one JSON object; fields never replace its own keys."""
+    import json
+
+    created, level, name, message, fields = record
+    return json.dumps({**fields, "time": created, "level": LEVEL_NAMES[level].lower(),
+                       "logger": name, "message": message}, default=str)
+
+
+class LogWriter(threading.Thread):
+    """Writes queued records to a stream until it gets None."""
+
+    def __init__(self, log_queue, stream, formatter):
+        super().__init__(name="log-writer", daemon=True)
+        self.queue = log_queue
+        self.stream = stream
+        self.formatter = formatter
+
+    def run(self):
+        while True:
+            record = self.queue.get()
+            # Write everything queued so far, then flush once
+            lines = []
+            while record is not None:
+                lines.append(self.format(record) + "\n")
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                self.stream.write("".join(lines))
+                self.stream.flush()
+            except (OSError, ValueError):
+                pass  # Stream closed; nothing left to tell
+            if record is None:
+                return
+
+    def format(self, record):
+        """Formats a record; one whose fields cannot be formatted keeps its message."""
+        try:
+            return self.formatter(record)
+        except Exception as e:
+            created, level, name, message, _ = record
+            return self.formatter((created, level, name, message,
+                                   {"format_error": type(e).__name__}))
+
+
+def setup_logging(level=None, json_lines=None, stream=None):
+    """
+    Starts writing log records from a background thread.
+
+    Args:
+        level (str): debug, info, warning, error or off; None reads
+            CALCULATOR_LOG (default info)
+        json_lines (bool): One JSON object per record; None reads
+            CALCULATOR_LOG_FORMAT
+        stream: Where the writer thread writes (default sys.stdout)
+
+    Returns:
+        bool: True if logging is on
+    """
+    shutdown_logging()
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, "info").lower()
+    if json_lines is None:
+        json_lines = os.environ.get(LOG_FORMAT_ENV, "text").lower() == "json"
+    if level not in LEVELS:
+        if level != "off":
+            print(f"Unknown log level {level!r} (use {', '.join(LEVELS)} or off) "
+                  "- logging is off")
+        return False
+
+    _State.queue = queue.SimpleQueue()
+    _State.dropped = 0
+    _State.writer = LogWriter(_State.queue, sys.stdout if stream is None else stream,
+                              format_json if json_lines else format_text)
+    _State.writer.start()
+    _State.level = LEVELS[level]
+    return True
+
+
+def shutdown_logging(timeout=2.0):
+    """
+    Turns logging off and writes the records still queued.
+
+    Args:
+        timeout (float): Longest wait (seconds) for a blocked stream
+    """
+    _State.level = OFF
+    if _State.writer is not None:
+        _State.queue.put(None)
+        _State.writer.join(timeout)
+        _State.writer = None
+        _State.queue = None
+
+
+def dropped_records():
+    """Records dropped because the writer thread was too far behind."""
+    return _State.dropped
@@ -0,0 +1,369 @@
+"""
+Calculator Metrics - counters and latency histograms, Prometheus export
+Author: Team Five
+
+Description:
+Always-on operational metrics for CalculatorApp:
+
+    calculator_calculations_total{op}           results shown
+    calculator_validation_failures_total        invalid numbers entered
+    calculator_calculation_errors_total{op}     other calculation errors
+    calculator_division_by_zero_effects_total   effects triggered
+    calculator_cache_hits_total                 results from the cache
+    calculator_cache_misses_total               results calculated
+    calculator_operation_duration_seconds{op}   click until the result is
+                                                shown (histogram)
+    calculator_callback_duration_seconds{callback}
+                                                time inside Tk callbacks
+                                                (histogram)
+
+Updating a metric is an attribute increment (counters) or a bisect into a
+dozen bucket bounds plus two increments (histograms), so it stays well under
+a microsecond (see benchmarks/bench_metrics.py). A labelled child is looked
+up once per label value and cached.
+
+MetricsRegistry.render() produces the Prometheus text exposition format.
+MetricsExporter writes it from a background thread to a file every
+interval, replacing the file atomically, for node_exporter's textfile
+collector. show_metrics() is the in-app Diagnostics > Metrics window.
+
+Readers on other threads may see a histogram mid-update (a count without
+its sum); Prometheus tolerates that, and the next export is consistent.
+
+This module imports tkinter only inside show_metrics().
+"""
+
+import bisect
+import os
+from abc import ABC, abstractmethod
+import threading
+import time
+from functools import wraps
+
+from calculator_logging import get_logger
+
+
+log = get_logger("calculator_metrics")
+
+# Histogram bucket upper bounds (seconds): 100 us to 1 s
+DURATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Seconds between textfile exports
+METRICS_EXPORT_INTERVAL = 15.0
+
+# Interval (ms) at which the metrics window refreshes
+METRICS_REFRESH_MS = 1000
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if value == float("inf"):
+            return "+Inf"
+        return repr(value)
+    return str(value)
+
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace('"', r'\"').replace("\n", r"\n")
+
+
+# ====================================================================
+# METRIC TYPES
+# ====================================================================
+
+class CounterChild:
+    """One labelled series of a counter."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class HistogramChild:
+    """One labelled series of a histogram."""
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)     # Last: above every bound
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+
+class Metric(ABC):
+    """A named metric family with zero or more labels."""
+
+    kind = None
+
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._children = {}
+        if not self.label_names:
+            self._unlabelled = self.labels()
+
+    @abstractmethod
+    def _new_child(self):
+        """Returns a new series (CounterChild, HistogramChild)."""
+
+    @abstractmethod
+    def render(self):
+        """Returns the metric's sample lines in the text exposition format."""
+
+    def labels(self, *values):
+        """Returns the series of these label values, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} takes labels {self.label_names}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def children(self):
+        """Returns (label values, child) pairs; safe while others are added."""
+        return list(self._children.items())
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return CounterChild()
+
+    def inc(self, amount=1):
+        """Increments an unlabelled counter."""
+        self._unlabelled.value += amount
+
+    def render(self):
+        return [f"{self.name}{_format_labels(self.label_names, values)} "
+                f"{_format_value(child.value)}"
+                for values, child in self.children()]
+
+
+class Histogram(Metric):
+    """Observations counted in cumulative buckets, plus their sum."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, label_names=(), buckets=DURATION_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help_text, label_names)
+
+    def _new_child(self):
+        return HistogramChild(self.buckets)
+
+    def observe(self, value):
+        """Observes a value in an unlabelled histogram."""
+        self._unlabelled.observe(value)
+
+    def render(self):
+        lines = []
+        for values, child in self.children():
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket"
+                             f"{_format_labels(self.label_names, values, le)} {cumulative}")
+            labels = _format_labels(self.label_names, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """The metrics of one app, rendered together."""
+
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name, help_text, label_names=()):
+        return self._register(Counter(name, help_text, label_names))
+
+    def histogram(self, name, help_text, label_names=(), buckets=DURATION_BUCKETS):
+        return self._register(Histogram(name, help_text, label_names, buckets))
+
+    def _register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Returns every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Writes render() to path atomically (a temporary file, then a rename)."""
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.render())
+        os.replace(temporary, path)
+
+
+# ====================================================================
+# THE CALCULATOR'S METRICS
+# ====================================================================
+
+class CalculatorMetrics:
+    """The metric families CalculatorApp updates."""
+
+    def __init__(self):
+        self.registry = registry = MetricsRegistry()
+        self.calculations = registry.counter(
+            "calculator_calculations_total", "Calculation results shown, by operation",
+            ("op",))
+        self.validation_failures = registry.counter(
+            "calculator_validation_failures_total", "Calculations refused for invalid numbers")
+        self.errors = registry.counter(
+            "calculator_calculation_errors_total",
+            "Calculations that failed other than by division by zero", ("op",))
+        self.division_by_zero = registry.counter(
+            "calculator_division_by_zero_effects_total",
+            "Division by zero effects triggered")
+        self.cache_hits = registry.counter(
+            "calculator_cache_hits_total", "Results served from the result cache")
+        self.cache_misses = registry.counter(
+            "calculator_cache_misses_total", "Results that had to be calculated")
+        self.operation_seconds = registry.histogram(
+            "calculator_operation_duration_seconds",
+            "Time from a calculation's click until its outcome is shown", ("op",))
+        self.callback_seconds = registry.histogram(
+            "calculator_callback_duration_seconds",
+            "Time spent inside Tk callbacks", ("callback",))
+
+
+def timed_callback(name):
+    """
+    Decorator for CalculatorApp callbacks: observes each call's duration in
+    calculator_callback_duration_seconds{callback=name}.
+    """
+    def decorate(method):
+        @wraps(method)
+        def timed(self, *args):
+            start = time.perf_counter()
+            try:
+                return method(self, *args)
+            finally:
+                self.metrics.callback_seconds.labels(name).observe(
+                    time.perf_counter() - start
+                )
+        return timed
+    return decorate
+
+
+# ====================================================================
+# EXPORT AND DISPLAY
+# ====================================================================
+
+class MetricsExporter:
+    """Writes a registry to a Prometheus textfile every interval, off the Tk thread."""
+
+    def __init__(self, registry, path, interval=METRICS_EXPORT_INTERVAL):
+        """
+        Args:
+            registry (MetricsRegistry): The metrics to write
+            path: The .prom file (node_exporter reads *.prom files)
+            interval (float): Seconds between writes
+        """
+        self.registry = registry
+        self.path = str(path)
+        self.interval = interval
+        self.writes = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Starts the export thread; returns self."""
+        self._thread = threading.Thread(target=self._run, name="metrics-export",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the thread after one last write."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.export()
+        self.export()
+
+    def export(self):
+        """Writes the textfile now."""
+        try:
+            self.registry.write_textfile(self.path)
+        except OSError as e:
+            log.error("Could not write metrics", path=self.path, error=repr(e))
+            return
+        self.writes += 1
+
+
+def show_metrics(root, registry, refresh_ms=METRICS_REFRESH_MS):
+    """
+    Opens a window showing the metrics as exported, refreshed while it is open.
+
+    Args:
+        root: The Tk root window
+        registry (MetricsRegistry): The metrics to show
+        refresh_ms (int): Refresh interval
+
+    Returns:
+        tk.Toplevel: The metrics window
+    """
+    import tkinter as tk
+    from tkinter import ttk
+
+    window = tk.Toplevel(root)
+    window.title("Metrics")
+    text = tk.Text(window, width=96, height=36, font="TkFixedFont")
+    text.pack(fill=tk.BOTH, expand=True)
+    buttons = ttk.Frame(window, padding=5)
+    buttons.pack(fill=tk.X)
+    ttk.Button(buttons, text="Close", command=window.destroy).pack(side=tk.RIGHT)
+
+    def refresh():
+        if not window.winfo_exists():
+            return
+        # Keep the scroll position across refreshes
+        top = text.yview()[0]
+        text.configure(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        text.insert("1.0", registry.render())
+        text.configure(state=tk.DISABLED)
+        text.yview_moveto(top)
+        root.after(refresh_ms, refresh)
+
+    refresh()
+    return window
@@ -0,0 +1,208 @@
+"""
+Parallel Batch Calculations - sharding large batches across processes
+Author: Team Five
+
+Description:
+For batch jobs bigger than one core can handle, the operand columns are
+split into chunks and computed by a ProcessPoolExecutor. Operands and
+results live in one multiprocessing.shared_memory block, so workers read
+and write the arrays in place and nothing but the chunk boundaries is
+pickled. Every chunk writes to its own slice of the result, which keeps
+the output in input order without any reassembly step.
+
+Used through Calculator.calculate_batch(..., workers=N), which reuses one
+shared ParallelCalculator per worker count for the life of the process,
+or directly via ParallelCalculator, which keeps its worker pool alive
+between calls.
+"""
+
+import atexit
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from calculator_core import Calculator, OPERATIONS, ZERO_DIVISION_POLICIES
+
+
+# Smallest chunk worth sending to a worker: large enough that the NumPy
+# work (~1 ns per element) dwarfs the per-task IPC cost (~100 us)
+MIN_CHUNK_SIZE = 1 << 18
+
+# Chunks per worker; a few per worker smooth out uneven scheduling
+CHUNKS_PER_WORKER = 4
+
+# Below this many elements a batch runs in the calling process
+MIN_PARALLEL_SIZE = 1 << 20
+
+
+def choose_chunk_size(size, workers):
+    """
+    Picks the number of elements per task.
+
+    Aims for CHUNKS_PER_WORKER chunks per worker for load balancing, but
+    never goes below MIN_CHUNK_SIZE so task overhead stays negligible.
+
+    Args:
+        size (int): Total number of elements
+        workers (int): Number of worker processes
+
+    Returns:
+        int: Elements per chunk
+    """
+    return max(MIN_CHUNK_SIZE, math.ceil(size / (workers * CHUNKS_PER_WORKER)))
+
+
+# ====================================================================
+# WORKER SIDE
+# ====================================================================
+
+def _compute_chunk(block_name, size, operation, zero_division, start, stop):
+    """Computes one chunk in a worker process, in place in shared memory."""
+    # Pool workers share the parent's resource tracker, so attaching here
+    # never causes the block to be unlinked behind the parent's back
+    block = shared_memory.SharedMemory(name=block_name)
+    arrays = np.ndarray((3, size), dtype=np.float64, buffer=block.buf)
+    try:
+        arrays[2, start:stop] = Calculator.calculate_batch(
+            operation, arrays[0, start:stop], arrays[1, start:stop], zero_division
+        )
+    finally:
+        # Views must be released before the block can be closed
+        del arrays
+        block.close()
+    return stop - start
+
+
+# ====================================================================
+# PARALLEL CALCULATOR
+# ====================================================================
+
+class ParallelCalculator:
+    """Runs Calculator.calculate_batch across a pool of worker processes."""
+
+    def __init__(self, workers=None, chunk_size=None):
+        """
+        Creates the calculator; the worker pool starts on first use.
+
+        Args:
+            workers (int): Worker processes (default: os.cpu_count())
+            chunk_size (int): Elements per task (default: choose_chunk_size)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def shutdown(self):
+        """Stops the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def calculate_batch(self, operation, operands1, operands2, zero_division="nan"):
+        """
+        Same contract as Calculator.calculate_batch, computed in parallel.
+
+        Raises:
+            ValueError: For an unknown operation or zero-division policy
+            ZeroDivisionError: For zero divisors under the "raise" policy
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation!r}")
+        if zero_division not in ZERO_DIVISION_POLICIES:
+            raise ValueError(f"Unknown zero-division policy: {zero_division!r}")
+
+        operands1, operands2 = np.broadcast_arrays(
+            np.asarray(operands1, dtype=np.float64),
+            np.asarray(operands2, dtype=np.float64),
+        )
+        shape, size = operands1.shape, operands1.size
+        if size < MIN_PARALLEL_SIZE:
+            return Calculator.calculate_batch(
+                operation, operands1, operands2, zero_division
+            )
+
+        zero_divisors = None
+        worker_policy = zero_division
+        if operation == "divide" and zero_division in ("mask", "raise"):
+            zero_divisors = operands2 == 0
+            if zero_division == "raise" and zero_divisors.any():
+                raise ZeroDivisionError("Cannot divide by zero!")
+            worker_policy = "inf"
+
+        block = shared_memory.SharedMemory(create=True, size=3 * size * 8)
+        arrays = np.ndarray((3, size), dtype=np.float64, buffer=block.buf)
+        try:
+            arrays[0] = operands1.ravel()
+            arrays[1] = operands2.ravel()
+            self._run_chunks(block.name, size, operation, worker_policy)
+            result = arrays[2].reshape(shape).copy()
+        finally:
+            # Views must be released before the block can be closed
+            del arrays
+            block.close()
+            block.unlink()
+
+        if zero_division == "mask" and zero_divisors is not None:
+            return np.ma.masked_array(result, mask=zero_divisors)
+        return result
+
+    def _run_chunks(self, block_name, size, operation, zero_division):
+        """Submits every chunk and waits for all of them."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        chunk_size = self.chunk_size or choose_chunk_size(size, self.workers)
+        futures = [
+            self._executor.submit(
+                _compute_chunk, block_name, size, operation, zero_division,
+                start, min(start + chunk_size, size)
+            )
+            for start in range(0, size, chunk_size)
+        ]
+        for future in futures:
+            future.result()
+
+
+# (workers, chunk_size) -> ParallelCalculator shared by calculate_batch_parallel
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def calculate_batch_parallel(operation, operands1, operands2, zero_division="nan",
+                             workers=None, chunk_size=None):
+    """
+    Parallel batch calculation on a shared, long-lived worker pool.
+
+    The pool for a worker count starts on the first batch large enough to
+    need it and is reused by later calls; it stops when the process exits
+    (or on shutdown_shared()). See Calculator.calculate_batch for the
+    arguments and return value.
+    """
+    key = (workers or os.cpu_count() or 1, chunk_size)
+    with _shared_lock:
+        calculator = _shared.get(key)
+        if calculator is None:
+            calculator = _shared[key] = ParallelCalculator(*key)
+    return calculator.calculate_batch(operation, operands1, operands2, zero_division)
+
+
+def shutdown_shared():
+    """Stops the worker pools of calculate_batch_parallel."""
+    with _shared_lock:
+        calculators = list(_shared.values())
+        _shared.clear()
+    for calculator in calculators:
+        calculator.shutdown()
+
+
+atexit.register(shutdown_shared)
@@ -0,0 +1,247 @@
+"""
+Bulk Number Parsing - exception-free validation of whole string batches
+Author: Team Five
+
+Description:
+Backs Calculator.validate_batch. Instead of calling float() inside
+try/except per value (where every invalid value costs a raised ValueError),
+a batch of strings is laid out as a character-class matrix and run through
+a small state machine one column at a time with NumPy, so the whole batch
+is validated in a handful of vectorized steps. Only strings that passed are
+handed to float(), which therefore never raises. Feeds that start out clean
+are first tried through float() directly, a chunk at a time, since that is
+the fastest path when nothing is invalid.
+
+The accepted syntax is exactly Python's float() syntax (sign, "_" digit
+grouping, fraction, exponent, inf/infinity/nan, surrounding whitespace),
+optionally extended with "," thousands separators ("12,345,678.9").
+Rare rows the scanner does not handle (non-ASCII text, very long strings)
+are checked with an equivalent precompiled regular expression instead.
+"""
+
+import re
+from itertools import compress
+
+import numpy as np
+
+
+# Rows handled per scan; bounds the size of the character matrix
+CHUNK_SIZE = 1 << 17
+
+# Strings longer than this skip the matrix and use the regex fallback
+MAX_SCAN_LENGTH = 64
+
+
+# ====================================================================
+# REGEX FALLBACK (same grammar as the scanner)
+# ====================================================================
+
+_DIGITS = r"\d+(?:_\d+)*"
+_NUMBER_BODY = (
+    rf"(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})"
+    rf"(?:[eE][+-]?{_DIGITS})?"
+)
+_SPECIAL_BODY = r"(?i:inf(?:inity)?|nan)"
+_PLAIN_NUMBER = re.compile(
+    rf"\s*[+-]?(?:{_NUMBER_BODY}|{_SPECIAL_BODY})\s*"
+)
+_GROUPED_NUMBER = re.compile(
+    rf"\s*[+-]?(?:\d{{1,3}}(?:,\d{{3}})+(?:\.(?:{_DIGITS})?)?"
+    rf"(?:[eE][+-]?{_DIGITS})?|{_NUMBER_BODY}|{_SPECIAL_BODY})\s*"
+)
+
+
+# ====================================================================
+# CHARACTER CLASSES AND STATE MACHINE
+# ====================================================================
+
+# Character classes; PAD marks the end of a row in the matrix
+(PAD, WS, SIGN, DIGIT, UNDERSCORE, DOT, EXP, COMMA,
+ LETTER_I, LETTER_N, LETTER_F, LETTER_T, LETTER_Y, LETTER_A, OTHER) = range(15)
+CLASS_COUNT = 15
+
+# Byte -> character class (bytes above 127 never reach the scanner)
+_CLASS_TABLE = np.full(256, OTHER, dtype=np.uint8)
+for _char in " \t\n\r\f\v":
+    _CLASS_TABLE[ord(_char)] = WS
+for _char, _cls in (("+", SIGN), ("-", SIGN), ("_", UNDERSCORE), (".", DOT),
+                    (",", COMMA), ("e", EXP), ("i", LETTER_I), ("n", LETTER_N),
+                    ("f", LETTER_F), ("t", LETTER_T), ("y", LETTER_Y),
+                    ("a", LETTER_A)):
+    _CLASS_TABLE[ord(_char)] = _cls
+    _CLASS_TABLE[ord(_char.upper())] = _cls
+_CLASS_TABLE[ord("0"):ord("9") + 1] = DIGIT
+
+# States; REJECT is 0 so unlisted transitions reject
+_STATE_NAMES = (
+    "REJECT", "START", "SIGN", "INT", "INT_US", "LEAD_DOT", "POINT", "FRAC",
+    "FRAC_US", "EXP", "EXP_SIGN", "EXP_INT", "EXP_US", "TRAIL", "DONE",
+    "I", "IN", "INF", "INFI", "INFIN", "INFINI", "INFINIT", "INFINITY",
+    "N", "NA", "NAN", "G1", "G2", "G3", "GC", "GC1", "GC2", "GC3",
+)
+_STATE = {name: index for index, name in enumerate(_STATE_NAMES)}
+
+
+def _build_transitions(thousands_separators):
+    """Builds the (state, class) -> state table for the float grammar."""
+    first_digit = "G1" if thousands_separators else "INT"
+    # Characters that may end a number: whitespace, or the end of the row
+    ending = {WS: "TRAIL", PAD: "DONE"}
+    number_tail = {UNDERSCORE: "INT_US", DOT: "POINT", EXP: "EXP", **ending}
+    rules = {
+        "START": {WS: "START", SIGN: "SIGN", DIGIT: first_digit,
+                  DOT: "LEAD_DOT", LETTER_I: "I", LETTER_N: "N"},
+        "SIGN": {DIGIT: first_digit, DOT: "LEAD_DOT",
+                 LETTER_I: "I", LETTER_N: "N"},
+        "INT": {DIGIT: "INT", **number_tail},
+        "INT_US": {DIGIT: "INT"},
+        "LEAD_DOT": {DIGIT: "FRAC"},
+        "POINT": {DIGIT: "FRAC", EXP: "EXP", **ending},
+        "FRAC": {DIGIT: "FRAC", UNDERSCORE: "FRAC_US", EXP: "EXP", **ending},
+        "FRAC_US": {DIGIT: "FRAC"},
+        "EXP": {SIGN: "EXP_SIGN", DIGIT: "EXP_INT"},
+        "EXP_SIGN": {DIGIT: "EXP_INT"},
+        "EXP_INT": {DIGIT: "EXP_INT", UNDERSCORE: "EXP_US", **ending},
+        "EXP_US": {DIGIT: "EXP_INT"},
+        "TRAIL": dict(ending),
+        "DONE": {PAD: "DONE"},
+        "I": {LETTER_N: "IN"},
+        "IN": {LETTER_F: "INF"},
+        "INF": {LETTER_I: "INFI", **ending},
+        "INFI": {LETTER_N: "INFIN"},
+        "INFIN": {LETTER_I: "INFINI"},
+        "INFINI": {LETTER_T: "INFINIT"},
+        "INFINIT": {LETTER_Y: "INFINITY"},
+        "INFINITY": dict(ending),
+        "N": {LETTER_A: "NA"},
+        "NA": {LETTER_N: "NAN"},
+        "NAN": dict(ending),
+        # Thousands grouping: 1-3 leading digits, then ",ddd" groups
+        "G1": {DIGIT: "G2", COMMA: "GC", **number_tail},
+        "G2": {DIGIT: "G3", COMMA: "GC", **number_tail},
+        "G3": {DIGIT: "INT", COMMA: "GC", **number_tail},
+        "GC": {DIGIT: "GC1"},
+        "GC1": {DIGIT: "GC2"},
+        "GC2": {DIGIT: "GC3"},
+        "GC3": {COMMA: "GC", DOT: "POINT", EXP: "EXP", **ending},
+    }
+    # Flat table indexed by (state << 4) | class, holding the next state
+    # already shifted, so each scan step is a single take()
+    table = np.zeros(len(_STATE_NAMES) << 4, dtype=np.uint16)
+    for state, moves in rules.items():
+        for char_class, target in moves.items():
+            table[(_STATE[state] << 4) | char_class] = _STATE[target] << 4
+    return table
+
+
+_TRANSITIONS = {
+    False: _build_transitions(False),
+    True: _build_transitions(True),
+}
+
+
+# ====================================================================
+# BULK PARSING
+# ====================================================================
+
+def _scan_chunk(strings, thousands_separators):
+    """
+    Validates one chunk of strings with the vectorized state machine.
+
+    Returns:
+        tuple: (valid: bool ndarray, fallback: bool ndarray) where fallback
+               marks rows the scanner left for the regex path
+    """
+    count = len(strings)
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=count)
+    text = "".join(strings)
+    if text.isascii():
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+    # Row of every character, and its column within that row
+    rows = np.repeat(np.arange(count), lengths)
+    starts = np.cumsum(lengths) - lengths
+    columns = np.arange(codes.size) - np.repeat(starts, lengths)
+
+    # Non-ASCII text and the \x1c-\x1f separators (whitespace to str.strip()
+    # but not to float()) are left to the fallback
+    fallback = lengths > MAX_SCAN_LENGTH
+    unusual = (codes > 127) | ((codes >= 0x1c) & (codes <= 0x1f))
+    if unusual.any():
+        fallback[rows[unusual]] = True
+    if fallback.any():
+        keep = ~fallback[rows]
+        rows, columns, codes = rows[keep], columns[keep], codes[keep]
+
+    # One matrix row per column position so each step reads contiguous memory;
+    # untouched cells stay PAD, which is how row ends are recognised
+    width = int(columns.max()) + 2 if columns.size else 1
+    classes = np.zeros(width * count, dtype=np.uint16)
+    classes[columns * count + rows] = _CLASS_TABLE.take(codes.astype(np.uint8))
+
+    table = _TRANSITIONS[thousands_separators]
+    state = np.full(count, _STATE["START"] << 4, dtype=np.uint16)
+    for column in classes.reshape(width, count):
+        state = table.take(state | column)
+    return (state == _STATE["DONE"] << 4) & ~fallback, fallback
+
+
+def parse_numbers(value_strs, thousands_separators=False):
+    """
+    Validates and converts a batch of strings without raising per value.
+
+    Args:
+        value_strs: Iterable of strings; non-strings are reported invalid
+        thousands_separators (bool): Accept "," thousands separators
+
+    Returns:
+        tuple: (values: float64 ndarray with NaN where invalid,
+                valid: bool ndarray)
+    """
+    value_strs = list(value_strs)
+    if set(map(type, value_strs)) - {str}:
+        # A lone NUL is never a number, so it stands in for non-strings
+        value_strs = [value if isinstance(value, str) else "\x00"
+                      for value in value_strs]
+
+    values = np.full(len(value_strs), np.nan)
+    valid = np.zeros(len(value_strs), dtype=bool)
+    pattern = _GROUPED_NUMBER if thousands_separators else _PLAIN_NUMBER
+
+    optimistic = True
+    for offset in range(0, len(value_strs), CHUNK_SIZE):
+        chunk = value_strs[offset:offset + CHUNK_SIZE]
+        window = slice(offset, offset + len(chunk))
+
+        # Clean chunks are fastest through float() directly. One invalid
+        # value abandons the attempt (a single exception for the chunk, not
+        # one per value) and later chunks go straight to the scanner.
+        if optimistic:
+            try:
+                values[window] = np.fromiter(
+                    map(float, chunk), dtype=np.float64, count=len(chunk)
+                )
+                valid[window] = True
+                continue
+            except ValueError:
+                optimistic = False
+
+        chunk_valid, fallback = _scan_chunk(chunk, thousands_separators)
+
+        accepted = list(compress(chunk, chunk_valid.tolist()))
+        if thousands_separators:
+            accepted = [value.replace(",", "") for value in accepted]
+        if accepted:
+            values[window][chunk_valid] = np.fromiter(
+                map(float, accepted), dtype=np.float64, count=len(accepted)
+            )
+
+        for index in np.flatnonzero(fallback).tolist():
+            value = chunk[index]
+            if pattern.fullmatch(value) is not None:
+                chunk_valid[index] = True
+                values[offset + index] = float(value.strip().replace(",", ""))
+        valid[window] = chunk_valid
+    return values, valid
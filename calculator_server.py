@@ -0,0 +1,429 @@
+"""
+Calculator Server - JSON-RPC calculations over a local socket
+Author: Team Five
+
+Description:
+Serves the calculator's arithmetic to other local tools without a window.
+Requests go through the same backend parsing, operations and result
+formatting as the GUI and calculator_cli.py, so a tool gets exactly the
+results (and the division by zero message) a user would see.
+
+The protocol is JSON-RPC 2.0 with one JSON message per line, on a TCP port
+bound to 127.0.0.1 or on a Unix socket:
+
+    --> {"jsonrpc": "2.0", "id": 1, "method": "divide", "params": [6, 4]}
+    <-- {"jsonrpc": "2.0", "id": 1, "result": {"value": 1.5, "text": "Result: 1.5"}}
+
+The methods are add, subtract, multiply and divide. params are [num1, num2]
+or {"num1": ..., "num2": ...}; operands may be numbers or strings ("1e3",
+" 42 "), validated as the entry fields are. Errors use the JSON-RPC codes
+(-32602 with the invalid-input message for operands that do not parse)
+plus DIVISION_BY_ZERO_CODE. A JSON array of requests is a batch and gets
+one array of responses; requests without an id are notifications and get
+none.
+
+Clients may pipeline: send any number of lines without waiting, and the
+responses come back in request order. Each chunk read from a socket is
+answered with a single write. When a client does not read its responses
+and the connection's write buffer passes WRITE_HIGH_WATER, the server
+stops reading from that connection until the buffer drains, so a slow
+client is held back by TCP flow control instead of growing the server's
+memory. Lines longer than MAX_LINE_BYTES close the connection, and
+connections beyond --max-connections are closed on accept.
+
+The server uses asyncio protocols rather than streams, so a request is
+handled inside the read callback without a coroutine switch, and success
+responses are formatted directly instead of through json.dumps(). What is
+left per request is mostly the kernel's recv() and send(): with one
+request in flight per client that caps a core at roughly 15-20k requests
+per second, while pipelined or batched clients share those calls among
+many requests (see benchmarks/bench_server.py, the load generator).
+
+Usage:
+    python calculator_server.py [--port 8765 | --unix /tmp/calculator.sock]
+    printf '{"jsonrpc":"2.0","id":1,"method":"add","params":[5,3]}\\n' | nc 127.0.0.1 8765
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import signal
+import sys
+from json.encoder import encode_basestring_ascii
+
+from calculator_backends import BACKENDS, FloatBackend, get_backend
+from calculator_core import DIVISION_BY_ZERO_TEXT, INVALID_INPUT_TEXT, OPERATIONS
+from calculator_logging import DEBUG, get_logger, setup_logging, shutdown_logging
+
+log = get_logger("calculator_server")
+
+
+# Where the server listens by default (local connections only)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Connections kept open at once; more are closed on accept
+MAX_CONNECTIONS = 4096
+
+# Pending connections the kernel queues while the server is busy
+LISTEN_BACKLOG = 1024
+
+# Longest request line; a longer one closes the connection
+MAX_LINE_BYTES = 1 << 20
+
+# Unsent response bytes at which a connection stops being read (and the
+# level at which reading resumes)
+WRITE_HIGH_WATER = 256 * 1024
+WRITE_LOW_WATER = 64 * 1024
+
+# JSON-RPC 2.0 error codes, and the code for a division by zero
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+DIVISION_BY_ZERO_CODE = 1
+
+
+# ====================================================================
+# REQUEST HANDLING
+# ====================================================================
+
+_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+def encode_json(value):
+    """Encodes any JSON value compactly, as text."""
+    return _encoder.encode(value)
+
+
+def _encode_id(request_id):
+    # Integer and string ids (nearly all of them) skip the general encoder
+    if type(request_id) is int:
+        return str(request_id)
+    if type(request_id) is str:
+        return encode_basestring_ascii(request_id)
+    return encode_json(request_id)
+
+
+def _request_id(request):
+    """The id of a request, or None if it has none or it is not a valid id."""
+    if isinstance(request, dict):
+        request_id = request.get("id")
+        if type(request_id) in (int, float, str):
+            return request_id
+    return None
+
+
+def error_response(request_id, code, message):
+    """Encodes a JSON-RPC error response."""
+    return encode_json({"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": code, "message": message}})
+
+
+class CalculatorService:
+    """Answers JSON-RPC request lines; knows nothing about sockets."""
+
+    def __init__(self, backend="float"):
+        """
+        Args:
+            backend (str): Numeric backend name, or a backend instance
+        """
+        self.backend = get_backend(backend)
+        self.operations = {name: self.backend.prepare(func)
+                           for name, func in OPERATIONS.items()}
+        # On the float backend a JSON float parses to itself
+        self._floats_direct = self.backend.parse is FloatBackend.parse
+        self.requests = 0
+        self.errors = 0
+
+    def handle_line(self, line):
+        """
+        Answers one line of input.
+
+        Args:
+            line (bytes): A JSON request or batch, without the newline
+
+        Returns:
+            bytes: The response line (newline included), or None when
+                nothing is owed (notifications only)
+        """
+        try:
+            message = json.loads(line)
+        except (ValueError, UnicodeDecodeError, RecursionError):
+            # RecursionError: nested too deeply for the decoder
+            return (self._error(None, PARSE_ERROR, "Parse error") + "\n").encode()
+
+        if isinstance(message, list):
+            if not message:
+                return (self._error(None, INVALID_REQUEST, "Invalid Request")
+                        + "\n").encode()
+            responses = [response for response in map(self.call, message)
+                         if response is not None]
+            return ("[" + ",".join(responses) + "]\n").encode() if responses else None
+        response = self.call(message)
+        return None if response is None else (response + "\n").encode()
+
+    def call(self, request):
+        """
+        Runs one request.
+
+        Args:
+            request: A decoded JSON-RPC request object
+
+        Returns:
+            str: The encoded response, or None for a notification
+        """
+        self.requests += 1
+        try:
+            return self._call(request)
+        except Exception as e:
+            # A bug must cost one request, not the whole line or connection
+            log.error("Request failed", error=repr(e))
+            response = self._error(_request_id(request), INTERNAL_ERROR, "Internal error")
+            return None if isinstance(request, dict) and "id" not in request else response
+
+    def _call(self, request):
+        if (not isinstance(request, dict) or request.get("jsonrpc") != "2.0"
+                or not isinstance(request.get("method"), str)):
+            return self._error(_request_id(request), INVALID_REQUEST, "Invalid Request")
+        request_id = request.get("id")
+        if request_id is not None and _request_id(request) is None:
+            # Only strings, numbers and null are ids
+            return self._error(None, INVALID_REQUEST, "Invalid Request")
+        notification = "id" not in request
+
+        operation = self.operations.get(request["method"])
+        if operation is None:
+            response = self._error(request_id, METHOD_NOT_FOUND, "Method not found")
+            return None if notification else response
+
+        params = request.get("params")
+        if isinstance(params, dict):
+            params = [params.get("num1"), params.get("num2")]
+        if not isinstance(params, list) or len(params) != 2:
+            response = self._error(request_id, INVALID_PARAMS,
+                                   "params must be [num1, num2] or {num1, num2}")
+            return None if notification else response
+
+        is_valid1, num1 = self._parse(params[0])
+        is_valid2, num2 = self._parse(params[1])
+        if not is_valid1 or not is_valid2:
+            response = self._error(request_id, INVALID_PARAMS, INVALID_INPUT_TEXT)
+            return None if notification else response
+
+        try:
+            result = operation(num1, num2)
+            text = self.backend.format(result)
+        except ZeroDivisionError:
+            response = self._error(request_id, DIVISION_BY_ZERO_CODE,
+                                   DIVISION_BY_ZERO_TEXT)
+        except (ArithmeticError, ValueError) as e:
+            response = self._error(request_id, INTERNAL_ERROR, str(e))
+        else:
+            # Built by hand: about 4x faster than encoding a dict
+            response = (f'{{"jsonrpc":"2.0","id":{_encode_id(request_id)},'
+                        f'"result":{{"value":{self._encode_value(result)},'
+                        f'"text":{encode_basestring_ascii(text)}}}}}')
+        return None if notification else response
+
+    def _parse(self, value):
+        """Validates an operand: strings as typed, JSON numbers as written."""
+        if isinstance(value, str):
+            return self.backend.parse(value)
+        if type(value) is float and self._floats_direct:
+            return True, value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return self.backend.parse(repr(value))
+        return False, None
+
+    @staticmethod
+    def _encode_value(result):
+        # JSON numbers cannot be inf or NaN; exact results keep every digit
+        if type(result) is float and math.isfinite(result):
+            return repr(result)
+        return encode_basestring_ascii(str(result))
+
+    def _error(self, request_id, code, message):
+        self.errors += 1
+        return error_response(request_id, code, message)
+
+
+# ====================================================================
+# CONNECTIONS
+# ====================================================================
+
+class CalculatorProtocol(asyncio.Protocol):
+    """One client connection: line framing, pipelining and backpressure."""
+
+    def __init__(self, server):
+        self.server = server
+        self.service = server.service
+        self.transport = None
+        self._buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        if len(self.server.connections) >= self.server.max_connections:
+            log.warning("Connection refused - too many connections",
+                        limit=self.server.max_connections)
+            transport.close()
+            return
+        self.server.connections.add(self)
+        transport.set_write_buffer_limits(WRITE_HIGH_WATER, WRITE_LOW_WATER)
+        if log.enabled(DEBUG):
+            log.debug("Client connected", peer=transport.get_extra_info("peername"))
+
+    def data_received(self, data):
+        lines = (self._buffer + data).split(b"\n")
+        self._buffer = lines.pop()
+
+        responses = []
+        for line in lines:
+            if line.strip():
+                response = self._handle_line(line)
+                if response is not None:
+                    responses.append(response)
+        if responses:
+            self.transport.write(b"".join(responses))
+
+        if len(self._buffer) > MAX_LINE_BYTES:
+            log.warning("Connection closed - request line too long",
+                        limit=MAX_LINE_BYTES)
+            self.transport.write((error_response(
+                None, INVALID_REQUEST, "Request line too long") + "\n").encode())
+            self._buffer = b""
+            self.transport.close()
+
+    def eof_received(self):
+        # A last request without a newline is still answered
+        if self._buffer.strip():
+            response = self._handle_line(self._buffer)
+            if response is not None:
+                self.transport.write(response)
+        self._buffer = b""
+        return False
+
+    def _handle_line(self, line):
+        """handle_line(), with a failure costing this line only."""
+        try:
+            return self.service.handle_line(line)
+        except Exception as e:
+            log.error("Request line failed", error=repr(e))
+            self.service.errors += 1
+            return (error_response(None, INTERNAL_ERROR, "Internal error")
+                    + "\n").encode()
+
+    def pause_writing(self):
+        # The client is not reading its responses: stop reading its requests
+        self.transport.pause_reading()
+
+    def resume_writing(self):
+        self.transport.resume_reading()
+
+    def connection_lost(self, exc):
+        self.server.connections.discard(self)
+        if log.enabled(DEBUG):
+            log.debug("Client disconnected", error=repr(exc) if exc else None)
+
+
+class CalculatorServer:
+    """Listens for clients and hands each one a CalculatorProtocol."""
+
+    def __init__(self, backend="float", max_connections=MAX_CONNECTIONS):
+        """
+        Args:
+            backend (str): Numeric backend name, or a backend instance
+            max_connections (int): Connections kept open at once
+        """
+        self.service = CalculatorService(backend)
+        self.max_connections = max_connections
+        self.connections = set()
+        self._server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """
+        Starts listening on host:port, or on unix_path when given.
+
+        Returns:
+            str: The address listened on, e.g. "127.0.0.1:8765"
+        """
+        loop = asyncio.get_running_loop()
+        factory = lambda: CalculatorProtocol(self)
+        if unix_path is not None:
+            self._server = await loop.create_unix_server(
+                factory, unix_path, backlog=LISTEN_BACKLOG)
+            return unix_path
+        self._server = await loop.create_server(
+            factory, host, port, backlog=LISTEN_BACKLOG)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"{host}:{port}"
+
+    async def close(self):
+        """Stops accepting, then closes every connection after its last write."""
+        if self._server is None:
+            return
+        self._server.close()
+        for connection in list(self.connections):
+            connection.transport.close()
+        await self._server.wait_closed()
+        self._server = None
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None,
+                backend="float", max_connections=MAX_CONNECTIONS):
+    """Runs a server until SIGINT or SIGTERM."""
+    server = CalculatorServer(backend, max_connections)
+    address = await server.start(host, port, unix_path)
+    log.info("Listening", address=address, backend=server.service.backend.name)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # No signal handlers on this platform; Ctrl+C still stops it
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+        log.info("Stopped", requests=server.service.requests,
+                 errors=server.service.errors)
+
+
+# ====================================================================
+# COMMAND LINE ENTRY POINT
+# ====================================================================
+
+def main(argv=None):
+    """Parses the command line and serves until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Serve calculator operations as JSON-RPC over a local socket."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help=f"address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"TCP port; 0 picks a free one (default: {DEFAULT_PORT})")
+    parser.add_argument("--unix", metavar="PATH",
+                        help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="float",
+                        help="numeric backend (default: float)")
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS,
+                        help=f"connections kept open at once (default: {MAX_CONNECTIONS})")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.backend,
+                          args.max_connections))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown_logging()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
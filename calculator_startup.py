@@ -0,0 +1,154 @@
+"""
+Startup Profiler - where the calculator's cold start goes, with a budget
+Author: Team Five
+
+Description:
+StartupProfiler times named phases of the start-up. CalculatorApp reports
+its phases to it when one is passed in: Tk init, theme, menu, variables
+and every UI section. Run as a script, this module profiles a cold start
+of breakout2.py in a fresh process:
+
+    import     importing breakout2 (tkinter and the calculator modules)
+    tk_init    creating the tk.Tk() interpreter and window
+    theme      named fonts and ttk styles
+    menu       the menu bar
+    variables  the StringVars
+    ui.*       one phase per UI section
+    layout     the first geometry pass (update_idletasks)
+
+It prints each phase and the total, and exits with status 1 when the
+total is over the cold-start budget, so the check can run in CI under
+Xvfb.
+
+Usage:
+    python calculator_startup.py [--budget-ms 800] [--json startup.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Cold-start budget (ms) from process start of the profiler to a laid-out
+# window
+DEFAULT_STARTUP_BUDGET_MS = 800
+
+
+class StartupProfiler:
+    """Times named start-up phases."""
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Args:
+            clock: Returns the current time in seconds
+        """
+        self.clock = clock
+        self.started = clock()
+        self.finished = None
+        self.phases = {}        # phase name -> seconds, in first-seen order
+
+    @contextmanager
+    def phase(self, name):
+        """Times the with-block as the named phase (added up if repeated)."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + self.clock() - start
+
+    def finish(self):
+        """Ends the start-up; total_ms stops growing."""
+        self.finished = self.clock()
+
+    @property
+    def total_ms(self):
+        """Milliseconds from the profiler's creation to finish() (or now)."""
+        end = self.finished if self.finished is not None else self.clock()
+        return (end - self.started) * 1000.0
+
+    def report(self, budget_ms=None):
+        """
+        Returns the phase times.
+
+        Args:
+            budget_ms (float): Cold-start budget to check the total against
+
+        Returns:
+            dict: phases (name -> ms), total_ms, budget_ms, over_budget
+        """
+        total_ms = self.total_ms
+        return {
+            "phases": {name: round(seconds * 1000.0, 3)
+                       for name, seconds in self.phases.items()},
+            "total_ms": round(total_ms, 3),
+            "budget_ms": budget_ms,
+            "over_budget": budget_ms is not None and total_ms > budget_ms,
+        }
+
+    def format_report(self, budget_ms=None):
+        """Returns the phase times as a text table."""
+        report = self.report(budget_ms)
+        lines = [f"{'phase':<24}{'ms':>10}"]
+        for name, ms in report["phases"].items():
+            lines.append(f"{name:<24}{ms:>10.2f}")
+        other_ms = report["total_ms"] - sum(report["phases"].values())
+        lines.append(f"{'(other)':<24}{other_ms:>10.2f}")
+        lines.append(f"{'total':<24}{report['total_ms']:>10.2f}")
+        if budget_ms is not None:
+            verdict = "OVER BUDGET" if report["over_budget"] else "within budget"
+            lines.append(f"budget {budget_ms} ms: {verdict}")
+        return "\n".join(lines)
+
+
+def profile_startup(profiler=None):
+    """
+    Imports breakout2 and builds the calculator, timing every phase.
+
+    The import is only a cold import when breakout2 has not been imported
+    in this process yet.
+
+    Args:
+        profiler (StartupProfiler): Profiler to use (default: a new one)
+
+    Returns:
+        tuple: (StartupProfiler, CalculatorApp) - the window is built but
+            its main loop is not running
+    """
+    profiler = profiler or StartupProfiler()
+    with profiler.phase("import"):
+        import breakout2
+    # Built as main() builds it, watchdog included
+    app = breakout2.CalculatorApp(
+        lazy=True, profiler=profiler,
+        stall_watchdog=os.environ.get(breakout2.WATCHDOG_ENV) != "0")
+    app.build()
+    with profiler.phase("layout"):
+        app.root.update_idletasks()
+    profiler.finish()
+    return profiler, app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_STARTUP_BUDGET_MS)
+    parser.add_argument("--json", metavar="PATH",
+                        help="Also write the report as JSON to PATH")
+    args = parser.parse_args()
+
+    profiler, app = profile_startup()
+    report = profiler.report(args.budget_ms)
+    print(profiler.format_report(args.budget_ms))
+    app.root.destroy()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n")
+    if report["over_budget"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
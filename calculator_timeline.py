@@ -0,0 +1,208 @@
+"""
+Animation Timeline - one frame clock for all GUI effects
+Author: Team Five
+
+Description:
+Effects used to run as their own chains of root.after() callbacks, so
+triggering an effect again started another chain and the chains fought over
+the same widgets. A Timeline owns a single root.after() tick for every
+effect on a window:
+
+    - Effects are data: a list of keyframes saying at which millisecond which
+      widget gets which options. Nothing is computed while they play.
+    - Each effect has a name. Playing a name that is already running either
+      coalesces (the running effect just continues) or preempts (the running
+      effect is cancelled, its on_cancel restores the widgets, and the new
+      one starts).
+    - Every keyframe that falls due in the same tick is merged per widget,
+      so each widget gets at most one configure() call per tick, and a late
+      tick skips straight to the newest values instead of replaying them.
+    - The tick is only scheduled while something plays, and then only for
+      the next keyframe that is due (at most one tick per MIN_FRAME_MS).
+    - All changes of one tick reach Tcl as a single evaluation (see
+      calculator_tclbatch.py).
+
+Tcl work and CPU use therefore depend on the effects' keyframes, not on how
+often an effect is triggered. The module only needs root.after() and
+after_cancel(), so it does not import tkinter.
+"""
+
+import math
+import time
+from collections import namedtuple
+
+from calculator_logging import get_logger
+from calculator_tclbatch import TclBatch
+
+
+log = get_logger("calculator_timeline")
+
+# Shortest gap between two ticks (about 60 frames per second)
+MIN_FRAME_MS = 16
+
+# Policies for play() when an effect of the same name is running
+COALESCE = "coalesce"
+PREEMPT = "preempt"
+
+
+class Keyframe(namedtuple("Keyframe", ["at", "widget", "options"])):
+    """
+    Options applied to a widget at a point in an effect.
+
+    Fields:
+        at (int): Milliseconds after the effect starts
+        widget: Widget to configure
+        options (dict): configure() options; "geometry" calls geometry()
+    """
+
+    __slots__ = ()
+
+
+class Effect:
+    """A named, data-driven animation made of keyframes."""
+
+    def __init__(self, name, keyframes, on_finish=None, on_cancel=None):
+        """
+        Args:
+            name (str): Effects with the same name never run at the same time
+            keyframes: Iterable of Keyframe
+            on_finish: Called after the last keyframe was applied
+            on_cancel: Called when the effect is cancelled or preempted
+        """
+        self.name = name
+        self.keyframes = sorted(keyframes, key=lambda keyframe: keyframe.at)
+        self.on_finish = on_finish
+        self.on_cancel = on_cancel
+
+    @property
+    def duration(self):
+        """Milliseconds from the start to the last keyframe."""
+        return self.keyframes[-1].at if self.keyframes else 0
+
+
+class Timeline:
+    """Plays effects on a window from a single root.after() tick."""
+
+    def __init__(self, root, clock=time.monotonic, batch=None):
+        """
+        Args:
+            root: The Tk root (anything with after() and after_cancel())
+            clock: Returns the current time in seconds
+            batch: TclBatch that sends each frame (default: a new one)
+        """
+        self.root = root
+        self.clock = clock
+        self.batch = batch if batch is not None else TclBatch(root)
+        self._playing = {}      # name -> [effect, start_ms, next keyframe index]
+        self._tick_id = None
+
+    def _now_ms(self):
+        return self.clock() * 1000.0
+
+    def is_playing(self, name):
+        """True while an effect with this name runs."""
+        return name in self._playing
+
+    def play(self, effect, policy=COALESCE):
+        """
+        Starts an effect.
+
+        Args:
+            effect (Effect): The effect to play
+            policy (str): COALESCE keeps a running effect of the same name
+                and ignores this one; PREEMPT cancels it and starts this one
+
+        Returns:
+            bool: True if the effect was started
+        """
+        if effect.name in self._playing:
+            if policy == COALESCE:
+                return False
+            self.cancel(effect.name)
+        self._playing[effect.name] = [effect, self._now_ms(), 0]
+        # A pending tick may be waiting for a much later keyframe
+        self._unschedule()
+        self._schedule(0)
+        return True
+
+    def cancel(self, name):
+        """Stops an effect where it is and calls its on_cancel."""
+        playback = self._playing.pop(name, None)
+        if playback is None:
+            return
+        if not self._playing:
+            self._unschedule()
+        if playback[0].on_cancel is not None:
+            playback[0].on_cancel()
+
+    def cancel_all(self):
+        """Cancels every running effect."""
+        for name in list(self._playing):
+            self.cancel(name)
+
+    # ----------------------------------------------------------------
+    # Frame clock
+    # ----------------------------------------------------------------
+
+    def _schedule(self, delay_ms):
+        """Makes sure one tick is pending."""
+        if self._tick_id is None:
+            # Rounded up: a tick before its keyframe is due would leave the
+            # keyframe waiting another MIN_FRAME_MS
+            self._tick_id = self.root.after(max(math.ceil(delay_ms), 0), self._tick)
+
+    def _unschedule(self):
+        if self._tick_id is not None:
+            try:
+                self.root.after_cancel(self._tick_id)
+            except Exception:
+                pass  # The window is already gone
+            self._tick_id = None
+
+    def _tick(self):
+        """Applies every keyframe that is due, then schedules the next tick."""
+        self._tick_id = None
+        now = self._now_ms()
+
+        # Collect due keyframes, merged per widget (later keyframes win)
+        frame = {}
+        finished = []
+        next_due = None
+        for name, playback in self._playing.items():
+            effect, start, index = playback
+            keyframes = effect.keyframes
+            elapsed = now - start
+            while index < len(keyframes) and keyframes[index].at <= elapsed:
+                widget, options = keyframes[index].widget, keyframes[index].options
+                merged = frame.get(id(widget))
+                if merged is None:
+                    merged = frame[id(widget)] = (widget, {})
+                merged[1].update(options)
+                index += 1
+            playback[2] = index
+            if index == len(keyframes):
+                finished.append(name)
+            else:
+                due = start + keyframes[index].at
+                next_due = due if next_due is None else min(next_due, due)
+
+        try:
+            for widget, options in frame.values():
+                self.batch.apply(widget, options)
+            self.batch.flush()
+        except Exception as e:
+            # The window was closed while effects were playing
+            log.warning("Animation stopped", error=repr(e))
+            self._playing.clear()
+            return
+
+        for name in finished:
+            effect = self._playing.pop(name)[0]
+            if effect.on_finish is not None:
+                effect.on_finish()
+
+        if next_due is not None and self._playing:
+            try:
+                self._schedule(max(next_due - now, MIN_FRAME_MS))
+            except Exception:
+                self._playing.clear()
@@ -0,0 +1,222 @@
+"""
+Stall Watchdog - detects a blocked Tk main loop and captures its stack
+Author: Team Five
+
+Description:
+When a command callback blocks the main loop the window simply freezes and
+nothing tells us where. A StallWatchdog posts a heartbeat from the main
+loop (one root.after() callback every HEARTBEAT_MS) and watches it from a
+background thread:
+
+    - If the heartbeat is late by more than the threshold, the thread
+      captures the main thread's Python stack (sys._current_frames()),
+      which shows the callback that is blocking.
+    - When the heartbeat comes back, the stall's full duration is known and
+      the stall is added to a ring buffer of recent stalls and appended to
+      the log file.
+
+While nothing is wrong the cost is one tiny after() callback per heartbeat
+and one thread wake-up per check; the main thread never takes a lock.
+
+Usage:
+    watchdog = StallWatchdog(root, log_path="calculator_stalls.log").start()
+    ...
+    watchdog.stop()
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+
+from calculator_logging import get_logger
+
+
+log = get_logger("calculator_watchdog")
+
+# Interval of the main loop's heartbeat
+HEARTBEAT_MS = 100
+
+# A heartbeat later than this counts as a stall
+STALL_THRESHOLD_MS = 250
+
+# Stalls kept in memory
+STALL_HISTORY = 50
+
+
+# One period in which the main loop did not run:
+#   started      wall-clock time (time.time()) the stall began
+#   duration_ms  how long the heartbeat was overdue
+#   stack        main thread's stack, captured during the stall
+Stall = namedtuple("Stall", "started duration_ms stack")
+
+
+class StallWatchdog:
+    """Watches a main-loop heartbeat from a background thread."""
+
+    def __init__(self, root, threshold_ms=STALL_THRESHOLD_MS,
+                 heartbeat_ms=HEARTBEAT_MS, log_path=None, capacity=STALL_HISTORY):
+        """
+        Must be created on the thread that runs the main loop.
+
+        Args:
+            root: The Tk root (anything with after() and after_cancel())
+            threshold_ms (int): Heartbeat delay that counts as a stall
+            heartbeat_ms (int): Interval of the heartbeat
+            log_path: File stalls are appended to, its directory created
+                at the first stall (None: memory only)
+            capacity (int): Stalls kept in the ring buffer
+        """
+        self.root = root
+        self.threshold_ms = threshold_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.log_path = os.fspath(log_path) if log_path is not None else None
+        self.stalls = deque(maxlen=capacity)
+        self.stall_count = 0
+        self._late_after = (heartbeat_ms + threshold_ms) / 1000.0
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._late_beat = (0.0, 0.0)    # (previous beat, beat) of the last late beat
+        self._beat_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        """
+        Starts the heartbeat and the watching thread.
+
+        Returns:
+            StallWatchdog: self, for chaining
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._last_beat = time.monotonic()
+            self._beat_id = self.root.after(self.heartbeat_ms, self._beat)
+            self._thread = threading.Thread(
+                target=self._watch, name="stall-watchdog", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the heartbeat and the thread; the stalls are kept."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._beat_id is not None:
+            try:
+                self.root.after_cancel(self._beat_id)
+            except Exception:
+                pass  # The window is already gone
+            self._beat_id = None
+
+    def _beat(self):
+        """Heartbeat, run by the main loop."""
+        now = time.monotonic()
+        if now - self._last_beat > self._late_after:
+            # Lets the watchdog measure the gap even if it next looks after
+            # further beats
+            self._late_beat = (self._last_beat, now)
+        self._last_beat = now
+        self._beat_id = self.root.after(self.heartbeat_ms, self._beat)
+
+    # ----------------------------------------------------------------
+    # Watching thread
+    # ----------------------------------------------------------------
+
+    def _watch(self):
+        """Checks the heartbeat until stopped; runs on the watchdog thread."""
+        heartbeat = self.heartbeat_ms / 1000.0
+        threshold = self.threshold_ms / 1000.0
+        # Checking twice per threshold detects a stall at most half a
+        # threshold late
+        check_interval = threshold / 2
+        stall_beat = None       # _last_beat value the current stall started from
+        stall_started = 0.0
+        stack = ""
+
+        while not self._stop.wait(check_interval):
+            last_beat = self._last_beat
+            if stall_beat is not None and last_beat != stall_beat:
+                # The main loop ran again: the stall is over
+                previous, resumed = self._late_beat
+                if previous != stall_beat:
+                    resumed = last_beat     # Not seen as late by the main loop
+                duration = resumed - (stall_beat + heartbeat)
+                self._record(Stall(stall_started, duration * 1000.0, stack))
+                stall_beat = None
+            overdue = time.monotonic() - (last_beat + heartbeat)
+            if stall_beat is None and overdue > threshold:
+                stall_beat = last_beat
+                stall_started = time.time() - overdue
+                stack = self._main_stack()
+
+    def _main_stack(self):
+        """Formats the main thread's current Python stack."""
+        # Imported on the watchdog thread, at the first stall, to keep it
+        # out of startup
+        import traceback
+
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return "(main thread not found)\n"
+        return "".join(traceback.format_stack(frame))
+
+    def _record(self, stall):
+        """Adds a finished stall to the ring buffer and the log file."""
+        self.stalls.append(stall)
+        self.stall_count += 1
+        if self.log_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as stall_log:
+                stall_log.write(format_stall(stall) + "\n")
+        except OSError as e:
+            log.error("Could not write the stall log", path=self.log_path, error=repr(e))
+
+    def format_report(self):
+        """Returns the recent stalls as text, newest first."""
+        if not self.stalls:
+            return (f"No main-loop stalls over {self.threshold_ms} ms "
+                    f"since start.")
+        lines = [f"{self.stall_count} stall(s) over {self.threshold_ms} ms, "
+                 f"newest first", ""]
+        lines.extend(format_stall(stall) for stall in reversed(self.stalls))
+        return "\n".join(lines)
+
+
+def format_stall(stall):
+    """Formats one stall with its timestamp, duration and stack."""
+    started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stall.started))
+    return (f"[{started}] Main loop stalled for {stall.duration_ms:.0f} ms\n"
+            f"{stall.stack}")
+
+
+def show_stalls(root, watchdog):
+    """
+    Opens a window listing the watchdog's recent stalls.
+
+    Args:
+        root: The Tk root window
+        watchdog (StallWatchdog): The watchdog to show
+
+    Returns:
+        tk.Toplevel: The window
+    """
+    import tkinter as tk
+
+    window = tk.Toplevel(root)
+    window.title("Main-loop Stalls")
+    text = tk.Text(window, width=90, height=30, font="TkFixedFont")
+    text.pack(fill=tk.BOTH, expand=True)
+    text.insert("1.0", watchdog.format_report())
+    text.configure(state=tk.DISABLED)
+    return window
@@ -0,0 +1,116 @@
+"""
+Calculation Worker - runs calculations off the Tk main thread
+Author: Team Five
+
+Description:
+Tk is single-threaded: a slow calculation inside a button callback freezes
+the whole window. CalculationWorker runs the calculation on a small thread
+pool instead and hands the outcome back through a queue. The GUI drains the
+queue from root.after, so every widget update still happens on the Tk
+thread.
+
+Each submission gets a ticket. Submitting again supersedes the previous
+request: it is cancelled if it has not started yet, and if it has, its
+result is dropped when the queue is drained.
+
+This module never imports tkinter.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CalculationWorker:
+    """Thread-pool calculation runner with a result queue for the GUI."""
+
+    def __init__(self, max_workers=1):
+        """
+        Creates the worker.
+
+        Args:
+            max_workers (int): Number of calculation threads
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="calculation"
+        )
+        self._results = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._ticket = 0
+        self._future = None
+
+    @property
+    def busy(self):
+        """True while a request is running or results wait to be drained."""
+        future = self._future
+        return (future is not None and not future.done()) or not self._results.empty()
+
+    def submit(self, callback, func, *args):
+        """
+        Runs func(*args) on a worker thread, superseding any earlier request.
+
+        Args:
+            callback: Called on the GUI thread (by drain) as
+                callback(result, error); error is None on success
+            func: The calculation to run
+            *args: Arguments for func
+
+        Returns:
+            int: The ticket of this request
+        """
+        with self._lock:
+            self._ticket += 1
+            ticket = self._ticket
+            if self._future is not None:
+                self._future.cancel()
+            self._future = self._executor.submit(
+                self._run, ticket, callback, func, args
+            )
+        return ticket
+
+    def cancel(self):
+        """Cancels the current request; a late result is dropped."""
+        with self._lock:
+            self._ticket += 1
+            if self._future is not None:
+                self._future.cancel()
+                self._future = None
+
+    def drain(self, max_items=None):
+        """
+        Collects finished results of the current request.
+
+        Results of superseded or cancelled requests are discarded.
+
+        Args:
+            max_items (int): Stop after this many queue entries
+
+        Returns:
+            list: (callback, result, error) tuples, oldest first
+        """
+        outcomes = []
+        taken = 0
+        while max_items is None or taken < max_items:
+            try:
+                ticket, callback, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            if ticket == self._ticket:
+                outcomes.append((callback, result, error))
+        return outcomes
+
+    def shutdown(self):
+        """Cancels pending work and stops the threads without waiting."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, ticket, callback, func, args):
+        """Worker-thread body: runs func unless it was superseded meanwhile."""
+        if ticket != self._ticket:
+            return
+        try:
+            outcome = (ticket, callback, func(*args), None)
+        except Exception as error:
+            outcome = (ticket, callback, None, error)
+        self._results.put(outcome)
@@ -0,0 +1,20 @@
+"""
+Test configuration - puts the calculator modules on the import path
+Author: Team Five
+
+Description:
+The modules live at the top of the repository, next to the apps, and the
+benchmarks' headless Tk stand-in in benchmarks/; both directories are put
+on sys.path, as the benchmarks do for themselves.
+
+Usage:
+    python -m pytest -q
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
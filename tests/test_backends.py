@@ -0,0 +1,27 @@
+"""
+Tests: the auto backend agrees with the float backend on non-finite operands
+Author: Team Five
+"""
+
+import pytest
+
+from calculator_backends import get_backend
+from calculator_core import OPERATIONS
+
+
+@pytest.mark.parametrize("operation", sorted(OPERATIONS))
+@pytest.mark.parametrize("num1, num2", [
+    ("0.1", "inf"), ("-inf", "0.1"), ("1e5000", "-inf"), ("inf", "inf"),
+    ("0.1", "nan"), ("inf", "0"), ("12345678901234567890123", "inf"),
+])
+def test_non_finite_operands_give_the_float_answer(operation, num1, num2):
+    answers = []
+    for name in ("float", "auto"):
+        backend = get_backend(name)
+        calculate = backend.prepare(OPERATIONS[operation])
+        (_, value1), (_, value2) = backend.parse(num1), backend.parse(num2)
+        try:
+            answers.append(backend.format(calculate(value1, value2)))
+        except ZeroDivisionError:
+            answers.append("division by zero")
+    assert answers[0] == answers[1]
@@ -0,0 +1,93 @@
+"""
+Tests: the SQLite calculation history
+Author: Team Five
+"""
+
+import math
+import sqlite3
+
+import pytest
+
+from calculator_historydb import SCHEMA, SQLiteHistory
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "history.db"
+
+
+def rows_of(history):
+    return [history.format_row(index) for index in range(len(history))]
+
+
+def test_entries_survive_a_restart(path):
+    history = SQLiteHistory(path)
+    history.append("Addition", 1, 2, 3)
+    history.append("Division", 4, 2, 2)
+    history.close()
+
+    history = SQLiteHistory(path)
+    assert rows_of(history) == ["#1  1 + 2 = 3", "#2  4 ÷ 2 = 2"]
+    history.close()
+
+
+def test_nan_results_are_stored_with_their_batch(path):
+    history = SQLiteHistory(path)
+    history.append("Addition", 1, 2, 3)
+    history.append("(a - b)", math.nan, math.nan, math.nan)
+    history.append("Addition", 2, 2, 4)
+    history.close()
+    assert history.error is None
+
+    history = SQLiteHistory(path)
+    assert rows_of(history) == ["#1  1 + 2 = 3", "#2  (a - b) = nan", "#3  2 + 2 = 4"]
+    assert math.isnan(history.query(op="(a - b)")[0][5])
+    summary = dict((row[0], row[1:]) for row in history.summary())
+    assert summary["Addition"] == (2, 3.0, 4.0, 3.5)
+    count, *stats = summary["(a - b)"]
+    assert count == 1 and all(math.isnan(value) for value in stats)
+    history.close()
+
+
+def test_a_row_lost_to_the_old_schema_leaves_a_readable_gap(path):
+    # Databases created while result was NOT NULL reject NaN results
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA.replace("result REAL\n", "result REAL NOT NULL\n"))
+    connection.close()
+    history = SQLiteHistory(path)
+    history.append("Addition", 1, 2, 3)
+    history.append("Division", 0, 0, math.nan)
+    history.append("Addition", 2, 2, 4)
+    history.close()
+    assert history.error is not None
+
+    history = SQLiteHistory(path)
+    assert rows_of(history) == ["#1  1 + 2 = 3", "#2  ? = nan", "#3  2 + 2 = 4"]
+    view = history.filtered(op="Addition")
+    assert [view.format_row(index) for index in range(len(view))] == [
+        "#1  1 + 2 = 3", "#3  2 + 2 = 4"]
+    history.close()
+
+
+def test_filtered_later_includes_the_entries_still_queued(path):
+    history = SQLiteHistory(path)
+    for op_name in ("Addition", "Division", "Addition"):
+        history.append(op_name, 4, 2, 0)
+    query = history.filtered_later(op="Addition")
+    assert query.finished.wait(5)
+    assert query.error is None
+    assert list(query.view.ids) == [1, 3]
+    history.close()
+
+
+def test_clear_forgets_the_stored_entries(path):
+    history = SQLiteHistory(path)
+    history.append("Addition", 1, 2, 3)
+    history.wait(5)
+    history.clear()
+    history.append("Subtraction", 5, 2, 3)
+    history.close()
+
+    history = SQLiteHistory(path)
+    assert rows_of(history) == ["#1  5 - 2 = 3"]
+    history.close()
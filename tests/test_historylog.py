@@ -0,0 +1,89 @@
+"""
+Tests: reopening a persistent history log
+Author: Team Five
+"""
+
+import math
+
+from calculator_historylog import HEADER, RECORD, PersistentHistory
+
+
+def reopen(path):
+    history = PersistentHistory(path)
+    rows = [history.format_row(index) for index in range(len(history))]
+    return history, rows
+
+
+def test_entries_survive_a_restart(tmp_path):
+    path = tmp_path / "history.log"
+    history = PersistentHistory(path)
+    history.append("Addition", 1, 2, 3)
+    history.append("(a - b) * 2", 5, math.nan, math.nan)
+    history.append("Division", 4, 2, 2)
+    history.close()
+
+    history, rows = reopen(path)
+    assert rows == ["#1  1 + 2 = 3", "#2  (a - b) * 2 (a=5) = nan", "#3  4 ÷ 2 = 2"]
+    history.append("Subtraction", 9, 4, 5)
+    history.close()
+
+    history, rows = reopen(path)
+    assert rows[-1] == "#4  9 - 4 = 5"
+    history.close()
+
+
+def test_line_breaks_in_names_keep_op_codes_aligned(tmp_path):
+    path = tmp_path / "history.log"
+    history = PersistentHistory(path)
+    for expression in ("(a\r+ b)", "(a\n- b)", "(a * b)"):
+        history.append(expression, 1, 2, 0)
+    history.append("Addition", 4, 2, 6)
+    history.append("Division", 4, 2, 2)
+    history.close()
+
+    history, rows = reopen(path)
+    assert history.op_names == ["(a + b)", "(a - b)", "(a * b)", "Addition", "Division"]
+    assert rows[-2:] == ["#4  4 + 2 = 6", "#5  4 ÷ 2 = 2"]
+    history.close()
+
+
+def test_a_torn_record_is_dropped(tmp_path):
+    path = tmp_path / "history.log"
+    history = PersistentHistory(path)
+    history.append("Addition", 1, 2, 3)
+    history.close()
+    with open(path, "ab") as log:
+        log.write(b"\x00" * (RECORD.size // 2))
+
+    history, rows = reopen(path)
+    assert rows == ["#1  1 + 2 = 3"]
+    history.close()
+    assert path.stat().st_size == HEADER.size + RECORD.size
+
+
+def test_clear_empties_the_files(tmp_path):
+    path = tmp_path / "history.log"
+    history = PersistentHistory(path)
+    history.append("Addition", 1, 2, 3)
+    history.sync()
+    history.clear()
+    history.append("Multiplication", 3, 4, 12)
+    history.close()
+
+    history, rows = reopen(path)
+    assert rows == ["#1  3 × 4 = 12"]
+    history.close()
+
+
+def test_find_time_uses_the_stored_timestamps(tmp_path):
+    path = tmp_path / "history.log"
+    clock = iter(range(0, 100, 10)).__next__
+    history = PersistentHistory(path, clock=clock)
+    for _ in range(5):
+        history.append("Addition", 1, 1, 2)
+    history.close()
+
+    history = PersistentHistory(path)
+    assert history.find_time(25) == 3
+    assert history.find_time(100) == 5
+    history.close()
@@ -0,0 +1,59 @@
+"""
+Tests: the queued logger's writer thread
+Author: Team Five
+"""
+
+import io
+import json
+
+import pytest
+
+from calculator_logging import (
+    format_json, get_logger, setup_logging, shutdown_logging,
+)
+
+
+class Unprintable:
+    def __str__(self):
+        raise RuntimeError("no text")
+
+    __repr__ = __str__
+
+
+@pytest.fixture
+def stream():
+    stream = io.StringIO()
+    yield stream
+    shutdown_logging()
+
+
+@pytest.mark.parametrize("json_lines", [False, True], ids=["text", "json"])
+def test_a_field_that_cannot_be_formatted_does_not_stop_the_writer(stream, json_lines):
+    assert setup_logging("info", json_lines=json_lines, stream=stream)
+    log = get_logger("test")
+    log.info("Before")
+    log.info("Broken", value=Unprintable())
+    log.info("After", value=1)
+    shutdown_logging()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 3
+    assert "Broken" in lines[1] and "format_error" in lines[1]
+    assert "After" in lines[2]
+
+
+def test_json_fields_do_not_replace_the_record_keys():
+    record = (1.5, 20, "test", "Hello", {"message": "spoofed", "level": "error",
+                                         "user": "x"})
+    assert json.loads(format_json(record)) == {
+        "user": "x", "time": 1.5, "level": "info", "logger": "test", "message": "Hello"}
+
+
+def test_records_below_the_level_are_not_written(stream):
+    setup_logging("warning", json_lines=False, stream=stream)
+    log = get_logger("test")
+    log.info("Quiet")
+    log.warning("Loud", code=7)
+    shutdown_logging()
+    assert stream.getvalue().count("\n") == 1
+    assert "Loud  code=7" in stream.getvalue()
@@ -0,0 +1,109 @@
+"""
+Tests: JSON-RPC error paths and malformed input of the calculator server
+Author: Team Five
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from calculator_server import (
+    DIVISION_BY_ZERO_CODE, INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST,
+    METHOD_NOT_FOUND, PARSE_ERROR, CalculatorServer, CalculatorService,
+)
+
+
+def request(request_id=1, method="add", params=(6, 3), **extra):
+    message = {"jsonrpc": "2.0", "method": method, "params": list(params), **extra}
+    if request_id is not None:
+        message["id"] = request_id
+    return message
+
+
+def answer(service, message):
+    """Sends one line; returns the decoded response (None if there is none)."""
+    line = message if isinstance(message, bytes) else json.dumps(message).encode()
+    response = service.handle_line(line)
+    return None if response is None else json.loads(response)
+
+
+def error_of(response):
+    return response["id"], response["error"]["code"]
+
+
+@pytest.fixture
+def service():
+    return CalculatorService("float")
+
+
+def test_a_request_is_answered(service):
+    response = answer(service, request(7, "divide", (6, 3)))
+    assert response == {"jsonrpc": "2.0", "id": 7,
+                        "result": {"value": 2.0, "text": "Result: 2"}}
+
+
+@pytest.mark.parametrize("line", [b"{", b"\xff\xfe", b"[" * 5000, b"{\"a\":" * 5000],
+                         ids=["truncated", "not utf-8", "nested arrays", "nested objects"])
+def test_malformed_lines_are_parse_errors(service, line):
+    assert error_of(answer(service, line)) == (None, PARSE_ERROR)
+
+
+@pytest.mark.parametrize("message, expected", [
+    ({"jsonrpc": "1.0", "id": 7, "method": "add", "params": [1, 2]}, (7, INVALID_REQUEST)),
+    ({"jsonrpc": "2.0", "id": "x", "method": 5}, ("x", INVALID_REQUEST)),
+    (request({"a": 1}), (None, INVALID_REQUEST)),
+    (request([1]), (None, INVALID_REQUEST)),
+    (request(True), (None, INVALID_REQUEST)),
+    (request(3, "power"), (3, METHOD_NOT_FOUND)),
+    (request(4, params=(1,)), (4, INVALID_PARAMS)),
+    (request(5, params=("abc", 1)), (5, INVALID_PARAMS)),
+    (request(6, params=(True, 1)), (6, INVALID_PARAMS)),
+    (request(8, "divide", (1, 0)), (8, DIVISION_BY_ZERO_CODE)),
+])
+def test_error_responses_carry_the_request_id(service, message, expected):
+    assert error_of(answer(service, message)) == expected
+
+
+def test_notifications_get_no_response(service):
+    assert answer(service, request(None)) is None
+    assert answer(service, request(None, "power")) is None
+    assert answer(service, [request(None), request(None)]) is None
+
+
+def test_batches_answer_each_request(service):
+    responses = answer(service, [request(1), 3, request(None), request(2, "divide", (1, 0))])
+    assert [response["id"] for response in responses] == [1, None, 2]
+    assert "result" in responses[0]
+    assert error_of(responses[1]) == (None, INVALID_REQUEST)
+    assert error_of(responses[2]) == (2, DIVISION_BY_ZERO_CODE)
+    assert error_of(answer(service, [])) == (None, INVALID_REQUEST)
+
+
+def test_a_failing_operation_costs_one_request(service):
+    service.operations["add"] = lambda num1, num2: [][1]
+    responses = answer(service, [request(1), request(None), request(2, "divide")])
+    assert error_of(responses[0]) == (1, INTERNAL_ERROR)
+    assert responses[1]["result"]["value"] == 2.0
+    assert len(responses) == 2
+
+
+def test_a_bad_line_keeps_its_neighbours_responses():
+    async def exchange(payload):
+        server = CalculatorServer()
+        host, port = (await server.start(port=0)).rsplit(":", 1)
+        try:
+            reader, writer = await asyncio.open_connection(host, int(port))
+            writer.write(payload)
+            writer.write_eof()
+            data = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return [json.loads(line) for line in data.splitlines()]
+        finally:
+            await server.close()
+
+    lines = [json.dumps(request(1)).encode(), b"[" * 5000,
+             json.dumps(request(2)).encode()]
+    responses = asyncio.run(exchange(b"\n".join(lines) + b"\n"))
+    assert [response["id"] for response in responses] == [1, None, 2]
+    assert error_of(responses[1]) == (None, PARSE_ERROR)